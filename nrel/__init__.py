@@ -8,12 +8,17 @@ This package provides weather data fetching capabilities for PV simulations usin
 Main components:
 - WeatherDataConnector: Main interface for weather data retrieval
 - data_utils: Utilities for processing Ampere facility data
+- SharedWeatherStore: Weather data shared with worker processes
 - config: Configuration and environment management
 """
 
 from .weather_connector import WeatherDataConnector
-from .data_utils import load_ampere_facilities, process_facility
+from .data_utils import (load_ampere_facilities, iter_ampere_facilities,
+                         load_ampere_facilities_slice, peek_facility_count,
+                         process_facility, process_facilities)
+from .shared_store import SharedWeatherStore
 from .config import load_config
 
 __version__ = "0.1.0"
-__all__ = ["WeatherDataConnector", "load_ampere_facilities", "process_facility", "load_config"]
\ No newline at end of file
+__all__ = ["WeatherDataConnector", "load_ampere_facilities", "iter_ampere_facilities",
+           "load_ampere_facilities_slice", "peek_facility_count", "process_facility", "process_facilities", "SharedWeatherStore", "load_config"]
\ No newline at end of file
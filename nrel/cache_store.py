@@ -0,0 +1,387 @@
+"""
+SQLite-backed weather data cache.
+
+Stores weather DataFrames as Feather blobs in a single SQLite database so
+that concurrent worker processes can share cached data without re-parsing
+individual cache files. Also provides the index used to look up, count and
+expire per-file cache entries without scanning the cache directory.
+"""
+
+import io
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+import pyarrow.feather as feather
+
+from .config import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS weather_cache (
+    source TEXT NOT NULL,
+    lat_key INTEGER NOT NULL,
+    lon_key INTEGER NOT NULL,
+    period TEXT NOT NULL,
+    created REAL NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (source, lat_key, lon_key, period)
+)
+"""
+
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_index (
+    source TEXT NOT NULL,
+    lat_cell INTEGER NOT NULL,
+    lon_cell INTEGER NOT NULL,
+    period TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    latitude REAL NOT NULL,
+    longitude REAL NOT NULL,
+    version TEXT,
+    PRIMARY KEY (path)
+);
+CREATE INDEX IF NOT EXISTS cache_index_cell ON cache_index (period, lat_cell, lon_cell);
+CREATE TABLE IF NOT EXISTS source_versions (
+    source TEXT PRIMARY KEY,
+    version TEXT NOT NULL,
+    updated REAL NOT NULL
+);
+"""
+
+# Bumped when the cache_index table changes incompatibly; version 1 allows
+# several entries per grid cell
+_INDEX_VERSION = 1
+
+def _period(year: Optional[int]) -> str:
+    """Return the period key for a year (``'tmy'`` if None)."""
+    return str(year) if year else 'tmy'
+
+class SQLiteWeatherCache:
+    """
+    Weather data cache stored in a SQLite database.
+
+    Entries are keyed by source, cache grid cell (``config.grid_cell``) and period
+    (year or ``'tmy'``). The database runs in WAL mode so many processes can
+    read while one writes.
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Initialize the cache store.
+
+        Parameters
+        ----------
+        db_path : str or Path
+            Path of the SQLite database file
+        """
+        self.db_path = str(db_path)
+        self._connection = None
+        self._pid = None
+        # Batch fetches read and save from several threads
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return a connection owned by the current process."""
+        # SQLite connections must not be shared across fork(), so worker
+        # processes open their own
+        if self._connection is None or self._pid != os.getpid():
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_SCHEMA)
+            connection.commit()
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def get(self, source: str, lat_key: int, lon_key: int, year: Optional[int] = None,
+            max_age_days: Optional[float] = None) -> Optional[pd.DataFrame]:
+        """
+        Load a cached DataFrame.
+
+        Parameters
+        ----------
+        source : str
+            Data source name
+        lat_key, lon_key : int
+            Grid cell indices (``config.grid_cell``)
+        year : int, optional
+            Specific year (TMY if None)
+        max_age_days : float, optional
+            Entries older than this are deleted and treated as missing
+
+        Returns
+        -------
+        pd.DataFrame or None
+            Cached weather data if present and not expired
+        """
+        key = (source, lat_key, lon_key, _period(year))
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT created, data FROM weather_cache "
+                "WHERE source = ? AND lat_key = ? AND lon_key = ? AND period = ?",
+                key
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            created, data = row
+            if max_age_days is not None and time.time() - created > max_age_days * 86400:
+                logger.debug(f"SQLite cache entry expired for {key}")
+                connection.execute(
+                    "DELETE FROM weather_cache "
+                    "WHERE source = ? AND lat_key = ? AND lon_key = ? AND period = ?",
+                    key
+                )
+                connection.commit()
+                return None
+
+        return feather.read_feather(io.BytesIO(data))
+
+    def put(self, data: pd.DataFrame, source: str, lat_key: int, lon_key: int,
+            year: Optional[int] = None) -> None:
+        """
+        Store a DataFrame, replacing any existing entry for the same key.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Weather data to cache
+        source : str
+            Data source name
+        lat_key, lon_key : int
+            Grid cell indices (``config.grid_cell``)
+        year : int, optional
+            Specific year (TMY if None)
+        """
+        buffer = io.BytesIO()
+        feather.write_feather(data, buffer)
+
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO weather_cache "
+                "(source, lat_key, lon_key, period, created, data) VALUES (?, ?, ?, ?, ?, ?)",
+                (source, lat_key, lon_key, _period(year), time.time(), buffer.getvalue())
+            )
+            connection.commit()
+
+    def clear(self, older_than_days: Optional[float] = None) -> int:
+        """
+        Remove cached entries.
+
+        Parameters
+        ----------
+        older_than_days : float, optional
+            Only remove entries older than this many days.
+            If None, remove all entries.
+
+        Returns
+        -------
+        int
+            Number of entries removed
+        """
+        if not os.path.exists(self.db_path):
+            return 0
+
+        with self._lock:
+            connection = self._connect()
+            if older_than_days is None:
+                cursor = connection.execute("DELETE FROM weather_cache")
+            else:
+                cutoff = time.time() - older_than_days * 86400
+                cursor = connection.execute("DELETE FROM weather_cache WHERE created < ?", (cutoff,))
+            connection.commit()
+            return cursor.rowcount
+
+    def count_by_source(self) -> dict:
+        """Return the number of cached entries per source."""
+        if not os.path.exists(self.db_path):
+            return {}
+
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT source, COUNT(*) FROM weather_cache GROUP BY source"
+            ).fetchall()
+        return dict(rows)
+
+
+class CacheFileIndex:
+    """
+    SQLite index of the weather cache files in a directory.
+
+    Each row records a cache file's grid cell, period, size, modification
+    time, the exact location it was fetched for and the upstream data
+    version, so lookups, expiry and cache statistics are single queries
+    instead of directory scans. The latest data version seen from each
+    source is kept alongside, to invalidate entries from older releases.
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Initialize the index.
+
+        Parameters
+        ----------
+        db_path : str or Path
+            Path of the SQLite index database
+        """
+        self.db_path = str(db_path)
+        self._connection = None
+        self._pid = None
+        # Batch fetches save from several threads
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return a connection owned by the current process."""
+        if self._connection is None or self._pid != os.getpid():
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None,
+                                         check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._migrate(connection)
+            connection.executescript(_INDEX_SCHEMA)
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    @staticmethod
+    def _migrate(connection: sqlite3.Connection) -> None:
+        """Drop an index table written in an older layout."""
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            if connection.execute("PRAGMA user_version").fetchone()[0] < _INDEX_VERSION:
+                # Files indexed under the old layout become unindexed and
+                # are removed by clear_cache
+                connection.execute("DROP TABLE IF EXISTS cache_index")
+                connection.execute(f"PRAGMA user_version = {_INDEX_VERSION}")
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+    def put(self, path: str, source: str, lat_cell: int, lon_cell: int,
+            year: Optional[int], latitude: float, longitude: float,
+            version: Optional[str] = None) -> None:
+        """
+        Record a cache file, replacing any entry for the same path.
+
+        Parameters
+        ----------
+        path : str
+            Path of the cache file, which must exist
+        source : str
+            Data source name
+        lat_cell, lon_cell : int
+            Grid cell indices
+        year : int, optional
+            Specific year (TMY if None)
+        latitude, longitude : float
+            Location the data was fetched for
+        version : str, optional
+            Upstream data version, if the source reports one
+        """
+        stat = os.stat(path)
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO cache_index "
+                "(source, lat_cell, lon_cell, period, path, size, mtime, latitude, longitude, version) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (source, lat_cell, lon_cell, _period(year), path, stat.st_size,
+                 stat.st_mtime, latitude, longitude, version)
+            )
+
+    def find(self, year: Optional[int], lat_cells: range,
+             lon_cells: range) -> List[Tuple[str, str, float, float, float, Optional[str]]]:
+        """
+        List the entries for a period within a block of grid cells.
+
+        Parameters
+        ----------
+        year : int, optional
+            Specific year (TMY if None)
+        lat_cells, lon_cells : range
+            Grid cell indices to search
+
+        Returns
+        -------
+        list of (source, path, mtime, latitude, longitude, version)
+        """
+        with self._lock:
+            return self._connect().execute(
+                "SELECT source, path, mtime, latitude, longitude, version FROM cache_index "
+                "WHERE period = ? AND lat_cell BETWEEN ? AND ? AND lon_cell BETWEEN ? AND ?",
+                (_period(year), lat_cells[0], lat_cells[-1], lon_cells[0], lon_cells[-1])
+            ).fetchall()
+
+    def set_version(self, source: str, version: str) -> None:
+        """Record the latest data version seen from a source."""
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO source_versions (source, version, updated) VALUES (?, ?, ?)",
+                (source, version, time.time())
+            )
+
+    def versions(self) -> Dict[str, str]:
+        """Return the latest data version seen from each source."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT source, version FROM source_versions"
+            ).fetchall()
+        return dict(rows)
+
+    def remove(self, paths: List[str]) -> None:
+        """Drop the entries for the given cache file paths."""
+        with self._lock:
+            self._connect().executemany(
+                "DELETE FROM cache_index WHERE path = ?", [(path,) for path in paths]
+            )
+
+    def paths(self, older_than_days: Optional[float] = None) -> List[str]:
+        """
+        List indexed cache file paths.
+
+        Parameters
+        ----------
+        older_than_days : float, optional
+            Only list files modified more than this many days ago
+
+        Returns
+        -------
+        list of str
+        """
+        if not os.path.exists(self.db_path):
+            return []
+
+        with self._lock:
+            connection = self._connect()
+            if older_than_days is None:
+                rows = connection.execute("SELECT path FROM cache_index").fetchall()
+            else:
+                cutoff = time.time() - older_than_days * 86400
+                rows = connection.execute(
+                    "SELECT path FROM cache_index WHERE mtime < ?", (cutoff,)
+                ).fetchall()
+        return [path for path, in rows]
+
+    def stats_by_source(self) -> Dict[str, Tuple[int, int]]:
+        """Return ``{source: (file count, total bytes)}`` for indexed files."""
+        if not os.path.exists(self.db_path):
+            return {}
+
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT source, COUNT(*), SUM(size) FROM cache_index GROUP BY source"
+            ).fetchall()
+        return {source: (count, size) for source, count, size in rows}
@@ -5,19 +5,36 @@ Handles environment variables, API configurations, and default settings.
 """
 
 import os
+import math
 import logging
+import functools
 from pathlib import Path
 from dotenv import load_dotenv
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 # Load environment variables from .env file
 load_dotenv()
 
 class Config:
-    """Configuration class for weather data connector."""
+    """Configuration class for weather data connector.
+    
+    Config is a singleton: ``Config()`` always returns the shared instance,
+    so settings changed on it (e.g. ``Config().cache_dir``) are seen by
+    every module.
+    """
+    
+    _instance = None
+    
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
     
     def __init__(self):
         """Initialize configuration with environment variables and defaults."""
+        # Only the first instantiation reads the environment
+        if getattr(self, '_initialized', False):
+            return
         
         # NREL API Configuration
         self.nrel_api_key = os.getenv('NREL_API_KEY')
@@ -38,14 +55,49 @@ class Config:
         self.optional_columns = ['surface_albedo', 'surface_pressure']
         
         # Rate limiting
+        # Transient API errors are retried with exponential backoff
+        # (retry_delay, 2 * retry_delay, ...) unless the server sends Retry-After
         self.max_retries = 3
-        self.retry_delay = 1.0  # seconds
+        self.retry_delay = 0.5  # seconds
+        self.max_retry_delay = 30.0  # seconds
         self.timeout = 30  # seconds
+        # Per-source token buckets: sustained requests/second and burst size
+        self.rate_limits = {
+            'nsrdb': (1.0, 10),
+            'pvgis': (25.0, 5)
+        }
+        
+        # HTTP connection pooling (one keep-alive session per connector)
+        self.http_pool_connections = 10
+        self.http_pool_maxsize = 20
+        # Concurrent API requests in get_weather_data_batch
+        self.max_concurrent_requests = 4
+        # Largest number of grid cells get_weather_data_bbox will fetch
+        self.max_bbox_cells = 2500
         
         # Caching
         self.cache_dir = Path(__file__).parent / "cache"
         self.cache_enabled = True
+        # Entries are invalidated when the source publishes a new data
+        # version, and always once they are older than the age limit
         self.cache_expiry_days = 30
+        self.cache_version_refresh_hours = 24
+        # 'feather' (Arrow IPC, fastest to read back) or 'parquet'
+        self.cache_format = 'feather'
+        self.feather_compression = 'lz4'
+        self.parquet_compression = 'zstd'
+        self.parquet_compression_level = 3
+        # One row group per year of hourly data
+        self.parquet_row_group_size = 8760
+        # 'files' (one cache file per entry) or 'sqlite' (shared database)
+        self.cache_backend = os.getenv('WEATHER_CACHE_BACKEND', 'files')
+        # Cache entries are indexed by grid cell (~4 km, the NSRDB PSM3 grid)
+        # and reused for requests within the tolerance of the cached location;
+        # a cell can hold entries for several locations
+        self.cache_grid_deg = 0.04
+        self.cache_tolerance_km = 4.0
+        # Decoded DataFrames kept in memory per connector (LRU)
+        self.memory_cache_entries = 32
         
         # Logging
         self.log_level = os.getenv('LOG_LEVEL', 'INFO')
@@ -59,6 +111,8 @@ class Config:
         # Create cache directory
         if self.cache_enabled:
             self.cache_dir.mkdir(exist_ok=True)
+        
+        self._initialized = True
     
     def _validate_config(self) -> None:
         """Validate that required configuration is present."""
@@ -97,22 +151,69 @@ class Config:
             'timeout': self.timeout
         }
     
+    def parquet_write_kwargs(self) -> Dict[str, Any]:
+        """Get keyword arguments for writing parquet cache files."""
+        return {
+            'compression': self.parquet_compression,
+            'compression_level': self.parquet_compression_level,
+            'use_dictionary': True,
+            'row_group_size': self.parquet_row_group_size
+        }
+    
     def is_nrel_available(self) -> bool:
         """Check if NREL API is properly configured."""
         return bool(self.nrel_api_key and self.nrel_user_email)
     
+    @property
+    def required_columns(self) -> List[str]:
+        """Weather columns every source must provide."""
+        return self._required_columns
+    
+    @required_columns.setter
+    def required_columns(self, value) -> None:
+        self._required_columns = list(value)
+        self.required_columns_set = frozenset(self._required_columns)
+    
+    @property
+    def cache_dir(self) -> Path:
+        """Directory holding cached weather data."""
+        return self._cache_dir
+    
+    @cache_dir.setter
+    def cache_dir(self, value) -> None:
+        self._cache_dir = Path(value)
+        self._cache_dir_str = os.fspath(self._cache_dir)
+    
+    @property
+    def cache_db_path(self) -> Path:
+        """SQLite database used when ``cache_backend`` is 'sqlite'."""
+        return self._cache_dir / "weather_cache.sqlite"
+    
+    @property
+    def cache_index_path(self) -> Path:
+        """SQLite index of the per-file weather cache."""
+        return self._cache_dir / "cache_index.sqlite"
+    
+    def grid_cell(self, value: float) -> int:
+        """Index of the cache grid cell containing a coordinate."""
+        return math.floor(value / self.cache_grid_deg)
+    
     def get_cache_path(self, latitude: float, longitude: float, 
                       source: str, year: Optional[int] = None) -> Path:
-        """Generate cache file path for weather data."""
-        lat_str = f"{latitude:.4f}"
-        lon_str = f"{longitude:.4f}"
-        
-        if year:
-            filename = f"{source}_{lat_str}_{lon_str}_{year}.parquet"
-        else:
-            filename = f"{source}_{lat_str}_{lon_str}_tmy.parquet"
-        
-        return self.cache_dir / filename
+        """Generate cache file path for a location rounded to 4 decimals."""
+        return _cache_path(self._cache_dir_str, _coord_key(latitude),
+                           _coord_key(longitude), source, year, self.cache_format)
+
+def _coord_key(value: float) -> int:
+    """Round a coordinate to 4 decimals as an integer key."""
+    return int(round(value * 10000))
+
+@functools.lru_cache(maxsize=4096)
+def _cache_path(cache_dir: str, lat_key: int, lon_key: int, source: str,
+                year: Optional[int], cache_format: str) -> Path:
+    """Build (and memoize) a cache file path for a rounded location."""
+    filename = f"{source}_{lat_key}_{lon_key}_{year or 'tmy'}.{cache_format}"
+    return Path(os.path.join(cache_dir, filename))
 
 # Global configuration instance
 config = Config()
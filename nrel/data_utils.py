@@ -5,35 +5,75 @@ Handles conversion from Ampere data format to pvlib-compatible format,
 with support for both dataset variations.
 """
 
+from __future__ import annotations
+
 import json
+import logging
+import os
+import pickle
 import sys
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple, Iterable, Iterator, Sized
 
-# Add pvlib-python to path if not already available
+# orjson is an optional, much faster JSON parser; fall back to stdlib json
 try:
-    import pvlib
+    import orjson
 except ImportError:
-    project_root = Path(__file__).parent.parent
-    pvlib_path = project_root / "pvlib-python"
-    if pvlib_path.exists():
-        sys.path.insert(0, str(pvlib_path))
-        import pvlib
-    else:
-        raise ImportError("pvlib not found. Install with: pip install pvlib-python")
+    orjson = None
+
+# ijson allows streaming facilities one at a time from large files
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# pvlib is heavy to import and only needed by process_facility, so it is
+# imported on first use (see _get_pvlib)
+if TYPE_CHECKING:
+    import pvlib
 
 from .config import get_logger
 
 logger = get_logger(__name__)
 
-def load_ampere_facilities(file_path: str) -> List[Dict[str, Any]]:
+_pvlib = None
+
+# Below this many facilities, process pool startup costs more than it saves
+MIN_PARALLEL_FACILITIES = 8
+
+# Required fields, checked with a single set difference against dict keys
+_REQUIRED_GROUP_FIELDS = frozenset({'name', 'azimuth', 'tilt'})
+_REQUIRED_SYSTEM_FIELDS = frozenset({'latitude', 'longitude', 'panel_groups'})
+_REQUIRED_FACILITY_FIELDS = frozenset({'id', 'name', 'latitude', 'longitude'})
+
+# Alternative names for panel group fields across the two datasets:
+# pvlib_ready.json uses tilt/power_kw, with_panel_data.json elevation/nominalPower
+_GROUP_FIELD_ALTERNATIVES = {
+    'tilt': 'elevation',
+    'elevation': 'tilt',
+    'power_kw': 'nominalPower',
+    'nominalPower': 'power_kw'
+}
+
+def load_ampere_facilities(file_path: str, use_cache: bool = True) -> List[Dict[str, Any]]:
     """
     Load Ampere facility data from JSON file.
     
+    The parsed facilities are cached in a pickle file next to the JSON file
+    (``<name>.json.pkl``); later calls read the cache instead of re-parsing
+    the JSON as long as the JSON file's modification time and size match the
+    ones recorded in the cache.
+    
     Parameters
     ----------
     file_path : str
         Path to the JSON file containing facility data
+    use_cache : bool, default True
+        Whether to read and write the parsed-facility cache
         
     Returns
     -------
@@ -52,9 +92,20 @@ def load_ampere_facilities(file_path: str) -> List[Dict[str, Any]]:
     if not file_path.exists():
         raise FileNotFoundError(f"Facility data file not found: {file_path}")
     
+    cache_path = file_path.with_name(file_path.name + '.pkl')
+    stat = file_path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    if use_cache:
+        facilities = _load_facility_cache(cache_path, stamp)
+        if facilities is not None:
+            logger.info("Loaded %d facilities from cache %s", len(facilities), cache_path.name)
+            return facilities
+    
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Read raw bytes: orjson parses bytes directly, skipping the decode step
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         
         # Handle different file formats
         if 'facilities' in data:
@@ -64,14 +115,192 @@ def load_ampere_facilities(file_path: str) -> List[Dict[str, Any]]:
         else:
             raise ValueError("Invalid file format: expected 'facilities' key or list of facilities")
         
-        logger.info(f"Loaded {len(facilities)} facilities from {file_path.name}")
+        logger.info("Loaded %d facilities from %s", len(facilities), file_path.name)
+        
+        if use_cache:
+            _save_facility_cache(facilities, cache_path, stamp)
+        
         return facilities
         
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
         raise ValueError(f"Invalid JSON format in {file_path}: {e}")
     except Exception as e:
         raise ValueError(f"Error loading facility data: {e}")
 
+def _load_facility_cache(cache_path: Path, stamp: Tuple[int, int]) -> Optional[List[Dict[str, Any]]]:
+    """Return cached facilities if the JSON file still has the cached (mtime_ns, size) stamp."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_stamp, facilities = pickle.load(f)
+        
+        if cached_stamp != stamp:
+            logger.debug("Facility cache %s is stale", cache_path.name)
+            return None
+        return facilities
+        
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Failed to load facility cache from %s: %s", cache_path, e)
+        return None
+
+def _save_facility_cache(facilities: List[Dict[str, Any]], cache_path: Path,
+                         stamp: Tuple[int, int]) -> None:
+    """Atomically write parsed facilities and the JSON stamp to the pickle cache, ignoring failures."""
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            pickle.dump((stamp, facilities), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+        logger.debug("Saved facility cache: %s", cache_path.name)
+    except Exception as e:
+        logger.warning("Failed to save facility cache to %s: %s", cache_path, e)
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+def iter_ampere_facilities(file_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over Ampere facility data without loading the whole file.
+    
+    Facilities are parsed incrementally with ijson, so peak memory is bounded
+    by the size of a single facility rather than the whole file. If ijson is
+    not installed, this falls back to :func:`load_ampere_facilities`.
+    
+    Parameters
+    ----------
+    file_path : str
+        Path to the JSON file containing facility data
+        
+    Returns
+    -------
+    Iterator[Dict[str, Any]]
+        Iterator over facility dictionaries
+        
+    Raises
+    ------
+    FileNotFoundError
+        If the specified file doesn't exist
+    ValueError
+        If the file format is invalid (raised during iteration)
+    """
+    file_path = Path(file_path)
+    
+    if not file_path.exists():
+        raise FileNotFoundError(f"Facility data file not found: {file_path}")
+    
+    if ijson is None:
+        return iter(load_ampere_facilities(str(file_path)))
+    
+    return _stream_facilities(file_path)
+
+def _stream_facilities(file_path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield facilities from a JSON file using ijson."""
+    try:
+        with open(file_path, 'rb') as f:
+            prefix = _facility_prefix(f)
+            empty = True
+            for facility in ijson.items(f, prefix, use_float=True):
+                empty = False
+                yield facility
+            
+            if empty:
+                _check_facilities_key(f, prefix)
+            
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid JSON format in {file_path}: {e}")
+
+def _facility_prefix(f) -> str:
+    """Return the ijson prefix of facility items in an open binary file."""
+    # Detect the top-level layout from the first significant byte
+    first = f.read(64).lstrip()[:1]
+    f.seek(0)
+    
+    if first == b'[':
+        return 'item'
+    if first == b'{':
+        return 'facilities.item'
+    raise ValueError("Invalid file format: expected 'facilities' key or list of facilities")
+
+def _check_facilities_key(f, prefix: str) -> None:
+    """Raise ValueError if a top-level object has no 'facilities' key."""
+    # Only needed when no facilities were found, so the usual case skips
+    # this second pass over the file
+    if prefix != 'facilities.item':
+        return
+    f.seek(0)
+    if not any(p == '' and event == 'map_key' and value == 'facilities'
+               for p, event, value in ijson.parse(f)):
+        raise ValueError("Invalid file format: expected 'facilities' key or list of facilities")
+
+def peek_facility_count(file_path: str) -> int:
+    """
+    Count the facilities in an Ampere data file without building them.
+    
+    Only the ijson event stream is scanned, so no facility dictionaries are
+    materialized. If ijson is not installed, the file is loaded in full.
+    
+    Parameters
+    ----------
+    file_path : str
+        Path to the JSON file containing facility data
+        
+    Returns
+    -------
+    int
+        Number of facilities in the file
+        
+    Raises
+    ------
+    FileNotFoundError
+        If the specified file doesn't exist
+    ValueError
+        If the file format is invalid
+    """
+    file_path = Path(file_path)
+    
+    if not file_path.exists():
+        raise FileNotFoundError(f"Facility data file not found: {file_path}")
+    
+    if ijson is None:
+        return len(load_ampere_facilities(str(file_path)))
+    
+    try:
+        with open(file_path, 'rb') as f:
+            prefix = _facility_prefix(f)
+            count = sum(1 for p, event, _ in ijson.parse(f)
+                        if event == 'start_map' and p == prefix)
+            if count == 0:
+                _check_facilities_key(f, prefix)
+            return count
+    except ijson.JSONError as e:
+        raise ValueError(f"Invalid JSON format in {file_path}: {e}")
+
+def load_ampere_facilities_slice(file_path: str, start: int,
+                                 stop: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Load facilities ``start:stop`` from an Ampere data file.
+    
+    Parsing stops once ``stop`` facilities have been read, so paging through
+    the front of a large file doesn't parse the remainder.
+    
+    Parameters
+    ----------
+    file_path : str
+        Path to the JSON file containing facility data
+    start : int
+        Index of the first facility to return
+    stop : int, optional
+        Index one past the last facility to return (default: end of file)
+        
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Facility dictionaries in the requested range
+    """
+    return list(islice(iter_ampere_facilities(file_path), start, stop))
+
 def normalize_facility_data(facility: Dict[str, Any]) -> Dict[str, Any]:
     """
     Normalize facility data to a consistent format.
@@ -80,6 +309,10 @@ def normalize_facility_data(facility: Dict[str, Any]) -> Dict[str, Any]:
     - pvlib_ready.json uses "tilt" 
     - with_panel_data.json uses "elevation"
     
+    The input is never modified. Dictionaries are only copied when a field
+    has to be added, so already-normalized facilities and panel groups are
+    returned as-is.
+    
     Parameters
     ----------
     facility : Dict[str, Any]
@@ -90,72 +323,200 @@ def normalize_facility_data(facility: Dict[str, Any]) -> Dict[str, Any]:
     Dict[str, Any]
         Normalized facility data
     """
-    normalized = facility.copy()
-    
     # Normalize panel groups
     if 'panel_groups' in facility:
         panel_groups = facility['panel_groups']
+        groups_changed = False
     elif 'panelGroups' in facility:
         panel_groups = facility['panelGroups']
+        groups_changed = True
     else:
         raise ValueError(f"No panel groups found in facility {facility.get('id', 'unknown')}")
     
     # Normalize each panel group
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     normalized_groups = []
     for group in panel_groups:
-        normalized_group = group.copy()
+        group_updates = {}
         
         # Handle tilt vs elevation naming
         if 'elevation' in group and 'tilt' not in group:
-            normalized_group['tilt'] = group['elevation']
-            logger.debug(f"Converted 'elevation' to 'tilt' for group {group.get('name', 'unnamed')}")
+            group_updates['tilt'] = group['elevation']
+            if debug_enabled:
+                logger.debug("Converted 'elevation' to 'tilt' for group %s", group.get('name', 'unnamed'))
         
         # Ensure required fields exist
-        required_fields = ['name', 'azimuth', 'tilt']
-        missing_fields = [field for field in required_fields if field not in normalized_group]
+        missing_fields = _REQUIRED_GROUP_FIELDS - group.keys() - group_updates.keys()
         if missing_fields:
-            logger.warning(f"Missing fields in panel group: {missing_fields}")
+            logger.warning("Missing fields in panel group: %s", sorted(missing_fields))
         
         # Handle power field variations
-        if 'power_kw' in group:
-            normalized_group['power_kw'] = group['power_kw']
-        elif 'nominalPower' in group:
-            normalized_group['power_kw'] = group['nominalPower']
-        else:
-            logger.warning(f"No power rating found for panel group {group.get('name', 'unnamed')}")
+        if 'power_kw' not in group:
+            if 'nominalPower' in group:
+                group_updates['power_kw'] = group['nominalPower']
+            else:
+                logger.warning("No power rating found for panel group %s", group.get('name', 'unnamed'))
         
-        normalized_groups.append(normalized_group)
+        if group_updates:
+            group = {**group, **group_updates}
+            groups_changed = True
+        
+        normalized_groups.append(group)
     
-    normalized['panel_groups'] = normalized_groups
+    updates = {}
+    if groups_changed:
+        updates['panel_groups'] = normalized_groups
     
     # Normalize facility-level power
-    if 'facility_power_kw' not in normalized and 'nominalPower' in facility:
-        normalized['facility_power_kw'] = facility['nominalPower']
+    if 'facility_power_kw' not in facility and 'nominalPower' in facility:
+        updates['facility_power_kw'] = facility['nominalPower']
     
     # Normalize coordinates
-    if 'coordinates' in facility:
-        coords = facility['coordinates']
-        if 'lat' in coords and 'latitude' not in normalized:
-            normalized['latitude'] = coords['lat']
-        if 'long' in coords and 'longitude' not in normalized:
-            normalized['longitude'] = coords['long']
+    if 'latitude' not in facility or 'longitude' not in facility:
+        latitude, longitude = get_facility_coordinates(facility)
+        if latitude is not None and 'latitude' not in facility:
+            updates['latitude'] = latitude
+        if longitude is not None and 'longitude' not in facility:
+            updates['longitude'] = longitude
     
     # Extract timezone from address if needed
-    if 'timezone' not in normalized and 'address' in facility:
+    if 'timezone' not in facility and 'address' in facility:
         address = facility['address']
         if 'timezone' in address:
-            normalized['timezone'] = address['timezone']
+            timezone = address['timezone']
+            # Facilities share a handful of timezones; intern them so
+            # duplicates collapse to one object and compare by identity
+            if isinstance(timezone, str):
+                timezone = sys.intern(timezone)
+            updates['timezone'] = timezone
+    
+    if not updates:
+        return facility
+    
+    return {**facility, **updates}
+
+def get_facility_coordinates(facility: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Get a facility's coordinates as :func:`normalize_facility_data` resolves them.
+    
+    Parameters
+    ----------
+    facility : Dict[str, Any]
+        Raw or normalized facility data dictionary
+        
+    Returns
+    -------
+    Tuple[Optional[float], Optional[float]]
+        ``(latitude, longitude)``, with None for a missing coordinate
+    """
+    coords = facility.get('coordinates') or {}
+    return facility.get('latitude', coords.get('lat')), facility.get('longitude', coords.get('long'))
+
+def _detect_group_fields(panel_groups: List[Dict[str, Any]]) -> Tuple[str, str]:
+    """
+    Detect the tilt and power field names used by a facility's panel groups.
+    
+    The naming convention is fixed per dataset, so it is detected once from
+    the first group instead of probing both names for every group.
+    """
+    first = panel_groups[0] if panel_groups else {}
+    tilt_key = 'elevation' if 'elevation' in first and 'tilt' not in first else 'tilt'
+    power_key = 'nominalPower' if 'nominalPower' in first and 'power_kw' not in first else 'power_kw'
+    return tilt_key, power_key
+
+def _group_field(group: Dict[str, Any], key: str) -> Any:
+    """Look up a panel group field, falling back to its alternative name."""
+    value = group.get(key)
+    if value is None:
+        value = group.get(_GROUP_FIELD_ALTERNATIVES[key])
+    return value
+
+def _aggregate_panel_groups(panel_groups: List[Dict[str, Any]]) -> Tuple[float, float, float]:
+    """
+    Compute total DC power and power-weighted tilt/azimuth of panel groups.
+    
+    Parameters
+    ----------
+    panel_groups : List[Dict[str, Any]]
+        Normalized panel group dictionaries (tilt and power_kw naming)
+        
+    Returns
+    -------
+    Tuple[float, float, float]
+        Total DC power in W, weighted tilt and weighted azimuth in degrees
+    """
+    n_groups = len(panel_groups)
+    
+    # Single group: plain scalars are cheaper than setting up arrays
+    if n_groups == 1:
+        group = panel_groups[0]
+        power_w = group.get('power_kw', 0) * 1000
+        tilt = group.get('tilt', 0)
+        azimuth = group.get('azimuth', 180)  # Default south-facing
+        if power_w > 0:
+            return power_w, tilt, azimuth
+        return power_w, 0, 0
+    
+    powers = np.fromiter((g.get('power_kw', 0) for g in panel_groups),
+                         dtype=np.float64, count=n_groups) * 1000.0
+    tilts = np.fromiter((g.get('tilt', 0) for g in panel_groups),
+                        dtype=np.float64, count=n_groups)
+    azimuths = np.fromiter((g.get('azimuth', 180) for g in panel_groups),  # Default south-facing
+                           dtype=np.float64, count=n_groups)
     
-    return normalized
+    total_dc_power_w = float(powers.sum())
+    
+    # Avoid division by zero
+    if total_dc_power_w > 0:
+        return (total_dc_power_w,
+                float(powers @ tilts) / total_dc_power_w,
+                float(powers @ azimuths) / total_dc_power_w)
+    
+    return total_dc_power_w, 0, 0
+
+def _get_pvlib():
+    """Import pvlib on first use, adding pvlib-python to the path if needed."""
+    global _pvlib
+    
+    if _pvlib is None:
+        try:
+            import pvlib
+        except ImportError:
+            project_root = Path(__file__).parent.parent
+            pvlib_path = project_root / "pvlib-python"
+            if pvlib_path.exists():
+                sys.path.insert(0, str(pvlib_path))
+                import pvlib
+            else:
+                raise ImportError("pvlib not found. Install with: pip install pvlib-python")
+        _pvlib = pvlib
+    
+    return _pvlib
 
-def process_facility(facility: Dict[str, Any]) -> Tuple[pvlib.pvsystem.PVSystem, pvlib.location.Location]:
+def _temperature_coefficient_fraction(temp_coeff):
+    """
+    Convert temperature coefficients given in %/°C to fraction/°C.
+    
+    Values with a magnitude above 0.01 are assumed to be in %/°C. Accepts a
+    scalar or an array of coefficients; arrays are scaled with a single
+    vectorized select instead of a per-facility branch.
+    """
+    if isinstance(temp_coeff, np.ndarray):
+        return temp_coeff * np.where(np.abs(temp_coeff) > 0.01, 0.01, 1.0)
+    return temp_coeff * (0.01 if abs(temp_coeff) > 0.01 else 1.0)
+
+def process_facility(facility: Dict[str, Any],
+                     normalize: bool = True) -> Tuple[pvlib.pvsystem.PVSystem, pvlib.location.Location]:
     """
     Convert Ampere facility data to pvlib PVSystem and Location objects.
     
     Parameters
     ----------
     facility : Dict[str, Any]
-        Facility data dictionary (will be normalized automatically)
+        Facility data dictionary
+    normalize : bool, default True
+        Whether to normalize the facility first. Pass False for facilities
+        already returned by :func:`normalize_facility_data`.
         
     Returns
     -------
@@ -167,14 +528,16 @@ def process_facility(facility: Dict[str, Any]) -> Tuple[pvlib.pvsystem.PVSystem,
     ValueError
         If required facility data is missing
     """
+    pvlib = _get_pvlib()
+    
     # Normalize facility data first
-    facility = normalize_facility_data(facility)
+    if normalize:
+        facility = normalize_facility_data(facility)
     
     # Validate required fields
-    required_fields = ['latitude', 'longitude', 'panel_groups']
-    missing_fields = [field for field in required_fields if field not in facility]
+    missing_fields = _REQUIRED_SYSTEM_FIELDS - facility.keys()
     if missing_fields:
-        raise ValueError(f"Missing required fields in facility data: {missing_fields}")
+        raise ValueError(f"Missing required fields in facility data: {sorted(missing_fields)}")
     
     # Create location object
     location_kwargs = {
@@ -199,31 +562,13 @@ def process_facility(facility: Dict[str, Any]) -> Tuple[pvlib.pvsystem.PVSystem,
     # rather than using arrays, which can cause issues with temperature models
     
     # Calculate total DC power and weighted average tilt/azimuth if multiple panel groups
-    total_dc_power_w = 0
-    weighted_tilt = 0
-    weighted_azimuth = 0
-    
-    for group in facility['panel_groups']:
-        power_kw = group.get('power_kw', 0)
-        power_w = power_kw * 1000
-        tilt = group.get('tilt', group.get('elevation', 0))
-        azimuth = group.get('azimuth', 180)  # Default south-facing
-        
-        total_dc_power_w += power_w
-        weighted_tilt += tilt * power_w
-        weighted_azimuth += azimuth * power_w
-    
-    # Avoid division by zero
-    if total_dc_power_w > 0:
-        weighted_tilt = weighted_tilt / total_dc_power_w
-        weighted_azimuth = weighted_azimuth / total_dc_power_w
+    total_dc_power_w, weighted_tilt, weighted_azimuth = _aggregate_panel_groups(facility['panel_groups'])
     
     # Get temperature coefficient if available
     temp_coeff = facility.get('temperatureCoefficient', -0.004)  # Default for c-Si
     
     # Convert from %/°C to fraction/°C if needed
-    if abs(temp_coeff) > 0.01:  # Likely in %/°C
-        temp_coeff = temp_coeff / 100
+    temp_coeff = _temperature_coefficient_fraction(temp_coeff)
     
     # For PVWatts with minimal data, create simplified module parameters
     module_parameters = {
@@ -265,10 +610,47 @@ def process_facility(facility: Dict[str, Any]) -> Tuple[pvlib.pvsystem.PVSystem,
     )
     
     facility_power_kw = total_dc_power_w / 1000
-    logger.info(f"Created PVSystem for {facility.get('name', 'Unknown')}: PVWatts-compatible, {facility_power_kw:.1f} kW total")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Created PVSystem for %s: PVWatts-compatible, %.1f kW total",
+                    facility.get('name', 'Unknown'), facility_power_kw)
     
     return system, location
 
+def process_facilities(facilities: List[Dict[str, Any]],
+                       workers: Optional[int] = None,
+                       normalize: bool = True) -> List[Tuple[pvlib.pvsystem.PVSystem, pvlib.location.Location]]:
+    """
+    Convert many Ampere facilities to pvlib objects using a process pool.
+    
+    Parameters
+    ----------
+    facilities : List[Dict[str, Any]]
+        Facility data dictionaries
+    workers : int, optional
+        Number of worker processes. Defaults to the number of CPUs.
+        Use 1 to process facilities serially.
+    normalize : bool, default True
+        Whether to normalize each facility first (see :func:`process_facility`)
+        
+    Returns
+    -------
+    List[Tuple[pvlib.pvsystem.PVSystem, pvlib.location.Location]]
+        System and location objects, in the same order as ``facilities``
+        
+    Raises
+    ------
+    ValueError
+        If required data is missing for any facility
+    """
+    process = partial(process_facility, normalize=normalize)
+    
+    if workers == 1 or len(facilities) < MIN_PARALLEL_FACILITIES:
+        return [process(facility) for facility in facilities]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Chunking amortizes pickling/IPC overhead across facilities
+        return list(executor.map(process, facilities, chunksize=32))
+
 def validate_facility_data(facility: Dict[str, Any]) -> List[str]:
     """
     Validate facility data and return list of issues found.
@@ -283,13 +665,18 @@ def validate_facility_data(facility: Dict[str, Any]) -> List[str]:
     List[str]
         List of validation issues (empty if no issues)
     """
+    panel_groups = facility.get('panel_groups', facility.get('panelGroups', []))
+    
+    # Most facilities are valid: confirm that with cheap checks first and
+    # only build issue messages when something is wrong
+    if _facility_is_valid(facility, panel_groups):
+        return []
+    
     issues = []
     
     # Check required fields
-    required_fields = ['id', 'name', 'latitude', 'longitude']
-    for field in required_fields:
-        if field not in facility:
-            issues.append(f"Missing required field: {field}")
+    for field in sorted(_REQUIRED_FACILITY_FIELDS - facility.keys()):
+        issues.append(f"Missing required field: {field}")
     
     # Validate coordinates
     if 'latitude' in facility:
@@ -303,17 +690,41 @@ def validate_facility_data(facility: Dict[str, Any]) -> List[str]:
             issues.append(f"Invalid longitude: {lon}")
     
     # Check panel groups
-    panel_groups = facility.get('panel_groups', facility.get('panelGroups', []))
     if not panel_groups:
         issues.append("No panel groups found")
     else:
+        fields = _detect_group_fields(panel_groups)
         for i, group in enumerate(panel_groups):
-            group_issues = validate_panel_group(group, i)
+            group_issues = validate_panel_group(group, i, fields)
             issues.extend(group_issues)
     
     return issues
 
-def validate_panel_group(group: Dict[str, Any], index: int) -> List[str]:
+def _facility_is_valid(facility: Dict[str, Any], panel_groups: List[Dict[str, Any]]) -> bool:
+    """Return True if validate_facility_data would report no issues."""
+    if not panel_groups or not _REQUIRED_FACILITY_FIELDS <= facility.keys():
+        return False
+    
+    lat = facility['latitude']
+    lon = facility['longitude']
+    if not (isinstance(lat, (int, float)) and -90 <= lat <= 90
+            and isinstance(lon, (int, float)) and -180 <= lon <= 180):
+        return False
+    
+    tilt_key, power_key = _detect_group_fields(panel_groups)
+    for group in panel_groups:
+        tilt = _group_field(group, tilt_key)
+        azimuth = group.get('azimuth')
+        power = _group_field(group, power_key)
+        if not (isinstance(tilt, (int, float)) and 0 <= tilt <= 90
+                and isinstance(azimuth, (int, float)) and -180 <= azimuth <= 180
+                and isinstance(power, (int, float)) and power > 0):
+            return False
+    
+    return True
+
+def validate_panel_group(group: Dict[str, Any], index: int,
+                         fields: Optional[Tuple[str, str]] = None) -> List[str]:
     """
     Validate a single panel group.
     
@@ -323,6 +734,9 @@ def validate_panel_group(group: Dict[str, Any], index: int) -> List[str]:
         Panel group data dictionary
     index : int
         Group index for error reporting
+    fields : Tuple[str, str], optional
+        Tilt and power field names used by the dataset. Detected from
+        ``group`` if not given.
         
     Returns
     -------
@@ -331,9 +745,10 @@ def validate_panel_group(group: Dict[str, Any], index: int) -> List[str]:
     """
     issues = []
     prefix = f"Panel group {index}"
+    tilt_key, power_key = fields or _detect_group_fields([group])
     
     # Check for tilt/elevation
-    tilt = group.get('tilt', group.get('elevation'))
+    tilt = _group_field(group, tilt_key)
     if tilt is None:
         issues.append(f"{prefix}: Missing tilt/elevation angle")
     elif not isinstance(tilt, (int, float)) or not 0 <= tilt <= 90:
@@ -347,7 +762,7 @@ def validate_panel_group(group: Dict[str, Any], index: int) -> List[str]:
         issues.append(f"{prefix}: Invalid azimuth angle: {azimuth}")
     
     # Check power rating
-    power = group.get('power_kw', group.get('nominalPower'))
+    power = _group_field(group, power_key)
     if power is None:
         issues.append(f"{prefix}: Missing power rating")
     elif not isinstance(power, (int, float)) or power <= 0:
@@ -355,64 +770,86 @@ def validate_panel_group(group: Dict[str, Any], index: int) -> List[str]:
     
     return issues
 
-def get_facility_summary(facilities: List[Dict[str, Any]]) -> Dict[str, Any]:
+def get_facility_summary(facilities: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Generate summary statistics for a list of facilities.
     
+    The facilities are traversed once, so an iterator such as the one
+    returned by :func:`iter_ampere_facilities` can be passed directly.
+    
     Parameters
     ----------
-    facilities : List[Dict[str, Any]]
-        List of facility dictionaries
+    facilities : Iterable[Dict[str, Any]]
+        List (or iterator) of facility dictionaries
         
     Returns
     -------
     Dict[str, Any]
         Summary statistics
     """
-    if not facilities:
-        return {'total_facilities': 0}
+    # Timezone analysis
+    timezones = set()
     
-    # Basic counts
-    total_facilities = len(facilities)
+    # Collect one row per facility in a single pass; missing values are NaN
+    rows = (_summary_row(facility, timezones) for facility in facilities)
+    count = len(facilities) if isinstance(facilities, Sized) else -1
+    table = np.fromiter(rows, dtype=_SUMMARY_DTYPE, count=count)
     
-    # Geographic analysis
-    latitudes = [f.get('latitude') for f in facilities if f.get('latitude') is not None]
-    longitudes = [f.get('longitude') for f in facilities if f.get('longitude') is not None]
+    total_facilities = len(table)
+    if not total_facilities:
+        return {'total_facilities': 0}
     
-    # Power analysis
-    powers = []
-    for facility in facilities:
-        power = facility.get('facility_power_kw', facility.get('nominalPower'))
-        if power:
-            powers.append(power)
+    unique_timezones = list(timezones)
     
-    # Timezone analysis
-    timezones = [f.get('timezone') for f in facilities if f.get('timezone')]
-    unique_timezones = list(set(timezones)) if timezones else []
-    
-    # Panel group analysis
-    total_groups = 0
-    multi_array_facilities = 0
-    for facility in facilities:
-        groups = facility.get('panel_groups', facility.get('panelGroups', []))
-        group_count = len(groups)
-        total_groups += group_count
-        if group_count > 1:
-            multi_array_facilities += 1
+    lat_arr = table['latitude']
+    lon_arr = table['longitude']
+    power_arr = table['power']
+    ngroups = table['groups']
+    
+    n_latitudes = int(np.count_nonzero(~np.isnan(lat_arr)))
+    n_longitudes = int(np.count_nonzero(~np.isnan(lon_arr)))
+    n_powers = int(np.count_nonzero(~np.isnan(power_arr)))
+    total_power_kw = float(np.nansum(power_arr)) if n_powers else 0
+    total_groups = int(ngroups.sum())
     
     summary = {
         'total_facilities': total_facilities,
-        'facilities_with_coordinates': len(latitudes),
-        'latitude_range': (min(latitudes), max(latitudes)) if latitudes else None,
-        'longitude_range': (min(longitudes), max(longitudes)) if longitudes else None,
-        'power_range_kw': (min(powers), max(powers)) if powers else None,
-        'total_power_kw': sum(powers) if powers else 0,
-        'average_power_kw': sum(powers) / len(powers) if powers else 0,
+        'facilities_with_coordinates': n_latitudes,
+        'latitude_range': (float(np.nanmin(lat_arr)), float(np.nanmax(lat_arr))) if n_latitudes else None,
+        'longitude_range': (float(np.nanmin(lon_arr)), float(np.nanmax(lon_arr))) if n_longitudes else None,
+        'power_range_kw': (float(np.nanmin(power_arr)), float(np.nanmax(power_arr))) if n_powers else None,
+        'total_power_kw': total_power_kw,
+        'average_power_kw': total_power_kw / n_powers if n_powers else 0,
         'unique_timezones': len(unique_timezones),
         'timezone_list': unique_timezones,
         'total_panel_groups': total_groups,
-        'multi_array_facilities': multi_array_facilities,
-        'average_groups_per_facility': total_groups / total_facilities if total_facilities > 0 else 0
+        'multi_array_facilities': int(np.count_nonzero(ngroups > 1)),
+        'average_groups_per_facility': total_groups / total_facilities
     }
     
-    return summary
\ No newline at end of file
+    return summary
+
+# Columns gathered per facility by get_facility_summary
+_SUMMARY_DTYPE = np.dtype([
+    ('latitude', np.float64),
+    ('longitude', np.float64),
+    ('power', np.float64),
+    ('groups', np.int64)
+])
+
+def _summary_row(facility: Dict[str, Any], timezones: set) -> Tuple[float, float, float, int]:
+    """Extract a get_facility_summary row, recording the timezone as a side effect."""
+    latitude = facility.get('latitude')
+    longitude = facility.get('longitude')
+    power = facility.get('facility_power_kw', facility.get('nominalPower'))
+    
+    timezone = facility.get('timezone')
+    if timezone:
+        timezones.add(timezone)
+    
+    groups = facility.get('panel_groups', facility.get('panelGroups', []))
+    
+    return (np.nan if latitude is None else latitude,
+            np.nan if longitude is None else longitude,
+            power if power else np.nan,
+            len(groups))
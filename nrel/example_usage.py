@@ -8,20 +8,38 @@ This script demonstrates how to:
 4. Run basic PV simulations
 """
 
+import os
 import sys
 import json
 import time
+import functools
+from collections import Counter
+from functools import partial
+from itertools import islice
+from multiprocessing import Pool
 from pathlib import Path
 from datetime import datetime
+import numpy as np
 
 # Add the project root to the path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from nrel.weather_connector import WeatherDataConnector
-from nrel.data_utils import load_ampere_facilities, process_facility, get_facility_summary
+from nrel.data_utils import (iter_ampere_facilities, get_facility_coordinates, process_facility,
+                             get_facility_summary)
 from nrel.config import get_logger
-import pvlib
+
+# orjson is an optional, much faster JSON encoder; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Numba is optional; region classification falls back to NumPy without it
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 # Setup logging
 logger = get_logger(__name__)
@@ -38,6 +56,384 @@ def get_region(facility):
     else:
         return 'SA'
 
+# Region labels indexed by the codes from classify_regions
+REGION_NAMES = ('EU', 'NA', 'SA')
+
+def _classify_regions_numpy(lats, lons, out):
+    """Write region codes for each coordinate pair using NumPy masks."""
+    north = lats > 35
+    out[:] = np.select([north & (lons > -30), north & (lons < -30)], [0, 1], default=2)
+    return out
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _classify_regions_kernel(lats, lons, out):
+        """Write region codes for each coordinate pair (compiled)."""
+        for i in prange(len(lats)):
+            if lats[i] > 35 and lons[i] > -30:
+                out[i] = 0
+            elif lats[i] > 35 and lons[i] < -30:
+                out[i] = 1
+            else:
+                out[i] = 2
+        return out
+else:
+    _classify_regions_kernel = _classify_regions_numpy
+
+def classify_regions(lats, lons, out=None):
+    """
+    Determine region codes for arrays of latitudes and longitudes.
+    
+    Vectorized equivalent of :func:`get_region`; the codes index
+    ``REGION_NAMES``. Uses a Numba kernel when numba is installed.
+    
+    Parameters
+    ----------
+    lats : np.ndarray
+        Latitudes in decimal degrees
+    lons : np.ndarray
+        Longitudes in decimal degrees
+    out : np.ndarray, optional
+        int8 array to write the codes into
+        
+    Returns
+    -------
+    np.ndarray
+        int8 region code for each coordinate pair
+    """
+    lats = np.ascontiguousarray(lats, dtype=np.float64)
+    lons = np.ascontiguousarray(lons, dtype=np.float64)
+    if out is None:
+        out = np.empty(len(lats), dtype=np.int8)
+    return _classify_regions_kernel(lats, lons, out)
+
+# Per-process weather connector, created once by _init_worker
+_weather_connector = None
+
+# Weather published to shared memory by the parent process:
+# {(latitude, longitude): (SharedWeatherHandle, source)}, set by _init_worker
+_shared_weather = {}
+
+def _create_weather_connector():
+    """Create the weather connector used for simulations."""
+    # Imported here so `--help` and argument errors don't load the data stack
+    from nrel.weather_connector import WeatherDataConnector
+    
+    return WeatherDataConnector(
+        primary_source='nsrdb',
+        fallback_sources=['pvgis'],
+        enable_cache=True
+    )
+
+# Weather columns checked for gaps before simulating
+WEATHER_COLUMNS = ['ghi', 'dni', 'dhi', 'temp_air', 'wind_speed']
+
+# Model selection shared by every facility simulation
+MODEL_CHAIN_OPTIONS = {
+    'dc_model': 'pvwatts',
+    'ac_model': 'pvwatts',
+    'aoi_model': 'physical',  # Explicitly set AOI model to avoid inference error
+    'temperature_model': 'sapm'  # Use SAPM temperature model to match the parameters in PVSystem
+}
+
+# Per-process ModelChain whose resolved models are reused across facilities
+_model_chain = None
+
+def _run_model_chain(system, location, weather_data):
+    """
+    Run the PVWatts ModelChain for one facility.
+    
+    The ModelChain is built (and its models resolved and validated) for the
+    first facility only. Later facilities swap in their own system and
+    location, which is valid because process_facility builds every system
+    with the same PVWatts parameters.
+    
+    Returns
+    -------
+    pvlib.modelchain.ModelChainResult
+        Simulation results for this facility
+    """
+    global _model_chain
+    
+    # pvlib is heavy to import; only load it once a simulation actually runs
+    import pvlib.modelchain
+    
+    if _model_chain is None:
+        mc = pvlib.modelchain.ModelChain(system, location, **MODEL_CHAIN_OPTIONS)
+        _model_chain = mc
+    else:
+        mc = _model_chain
+        mc.system = system
+        mc.location = location
+        mc.results = pvlib.modelchain.ModelChainResult()
+    
+    mc.run_model(weather_data)
+    return mc.results
+
+@functools.lru_cache(maxsize=256)
+def _fetch_weather(latitude, longitude, year, use_tmy):
+    """
+    Fetch weather data, memoized per process for co-located facilities.
+    
+    Callers round coordinates to 2 decimals (~1.1 km), which is finer than
+    the ~4 km NSRDB grid, so nearby facilities share one lookup instead of
+    each re-reading the disk cache. The returned DataFrame is shared and
+    must not be modified.
+    
+    Locations the parent published to shared memory are attached to
+    instead of being fetched and decoded again in this process.
+    
+    Returns
+    -------
+    tuple
+        ``(weather_data, source)``
+    """
+    shared = _shared_weather.get((latitude, longitude))
+    if shared is not None:
+        from nrel.shared_store import attach
+        
+        handle, source = shared
+        return attach(handle), source
+    
+    if use_tmy:
+        weather_data = _weather_connector.get_weather_data(
+            latitude=latitude,
+            longitude=longitude,
+            use_tmy=True  # Use TMY data for recent years
+        )
+    else:
+        weather_data = _weather_connector.get_weather_data(
+            latitude=latitude,
+            longitude=longitude,
+            year=year  # Using specified year for validation analysis
+        )
+    
+    return weather_data, _weather_connector.last_used_source
+
+def _init_worker(shared_weather=None):
+    """Pool initializer: give each worker process its own weather connector.
+    
+    The connector is not pickled to workers; all of them share the on-disk
+    weather cache and the weather the parent published in ``shared_weather``.
+    """
+    global _weather_connector, _shared_weather
+    _weather_connector = _create_weather_connector()
+    _shared_weather = shared_weather or {}
+
+def _site_key(facility):
+    """Return the rounded (latitude, longitude) _simulate_one fetches weather for, or None."""
+    latitude, longitude = get_facility_coordinates(facility)
+    if latitude is None or longitude is None:
+        return None
+    return round(latitude, 2), round(longitude, 2)
+
+def _count_sites(facilities, site_counts):
+    """Yield facilities unchanged, counting the facilities per weather site."""
+    for facility in facilities:
+        key = _site_key(facility)
+        if key is not None:
+            site_counts[key] += 1
+        yield facility
+
+# Shared sites prefetched per get_weather_data_batch call, bounding the
+# number of decoded frames held at once
+SHARED_PREFETCH_BATCH = 256
+
+def _publish_shared_weather(store, site_counts, year):
+    """
+    Publish weather for sites shared by several facilities.
+    
+    The parent fetches those sites with the connector's concurrent batch
+    fetch, decodes each once and puts it in shared memory, so pool workers
+    attach to it instead of each decoding the same cache file. Sites used by
+    a single facility are left to the worker that simulates it, as are
+    sites whose prefetch fails.
+    
+    Parameters
+    ----------
+    store : SharedWeatherStore
+        Store that owns the published blocks
+    site_counts : Counter
+        Facilities per rounded (latitude, longitude), from _count_sites
+    year : int
+        Year to simulate (TMY data is used for years after 2022)
+        
+    Returns
+    -------
+    dict
+        ``{(latitude, longitude): (handle, source)}`` for ``_init_worker``
+    """
+    use_tmy = year > 2022
+    shared_sites = iter([key for key, count in site_counts.items() if count > 1])
+    
+    shared_weather = {}
+    while True:
+        sites = list(islice(shared_sites, SHARED_PREFETCH_BATCH))
+        if not sites:
+            break
+        locations = [(latitude, longitude, None if use_tmy else year) for latitude, longitude in sites]
+        try:
+            results = _weather_connector.get_weather_data_batch(locations, use_tmy=use_tmy,
+                                                                with_source=True)
+        except Exception as e:
+            logger.warning(f"Could not prefetch weather for {len(sites)} shared sites: {e}")
+            continue
+        for key, (weather_data, source) in zip(sites, results):
+            if weather_data is not None:
+                shared_weather[key] = (store.publish(key, weather_data), source)
+    
+    return shared_weather
+
+def _simulate_one(facility, year):
+    """
+    Run a PVWatts simulation for a single facility.
+    
+    Parameters
+    ----------
+    facility : dict
+        Ampere facility data
+    year : int
+        Year to simulate (TMY data is used for years after 2022)
+        
+    Returns
+    -------
+    tuple
+        ``(facility_id, metrics)`` where ``metrics`` is the per-facility
+        result dictionary
+    """
+    facility_name = facility.get('name', facility.get('id', 'Unknown'))
+    
+    try:
+        # Convert to pvlib format
+        system, location = process_facility(facility)
+        
+        # Get weather data
+        # For years beyond NSRDB range (1998-2022), use TMY data
+        weather_data, source = _fetch_weather(
+            round(location.latitude, 2),
+            round(location.longitude, 2),
+            year,
+            year > 2022
+        )
+        
+        # Quick data quality check
+        missing = np.isnan(weather_data[WEATHER_COLUMNS].to_numpy(dtype=np.float64)).sum(axis=0)
+        if missing.any():
+            missing_data = {col: int(count) for col, count in zip(WEATHER_COLUMNS, missing) if count}
+            logger.warning(f"Missing data for {facility_name}: {missing_data}")
+        
+        # With our new PVWatts-compatible PVSystem, no need for these parameter updates
+        # The PVSystem already has the necessary parameters for temperature modeling
+        
+        # Run basic PV simulation
+        results = _run_model_chain(system, location, weather_data)
+        
+        # Calculate metrics - PVLib ModelChain results.ac is in Watts, need to convert to kWh
+        # First convert from Watts to kWh (divide by 1000)
+        # nansum matches Series.sum, which skips NaN (e.g. night-time) values
+        annual_energy_kwh = float(np.nansum(results.ac.to_numpy(dtype=np.float64))) * 1e-3  # Convert from Wh to kWh
+        
+        panel_groups = facility['panel_groups']
+        group_powers = np.fromiter((group.get('power_kw', 0) for group in panel_groups),
+                                   dtype=np.float64, count=len(panel_groups))
+        group_yields = np.fromiter((_or_nan(group.get('specific_yield_per_year')) for group in panel_groups),
+                                   dtype=np.float64, count=len(panel_groups))
+        
+        # Get system size from facility data since we're using direct PVSystem now
+        system_size_kw = facility.get('facility_power_kw', float(group_powers.sum()))
+        specific_yield = annual_energy_kwh / system_size_kw if system_size_kw > 0 else 0  # kWh/kWp
+        capacity_factor = annual_energy_kwh / (8760 * system_size_kw) * 100 if system_size_kw > 0 else 0  # %
+        
+        # Get reference specific yield from facility data if available
+        # (power-weighted over groups that report a yield)
+        reference_yield = None
+        has_reference = ~np.isnan(group_yields) & (group_powers > 0)
+        
+        if has_reference.any():
+            ref_powers = group_powers[has_reference]
+            reference_yield = float(np.dot(group_yields[has_reference], ref_powers) / ref_powers.sum())
+        
+        # Calculate yield comparison if reference data exists
+        yield_difference = None
+        if reference_yield is not None:
+            yield_difference = ((specific_yield / reference_yield) - 1) * 100  # % difference
+        
+        metric = {
+            'facility_name': facility_name,
+            'region': get_region(facility),
+            'success': True,
+            'annual_energy_kwh': annual_energy_kwh,
+            'specific_yield': specific_yield,
+            'reference_yield': reference_yield,
+            'yield_difference': yield_difference,
+            'capacity_factor': capacity_factor,
+            'weather_source': source
+        }
+        
+    except Exception as e:
+        metric = {
+            'facility_name': facility_name,
+            'region': get_region(facility),
+            'success': False,
+            'error': str(e)
+        }
+    
+    return facility.get('id', ''), metric
+
+def _select_pilot_facilities(facilities, batch_size=1024):
+    """Pick the first facility from each region, stopping once all are found.
+    
+    Facilities are consumed in batches whose coordinates are classified
+    with :func:`classify_regions`, so the whole catalog is only scanned when
+    a region has no facilities.
+    """
+    facilities = iter(facilities)
+    picks = {}
+    
+    while len(picks) < len(REGION_NAMES):
+        batch = list(islice(facilities, batch_size))
+        if not batch:
+            break
+        
+        coords = np.array([(f.get('latitude', 0), f.get('longitude', 0)) for f in batch],
+                          dtype=[('lat', 'f8'), ('lon', 'f8')])
+        regions = classify_regions(coords['lat'], coords['lon'])
+        
+        # get_region's fallback also catches the boundary cases, so only
+        # take SA picks strictly south of 35 as before
+        regions[(regions == 2) & ~(coords['lat'] < 35)] = len(REGION_NAMES)
+        
+        # First index of each region code in the batch
+        codes, first_index = np.unique(regions, return_index=True)
+        for code, index in zip(codes, first_index):
+            if code < len(REGION_NAMES):
+                picks.setdefault(REGION_NAMES[code], batch[index])
+    
+    return [picks[region_name] for region_name in REGION_NAMES if region_name in picks]
+
+def _or_nan(value):
+    """Map a missing (None) value to NaN."""
+    return np.nan if value is None else value
+
+def _format_result(metric):
+    """Format the outcome of a single facility simulation as output lines."""
+    if not metric['success']:
+        return [f"   ✗ Simulation failed: {metric['error']}\n"]
+    
+    lines = [
+        f"   ✓ Retrieved weather data from {metric['weather_source']}\n",
+        f"   ✓ Simulation completed:\n",
+        f"     - Annual energy: {metric['annual_energy_kwh']:.1f} kWh\n",
+        f"     - Simulated specific yield: {metric['specific_yield']:.1f} kWh/kWp\n"
+    ]
+    if metric['reference_yield'] is not None:
+        lines.append(f"     - Reference specific yield: {metric['reference_yield']:.1f} kWh/kWp\n")
+        lines.append(f"     - Yield difference: {metric['yield_difference']:+.1f}%\n")
+    else:
+        lines.append(f"     - Reference specific yield: Not available\n")
+    lines.append(f"     - Capacity factor: {metric['capacity_factor']:.1f}%\n")
+    return lines
+
 def main():
     """Main example function."""
     import argparse
@@ -64,11 +460,8 @@ def main():
     
     # 1. Initialize the weather connector
     print("1. Initializing Weather Data Connector...")
-    weather_connector = WeatherDataConnector(
-        primary_source='nsrdb',
-        fallback_sources=['pvgis'],
-        enable_cache=True
-    )
+    _init_worker()
+    weather_connector = _weather_connector
     
     # Test connections
     print("   Testing API connections...")
@@ -87,18 +480,26 @@ def main():
         with_panel_data_path = project_root / "ampere" / "temp" / "with_panel_data.json"
         
         if pvlib_ready_path.exists():
-            facilities = load_ampere_facilities(str(pvlib_ready_path))
+            facility_file = str(pvlib_ready_path)
             dataset_name = "pvlib_ready.json"
         elif with_panel_data_path.exists():
-            facilities = load_ampere_facilities(str(with_panel_data_path))
+            facility_file = str(with_panel_data_path)
             dataset_name = "with_panel_data.json"
         else:
             raise FileNotFoundError("No Ampere facility data found")
         
-        print(f"   Loaded {len(facilities)} facilities from {dataset_name}")
+        # Facilities are streamed from the file on each pass rather than
+        # held in memory as a list
+        facilities = iter_ampere_facilities(facility_file)
+        # The full run also counts facilities per weather site in this pass
+        site_counts = Counter()
+        if process_all:
+            facilities = _count_sites(facilities, site_counts)
+        summary = get_facility_summary(facilities)
+        n_facilities = summary['total_facilities']
+        print(f"   Loaded {n_facilities} facilities from {dataset_name}")
         
         # Generate summary
-        summary = get_facility_summary(facilities)
         print(f"   Geographic range: {summary['latitude_range']} lat, {summary['longitude_range']} lon")
         print(f"   Power range: {summary['power_range_kw']} kW")
         print(f"   Total power: {summary['total_power_kw']:.1f} kW")
@@ -110,41 +511,17 @@ def main():
     
     print()
     
-    # 3. Process a few pilot facilities
-    print("3. Processing pilot facilities...")
-    
-    # Select 3 diverse facilities for testing
-    pilot_facilities = []
-    
-    # Try to get one from each continent if possible
-    for facility in facilities[:10]:  # Check first 10
-        lat = facility.get('latitude', 0)
-        
-        # Europe
-        lon = facility.get('longitude', 0)
-        if not any(f.get('continent') == 'EU' for f in pilot_facilities) and 35 <= lat <= 65 and -10 <= lon <= 50:
-            facility['continent'] = 'EU'
-            pilot_facilities.append(facility)
-        # South America  
-        
+    # 3. Process all facilities or a few pilot facilities
     if process_all:
-        print(f"   Processing {len(facilities)} facilities. Results will be saved to: {results_file}")
+        print("3. Processing all facilities...")
+        print(f"   Processing {n_facilities} facilities. Results will be saved to: {results_file}")
         print("   This may take a while. Progress will be reported every 10 facilities.")
     else:
         print("3. Processing pilot facilities...")
         
         # Select a few representative sites for pilot testing
         # One from each major region
-        regions = {
-            'EU': [f for f in facilities if f.get('latitude', 0) > 35 and f.get('longitude', 0) > -30],
-            'NA': [f for f in facilities if f.get('latitude', 0) > 35 and f.get('longitude', 0) < -30],
-            'SA': [f for f in facilities if f.get('latitude', 0) < 35]
-        }
-        
-        pilot_facilities = []
-        for region_name, region_facilities in regions.items():
-            if region_facilities:
-                pilot_facilities.append(region_facilities[0])
+        pilot_facilities = _select_pilot_facilities(iter_ampere_facilities(facility_file))
         
         print(f"   Selected {len(pilot_facilities)} pilot facilities:")
         for i, facility in enumerate(pilot_facilities):
@@ -154,159 +531,92 @@ def main():
             print(f"   {i+1}. {facility.get('name', 'Unknown')} ({get_region(facility)}): {lat:.2f}, {lon:.2f}, {power:.1f} kW")
     
     # 4. Run simulations on facilities
-    facilities_to_process = facilities if process_all else pilot_facilities
+    if process_all:
+        facilities_to_process = iter_ampere_facilities(facility_file)
+        n_to_process = n_facilities
+    else:
+        facilities_to_process = pilot_facilities
+        n_to_process = len(pilot_facilities)
     
-    print(f"\n4. Running simulations on {len(facilities_to_process)} facilities...\n")
+    print(f"\n4. Running simulations on {n_to_process} facilities...\n")
     
     metrics = {}
     successful = 0
     failed = 0
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # For large datasets, we'll report progress periodically
     progress_interval = 10  # Report every 10 facilities
     
-    for i, facility in enumerate(facilities_to_process):
-        facility_name = facility.get('name', f'Facility_{i+1}')
-        # Only print detailed progress for pilot facilities or at intervals
-        if not process_all or (i % progress_interval == 0):
-            print(f"   Processing: {facility_name} ({i+1}/{len(facilities_to_process)})")
+    simulate = partial(_simulate_one, year=args.year)
+    
+    if process_all:
+        from nrel.shared_store import SharedWeatherStore
         
-        try:
-            # Convert to pvlib format
-            system, location = process_facility(facility)
-            print(f"   ✓ Created PVSystem with {len(system.arrays)} arrays")
-            
-            # Get weather data
-            # For years beyond NSRDB range (1998-2022), use TMY data
-            if args.year > 2022:
-                weather_data = weather_connector.get_weather_data(
-                    latitude=location.latitude,
-                    longitude=location.longitude,
-                    use_tmy=True  # Use TMY data for recent years
-                )
-            else:
-                weather_data = weather_connector.get_weather_data(
-                    latitude=location.latitude,
-                    longitude=location.longitude,
-                    year=args.year  # Using specified year for validation analysis
-                )
-            
-            source = weather_connector.last_used_source
-            print(f"   ✓ Retrieved weather data from {source} ({len(weather_data)} records)")
-            
-            # Quick data quality check
-            missing_data = weather_data[['ghi', 'dni', 'dhi', 'temp_air', 'wind_speed']].isnull().sum()
-            if missing_data.any():
-                print(f"   ⚠ Missing data: {missing_data[missing_data > 0].to_dict()}")
-            
-            # With our new PVWatts-compatible PVSystem, no need for these parameter updates
-            # The PVSystem already has the necessary parameters for temperature modeling
-            
-            # Run basic PV simulation
-            mc = pvlib.modelchain.ModelChain(
-                system, location,
-                dc_model='pvwatts',
-                ac_model='pvwatts',
-                aoi_model='physical',  # Explicitly set AOI model to avoid inference error
-                temperature_model='sapm'  # Use SAPM temperature model to match the parameters in PVSystem
-            )
-            
-            mc.run_model(weather_data)
-            
-            # Calculate metrics - PVLib ModelChain results.ac is in Watts, need to convert to kWh
-            # First convert from Watts to kWh (divide by 1000)
-            annual_energy_kwh = mc.results.ac.sum() / 1000  # Convert from Wh to kWh
-            
-            # Get system size from facility data since we're using direct PVSystem now
-            system_size_kw = facility.get('facility_power_kw', sum(group.get('power_kw', 0) for group in facility['panel_groups']))
-            specific_yield = annual_energy_kwh / system_size_kw if system_size_kw > 0 else 0  # kWh/kWp
-            capacity_factor = annual_energy_kwh / (8760 * system_size_kw) * 100 if system_size_kw > 0 else 0  # %
-            
-            # Get reference specific yield from facility data if available
-            reference_yield = None
-            weighted_reference_yield = 0
-            total_ref_power = 0
-            
-            for group in facility['panel_groups']:
-                group_power = group.get('power_kw', 0)
-                group_yield = group.get('specific_yield_per_year')
-                
-                if group_yield is not None and group_power > 0:
-                    weighted_reference_yield += group_yield * group_power
-                    total_ref_power += group_power
-            
-            if total_ref_power > 0:
-                reference_yield = weighted_reference_yield / total_ref_power
-            
-            # Calculate yield comparison if reference data exists
-            yield_difference = None
-            if reference_yield is not None:
-                yield_difference = ((specific_yield / reference_yield) - 1) * 100  # % difference
-                
-            # Only print detailed results for pilot facilities or at intervals
+        # Weather for co-located facilities is decoded once here and
+        # shared with the workers
+        store = SharedWeatherStore()
+        shared_weather = _publish_shared_weather(store, site_counts, args.year)
+        print(f"   Shared weather data for {len(shared_weather)} co-located sites with workers")
+        
+        # Facilities are independent, so simulate them in parallel; each
+        # worker builds its own connector in _init_worker
+        pool = Pool(processes=os.cpu_count(), initializer=_init_worker,
+                    initargs=(shared_weather,))
+        results = pool.imap_unordered(simulate, facilities_to_process, chunksize=8)
+    else:
+        pool = None
+        store = None
+        results = map(simulate, facilities_to_process)
+    
+    try:
+        for i, (facility_id, metric) in enumerate(results):
+            # Only print detailed progress for pilot facilities or at intervals
+            # and write each report with a single call
             if not process_all or (i % progress_interval == 0):
-                print(f"   ✓ Simulation completed:")
-                print(f"     - Annual energy: {annual_energy_kwh:.1f} kWh")
-                print(f"     - Simulated specific yield: {specific_yield:.1f} kWh/kWp")
-                if reference_yield is not None:
-                    print(f"     - Reference specific yield: {reference_yield:.1f} kWh/kWp")
-                    print(f"     - Yield difference: {yield_difference:+.1f}%")
-                else:
-                    print(f"     - Reference specific yield: Not available")
-                print(f"     - Capacity factor: {capacity_factor:.1f}%")
+                report = [f"   Processed: {metric['facility_name']} ({i+1}/{n_to_process})\n"]
+                report.extend(_format_result(metric))
+                report.append("\n")
+                sys.stdout.write("".join(report))
             
-            successful += 1
+            if metric['success']:
+                successful += 1
+            else:
+                failed += 1
             
             # Store results
-            metrics[facility.get('id', '')] = {
-                'facility_name': facility_name,
-                'region': get_region(facility),
-                'success': True,
-                'annual_energy_kwh': annual_energy_kwh,
-                'specific_yield': specific_yield,
-                'reference_yield': reference_yield,
-                'yield_difference': yield_difference,
-                'capacity_factor': capacity_factor,
-                'weather_source': source
-            }
-            
-        except Exception as e:
-            # Only print detailed errors for pilot facilities or at intervals
-            if not process_all or (i % progress_interval == 0):
-                print(f"   ✗ Simulation failed: {str(e)}")
-            
-            metrics[facility.get('id', '')] = {
-                'facility_name': facility_name,
-                'region': get_region(facility),
-                'success': False,
-                'error': str(e)
-            }
-            
-            failed += 1
-        
-        print()
+            metrics[facility_id] = metric
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        # Workers are done with the shared blocks once the pool has joined
+        if store is not None:
+            store.close()
     
     # Calculate elapsed time
-    elapsed_time = time.time() - start_time
+    elapsed_time = time.perf_counter() - start_time
     
     # 5. Print summary results
     print("\n5. Summary Results:")
     print("=" * 50)
     
-    print(f"Processed {len(facilities_to_process)} facilities in {elapsed_time:.1f} seconds ({elapsed_time/len(facilities_to_process):.2f} sec/facility)")
-    print(f"Successful simulations: {successful}/{len(facilities_to_process)} ({successful/len(facilities_to_process)*100:.1f}%)")
-    print(f"Failed simulations: {failed}/{len(facilities_to_process)} ({failed/len(facilities_to_process)*100:.1f}%)")
+    print(f"Processed {n_to_process} facilities in {elapsed_time:.1f} seconds ({elapsed_time/n_to_process:.2f} sec/facility)")
+    print(f"Successful simulations: {successful}/{n_to_process} ({successful/n_to_process*100:.1f}%)")
+    print(f"Failed simulations: {failed}/{n_to_process} ({failed/n_to_process*100:.1f}%)")
     
     if successful > 0:
         # Calculate averages for successful simulations
-        successful_metrics = [m for m in metrics.values() if m.get('success', False)]
-        avg_yield = sum(m.get('specific_yield', 0) for m in successful_metrics) / successful
-        avg_cf = sum(m.get('capacity_factor', 0) for m in successful_metrics) / successful
+        # (yield difference is NaN where no reference exists)
+        performance = np.array([
+            (m['specific_yield'], m['capacity_factor'], _or_nan(m['yield_difference']))
+            for m in metrics.values() if m.get('success', False)
+        ], dtype=np.float64)
+        avg_yield, avg_cf = (float(v) for v in performance[:, :2].mean(axis=0))
         
         # Calculate average yield difference where reference exists
-        yield_diffs = [m.get('yield_difference', 0) for m in successful_metrics if m.get('yield_difference') is not None]
-        avg_yield_diff = sum(yield_diffs) / len(yield_diffs) if yield_diffs else None
+        yield_diffs = performance[:, 2]
+        avg_yield_diff = float(np.nanmean(yield_diffs)) if np.isfinite(yield_diffs).any() else None
         
         print("\nAverage Performance:")
         print(f"  Simulated Specific Yield: {avg_yield:.1f} kWh/kWp")
@@ -326,10 +636,10 @@ def main():
     if process_all:
         # Add summary statistics to the metrics
         summary = {
-            'total_facilities': len(facilities_to_process),
+            'total_facilities': n_to_process,
             'successful': successful,
             'failed': failed,
-            'success_rate': successful/len(facilities_to_process)*100 if len(facilities_to_process) > 0 else 0,
+            'success_rate': successful/n_to_process*100 if n_to_process > 0 else 0,
             'processing_time_seconds': elapsed_time,
             'average_yield': avg_yield if successful > 0 else 0,
             'average_capacity_factor': avg_cf if successful > 0 else 0,
@@ -342,8 +652,15 @@ def main():
             'facilities': metrics
         }
         
-        with open(results_file, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        if orjson is not None:
+            # Facility ids can be ints, which json.dump converts but orjson
+            # only accepts as keys with OPT_NON_STR_KEYS
+            with open(results_file, 'wb') as f:
+                f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                                     | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(results_file, 'w') as f:
+                json.dump(export_data, f, indent=2)
         
         print(f"\nResults exported to: {results_file}")
 
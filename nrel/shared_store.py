@@ -0,0 +1,165 @@
+"""
+Shared-memory weather data store for worker pools.
+
+The parent process decodes weather data once and publishes its columns to
+``multiprocessing.shared_memory`` blocks; worker processes attach to them
+and get DataFrames backed by the shared buffers instead of each re-reading
+and decoding the same cache files.
+"""
+
+from multiprocessing import shared_memory
+from typing import Dict, Hashable, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import get_logger
+
+logger = get_logger(__name__)
+
+class SharedWeatherHandle(NamedTuple):
+    """Picklable description of a published DataFrame."""
+    values_name: str
+    index_name: str
+    columns: Tuple[str, ...]
+    dtype: str
+    n_rows: int
+    tz: Optional[str]
+
+# Blocks attached in this process, kept open while their DataFrames are used
+_attached: Dict[str, Tuple[shared_memory.SharedMemory, shared_memory.SharedMemory]] = {}
+
+def attach(handle: SharedWeatherHandle) -> pd.DataFrame:
+    """
+    Build a DataFrame over a published weather block without copying values.
+
+    Parameters
+    ----------
+    handle : SharedWeatherHandle
+        Handle returned by :meth:`SharedWeatherStore.publish`
+
+    Returns
+    -------
+    pd.DataFrame
+        Weather data whose columns are views of the shared block; it must
+        not be modified
+    """
+    blocks = _attached.get(handle.values_name)
+    if blocks is None:
+        blocks = (shared_memory.SharedMemory(name=handle.values_name),
+                  shared_memory.SharedMemory(name=handle.index_name))
+        _attached[handle.values_name] = blocks
+    values_shm, index_shm = blocks
+
+    # One row per column, so each column is a contiguous view
+    values = np.ndarray((len(handle.columns), handle.n_rows), dtype=handle.dtype,
+                        buffer=values_shm.buf)
+    values.flags.writeable = False
+    index_ns = np.ndarray((handle.n_rows,), dtype=np.int64, buffer=index_shm.buf)
+
+    index = pd.DatetimeIndex(index_ns.view('M8[ns]'))
+    if handle.tz is not None:
+        index = index.tz_localize('UTC').tz_convert(handle.tz)
+
+    return pd.DataFrame(dict(zip(handle.columns, values)), index=index, copy=False)
+
+def detach(handle: SharedWeatherHandle) -> None:
+    """Close this process's mapping of a published block."""
+    blocks = _attached.pop(handle.values_name, None)
+    if blocks is not None:
+        for block in blocks:
+            block.close()
+
+class SharedWeatherStore:
+    """
+    Weather DataFrames published to shared memory by the parent process.
+
+    Only numeric columns with a DatetimeIndex are supported. The store owns
+    the blocks: they stay available to workers until :meth:`close` (or the
+    end of a ``with`` block) unlinks them, so close it only after the
+    workers are done.
+    """
+
+    def __init__(self, dtype: str = 'float32'):
+        """
+        Initialize the store.
+
+        Parameters
+        ----------
+        dtype : str, default 'float32'
+            dtype of the published value columns
+        """
+        self.dtype = np.dtype(dtype).str
+        self._handles: Dict[Hashable, SharedWeatherHandle] = {}
+        self._blocks = []
+
+    def __enter__(self) -> 'SharedWeatherStore':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._handles
+
+    def get(self, key: Hashable) -> Optional[SharedWeatherHandle]:
+        """Return the handle published under ``key``, if any."""
+        return self._handles.get(key)
+
+    def publish(self, key: Hashable, data: pd.DataFrame) -> SharedWeatherHandle:
+        """
+        Copy a DataFrame into shared memory once and return its handle.
+
+        Parameters
+        ----------
+        key : hashable
+            Cache key, e.g. ``(lat_cell, lon_cell, year)``
+        data : pd.DataFrame
+            Weather data with numeric columns and a DatetimeIndex
+
+        Returns
+        -------
+        SharedWeatherHandle
+            Picklable handle for :func:`attach`; publishing the same key
+            again returns the existing handle
+        """
+        handle = self._handles.get(key)
+        if handle is not None:
+            return handle
+
+        n_rows = len(data)
+        itemsize = np.dtype(self.dtype).itemsize
+        # SharedMemory rejects zero-sized blocks
+        values_shm = shared_memory.SharedMemory(
+            create=True, size=max(data.shape[1] * n_rows * itemsize, 1))
+        index_shm = shared_memory.SharedMemory(create=True, size=max(n_rows * 8, 1))
+        self._blocks.extend((values_shm, index_shm))
+
+        values = np.ndarray((data.shape[1], n_rows), dtype=self.dtype, buffer=values_shm.buf)
+        values[:] = data.to_numpy(dtype=self.dtype).T
+
+        index = pd.DatetimeIndex(data.index)
+        tz = str(index.tz) if index.tz is not None else None
+        if tz is not None:
+            index = index.tz_convert('UTC').tz_localize(None)
+        np.ndarray((n_rows,), dtype=np.int64, buffer=index_shm.buf)[:] = index.asi8
+
+        handle = SharedWeatherHandle(values_shm.name, index_shm.name,
+                                     tuple(data.columns), self.dtype, n_rows, tz)
+        self._handles[key] = handle
+        logger.debug(f"Published weather data for {key} to shared memory "
+                     f"({values_shm.size + index_shm.size} bytes)")
+        return handle
+
+    def close(self) -> None:
+        """Release and unlink every published block."""
+        for handle in self._handles.values():
+            detach(handle)
+        for block in self._blocks:
+            block.close()
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        self._blocks = []
+        self._handles = {}
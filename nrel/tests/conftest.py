@@ -0,0 +1,36 @@
+"""
+Shared pytest configuration for the NREL test suite.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# Also add pvlib-python if available
+pvlib_path = project_root / "pvlib-python"
+if str(pvlib_path) not in sys.path and pvlib_path.exists():
+    sys.path.insert(0, str(pvlib_path))
+
+from nrel.config import config
+
+@pytest.fixture(scope='session', autouse=True)
+def isolated_cache_dir(tmp_path_factory):
+    """Point the global config at a temporary cache directory.
+    
+    Each pytest-xdist worker gets its own directory so parallel workers
+    never see each other's cache files.
+    """
+    worker = os.environ.get('PYTEST_XDIST_WORKER', 'main')
+    original_cache_dir = config.cache_dir
+    config.cache_dir = tmp_path_factory.mktemp(f'nrel_cache_{worker}')
+    
+    yield config.cache_dir
+    
+    config.cache_dir = original_cache_dir
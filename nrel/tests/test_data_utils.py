@@ -5,24 +5,34 @@ Unit tests for data processing utilities.
 import unittest
 import tempfile
 import json
+import os
+import numpy as np
 from pathlib import Path
 import sys
 
-# Add parent directory to path for imports
+# Add parent directory to path for imports (once per process; the
+# sibling test modules and conftest.py share this setup)
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 # Also add pvlib-python if available
 pvlib_path = project_root / "pvlib-python"
-if pvlib_path.exists():
+if str(pvlib_path) not in sys.path and pvlib_path.exists():
     sys.path.insert(0, str(pvlib_path))
 
 from nrel.data_utils import (
     load_ampere_facilities, 
+    iter_ampere_facilities,
+    load_ampere_facilities_slice,
+    peek_facility_count,
     normalize_facility_data,
     process_facility,
+    process_facilities,
     validate_facility_data,
-    get_facility_summary
+    validate_panel_group,
+    get_facility_summary,
+    _temperature_coefficient_fraction
 )
 
 class TestDataUtils(unittest.TestCase):
@@ -106,8 +116,9 @@ class TestDataUtils(unittest.TestCase):
         # Should convert nominalPower to facility_power_kw
         self.assertEqual(normalized['facility_power_kw'], 2000.0)
         
-        # Should convert timezone from address
+        # Should convert timezone from address (interned)
         self.assertEqual(normalized['timezone'], 'Europe/Berlin')
+        self.assertIs(normalized['timezone'], sys.intern('Europe/Berlin'))
         
         # Should convert panelGroups to panel_groups
         self.assertIn('panel_groups', normalized)
@@ -118,6 +129,19 @@ class TestDataUtils(unittest.TestCase):
         self.assertEqual(group['tilt'], 35)
         self.assertIn('power_kw', group)
     
+    def test_normalize_facility_data_copy_on_write(self):
+        """Test that normalization only copies when something changes."""
+        # Already-normalized data is returned unchanged
+        normalized = normalize_facility_data(self.pvlib_ready_facility)
+        self.assertIs(normalized, self.pvlib_ready_facility)
+        
+        # Raw data is normalized into a new dict without mutating the input
+        original_group = dict(self.with_panel_data_facility['panelGroups'][0])
+        normalized = normalize_facility_data(self.with_panel_data_facility)
+        self.assertIsNot(normalized, self.with_panel_data_facility)
+        self.assertNotIn('latitude', self.with_panel_data_facility)
+        self.assertEqual(self.with_panel_data_facility['panelGroups'][0], original_group)
+    
     def test_process_facility_pvlib_ready(self):
         """Test processing pvlib_ready facility to PVSystem."""
         system, location = process_facility(self.pvlib_ready_facility)
@@ -158,6 +182,57 @@ class TestDataUtils(unittest.TestCase):
         self.assertEqual(array.mount.surface_tilt, 35)
         self.assertEqual(array.mount.surface_azimuth, 180)
     
+    def test_process_facility_weighted_orientation(self):
+        """Test power-weighted tilt/azimuth for multi-group facilities."""
+        facility = self.pvlib_ready_facility.copy()
+        facility['panel_groups'] = [
+            {"name": "South", "azimuth": 180, "tilt": 30, "power_kw": 750.0},
+            {"name": "East", "azimuth": 90, "tilt": 20, "power_kw": 250.0}
+        ]
+        
+        system, _ = process_facility(facility)
+        
+        mount = system.arrays[0].mount
+        self.assertAlmostEqual(mount.surface_tilt, 27.5)
+        self.assertAlmostEqual(mount.surface_azimuth, 157.5)
+        self.assertEqual(system.arrays[0].module_parameters['pdc0'], 1000000.0)
+    
+    def test_process_facility_prenormalized(self):
+        """Test skipping normalization for already-normalized facilities."""
+        normalized = normalize_facility_data(self.with_panel_data_facility)
+        
+        system, location = process_facility(normalized, normalize=False)
+        
+        self.assertEqual(location.latitude, 52.5)
+        self.assertEqual(system.arrays[0].mount.surface_tilt, 35)
+        
+        # Raw facilities must be normalized to be usable
+        with self.assertRaises(ValueError):
+            process_facility(self.with_panel_data_facility, normalize=False)
+    
+    def test_process_facilities(self):
+        """Test batch processing serially and with a process pool."""
+        facilities = [self.pvlib_ready_facility, self.with_panel_data_facility] * 4
+        
+        serial = process_facilities(facilities, workers=1)
+        parallel = process_facilities(facilities, workers=2)
+        
+        self.assertEqual(len(serial), 8)
+        self.assertEqual(len(parallel), 8)
+        for (sys_a, loc_a), (sys_b, loc_b) in zip(serial, parallel):
+            self.assertEqual(loc_a.latitude, loc_b.latitude)
+            self.assertEqual(sys_a.arrays[0].module_parameters['pdc0'],
+                             sys_b.arrays[0].module_parameters['pdc0'])
+    
+    def test_temperature_coefficient_fraction(self):
+        """Test %/°C to fraction/°C conversion for scalars and arrays."""
+        self.assertAlmostEqual(_temperature_coefficient_fraction(-0.4), -0.004)
+        self.assertAlmostEqual(_temperature_coefficient_fraction(-0.0035), -0.0035)
+        
+        coeffs = np.array([-0.4, -0.0035, -0.29])
+        np.testing.assert_allclose(_temperature_coefficient_fraction(coeffs),
+                                   [-0.004, -0.0035, -0.0029])
+    
     def test_validate_facility_data_valid(self):
         """Test validation of valid facility data."""
         issues = validate_facility_data(self.pvlib_ready_facility)
@@ -190,6 +265,20 @@ class TestDataUtils(unittest.TestCase):
         issues = validate_facility_data(invalid_facility)
         self.assertTrue(any("No panel groups found" in issue for issue in issues))
     
+    def test_validate_panel_group_field_names(self):
+        """Test group validation for both dataset naming conventions."""
+        raw_group = self.with_panel_data_facility['panelGroups'][0]
+        self.assertEqual(validate_panel_group(raw_group, 0), [])
+        self.assertEqual(validate_panel_group(raw_group, 0, ('elevation', 'nominalPower')), [])
+        
+        # Groups that don't follow the detected convention still validate
+        ready_group = self.pvlib_ready_facility['panel_groups'][0]
+        self.assertEqual(validate_panel_group(ready_group, 0, ('elevation', 'nominalPower')), [])
+        
+        issues = validate_panel_group({'name': 'Bad', 'azimuth': 180}, 0)
+        self.assertIn("Panel group 0: Missing tilt/elevation angle", issues)
+        self.assertIn("Panel group 0: Missing power rating", issues)
+    
     def test_load_ampere_facilities_from_temp_file(self):
         """Test loading facilities from temporary JSON file."""
         # Create temporary file with test data
@@ -211,6 +300,86 @@ class TestDataUtils(unittest.TestCase):
             self.assertEqual(facilities[1]['id'], 'test_facility_2')
         finally:
             Path(temp_path).unlink()
+            Path(temp_path + '.pkl').unlink(missing_ok=True)
+    
+    def test_load_ampere_facilities_cache(self):
+        """Test that parsed facilities are cached and invalidated on change."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path = Path(temp_dir) / 'facilities.json'
+            cache_path = Path(temp_dir) / 'facilities.json.pkl'
+            json_path.write_text(json.dumps([self.pvlib_ready_facility]))
+            
+            facilities = load_ampere_facilities(str(json_path))
+            self.assertTrue(cache_path.exists())
+            self.assertEqual(load_ampere_facilities(str(json_path)), facilities)
+            
+            # A newer JSON file must take precedence over the cache
+            json_path.write_text(json.dumps([self.with_panel_data_facility]))
+            os.utime(cache_path, ns=(0, 0))
+            facilities = load_ampere_facilities(str(json_path))
+            self.assertEqual(facilities[0]['id'], 'test_facility_2')
+            
+            # So must an older JSON file restored with its original mtime
+            json_path.write_text(json.dumps([self.pvlib_ready_facility]))
+            os.utime(json_path, ns=(0, 0))
+            facilities = load_ampere_facilities(str(json_path))
+            self.assertEqual(facilities[0]['id'], self.pvlib_ready_facility['id'])
+            
+            # Caching can be disabled entirely
+            cache_path.unlink()
+            load_ampere_facilities(str(json_path), use_cache=False)
+            self.assertFalse(cache_path.exists())
+    
+    def test_iter_ampere_facilities(self):
+        """Test streaming facilities from both supported file layouts."""
+        facilities = [self.pvlib_ready_facility, self.with_panel_data_facility]
+        
+        for test_data in ({"facilities": facilities}, facilities):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+                json.dump(test_data, f)
+                temp_path = f.name
+            
+            try:
+                streamed = list(iter_ampere_facilities(temp_path))
+                self.assertEqual(streamed, facilities)
+            finally:
+                Path(temp_path).unlink()
+    
+    def test_peek_and_slice_facilities(self):
+        """Test counting and slicing facilities without a full load."""
+        facilities = [self.pvlib_ready_facility, self.with_panel_data_facility]
+        
+        for test_data in ({"facilities": facilities}, facilities):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+                json.dump(test_data, f)
+                temp_path = f.name
+            
+            try:
+                self.assertEqual(peek_facility_count(temp_path), 2)
+                self.assertEqual(load_ampere_facilities_slice(temp_path, 1, 2), facilities[1:2])
+                self.assertEqual(load_ampere_facilities_slice(temp_path, 0), facilities)
+            finally:
+                Path(temp_path).unlink()
+    
+    def test_stream_facilities_invalid_format(self):
+        """Test that streaming rejects an object without a facilities key."""
+        for test_data, count in (({"sites": [self.pvlib_ready_facility]}, None),
+                                 ({"facilities": []}, 0)):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+                json.dump(test_data, f)
+                temp_path = f.name
+            
+            try:
+                if count is None:
+                    with self.assertRaisesRegex(ValueError, "expected 'facilities' key"):
+                        list(iter_ampere_facilities(temp_path))
+                    with self.assertRaisesRegex(ValueError, "expected 'facilities' key"):
+                        peek_facility_count(temp_path)
+                else:
+                    self.assertEqual(list(iter_ampere_facilities(temp_path)), [])
+                    self.assertEqual(peek_facility_count(temp_path), count)
+            finally:
+                Path(temp_path).unlink()
     
     def test_load_ampere_facilities_file_not_found(self):
         """Test loading from non-existent file."""
@@ -235,6 +404,15 @@ class TestDataUtils(unittest.TestCase):
         self.assertEqual(summary['total_panel_groups'], 3)  # 2 + 1
         self.assertEqual(summary['multi_array_facilities'], 1)  # Only first facility has multiple arrays
     
+    def test_get_facility_summary_iterator(self):
+        """Test summary generation from a one-shot iterator."""
+        facilities = [self.pvlib_ready_facility, normalize_facility_data(self.with_panel_data_facility)]
+        
+        summary = get_facility_summary(iter(facilities))
+        
+        self.assertEqual(summary, get_facility_summary(facilities))
+        self.assertEqual(summary['total_facilities'], 2)
+    
     def test_get_facility_summary_empty(self):
         """Test summary generation with empty facility list."""
         summary = get_facility_summary([])
@@ -0,0 +1,225 @@
+"""
+Unit tests for the validation analysis of simulation results.
+"""
+
+import json
+import unittest
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+import sys
+
+# Add parent directory to path for imports (once per process; the
+# sibling test modules and conftest.py share this setup)
+project_root = Path(__file__).parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+try:
+    from nrel.validation_analysis import (
+        ValidationAnalyzer,
+        AMPERE_COLUMNS,
+        facilities_to_frame,
+        _annual_energy_from_frame,
+        _group_sums_loop,
+        _group_sums_numpy
+    )
+    import nrel.validation_analysis as validation_analysis
+except ImportError as e:
+    # matplotlib and seaborn are imported with the module for plotting
+    raise unittest.SkipTest(f"validation_analysis dependencies not installed: {e}")
+
+def _readings(energy=None, pac_mean=None):
+    """Build a processed readings record from Energy summary and Pac mean values."""
+    readings = {}
+    if energy is not None:
+        readings['Energy'] = {'count': energy.pop('count', 24), 'summary': energy}
+    if pac_mean is not None:
+        readings['Pac'] = {'count': 24, 'summary': {'mean': pac_mean}}
+    return readings
+
+class TestValidationAnalyzer(unittest.TestCase):
+    """Test cases for ValidationAnalyzer."""
+    
+    def setUp(self):
+        """Create results and Ampere directories with facility metadata."""
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = Path(self._temp_dir.name)
+        self.results_dir = self.temp_dir / "results"
+        self.ampere_dir = self.temp_dir / "ampere"
+        self.results_dir.mkdir()
+        self.ampere_dir.mkdir()
+        
+        facilities = [{'id': f'f{i}', 'facility_power_kw': 100.0 * i} for i in range(1, 5)]
+        (self.ampere_dir / "pvlib_ready.json").write_text(json.dumps({'facilities': facilities}))
+        
+        # Processed Ampere records covering each annual energy rule
+        self.ampere_facilities = {
+            # Cumulative meter: the max is the annual total
+            'f1': {'success': True, 'readings': _readings({'max': 150000.0, 'sum': 9e6,
+                                                          'mean': 75000.0, 'count': 24})},
+            # No max, sum clearly not cumulative
+            'f2': {'success': True, 'readings': _readings({'sum': 250000.0, 'mean': 10.0,
+                                                          'count': 24})},
+            # No max, cumulative-looking sum: fall back to average power
+            'f3': {'success': True, 'readings': _readings({'sum': 1000.0, 'mean': 500.0,
+                                                          'count': 24}, pac_mean=40.0)},
+            # Power readings only
+            'f4': {'success': True, 'readings': _readings(pac_mean=25.0)},
+            # Failed processing
+            'f5': {'success': False, 'readings': _readings({'max': 1000.0})},
+            # Nothing usable
+            'f6': {'success': True, 'readings': {}}
+        }
+        
+        self.analyzer = ValidationAnalyzer(self.results_dir, self.ampere_dir)
+    
+    def tearDown(self):
+        self._temp_dir.cleanup()
+    
+    def test_facility_metadata(self):
+        """Test the shared, read-only facility lookup and its pickle cache."""
+        metadata = self.analyzer.facility_metadata
+        self.assertEqual(list(metadata), ['f1', 'f2', 'f3', 'f4'])
+        self.assertEqual(metadata['f2']['facility_power_kw'], 200.0)
+        with self.assertRaises(TypeError):
+            metadata['f5'] = {}
+        
+        # Analyzers share the lookup, cached next to the JSON by data_utils
+        self.assertIs(ValidationAnalyzer(self.results_dir, self.ampere_dir).facility_metadata,
+                      metadata)
+        self.assertTrue((self.ampere_dir / "pvlib_ready.json.pkl").exists())
+    
+    def test_validation_metrics(self):
+        """Test metrics against scipy and closed-form definitions."""
+        from scipy import stats
+        
+        rng = np.random.default_rng(0)
+        actual = rng.uniform(100, 1000, 50)
+        actual[:3] = 0.0  # excluded from MAPE only
+        predicted = actual * 1.05 + rng.normal(0, 30, 50)
+        predicted[3] = np.nan  # dropped everywhere
+        
+        metrics = self.analyzer.calculate_validation_metrics(actual, predicted)
+        
+        mask = np.isfinite(predicted)
+        a, p = actual[mask], predicted[mask]
+        error = p - a
+        correlation, p_value = stats.pearsonr(a, p)
+        
+        self.assertEqual(metrics['n_points'], 49)
+        self.assertAlmostEqual(metrics['mae'], np.mean(np.abs(error)))
+        self.assertAlmostEqual(metrics['rmse'], np.sqrt(np.mean(error ** 2)))
+        self.assertAlmostEqual(metrics['mape'], np.mean(np.abs(error[a != 0] / a[a != 0])) * 100)
+        self.assertAlmostEqual(metrics['r2_score'],
+                               1 - np.sum(error ** 2) / np.sum((a - a.mean()) ** 2))
+        self.assertAlmostEqual(metrics['correlation'], correlation)
+        self.assertAlmostEqual(metrics['correlation_p_value'], p_value)
+        self.assertAlmostEqual(metrics['percent_bias'], (p.mean() - a.mean()) / a.mean() * 100)
+        
+        # The p-value can be skipped
+        metrics = self.analyzer.calculate_validation_metrics(actual, predicted,
+                                                             include_p_value=False)
+        self.assertTrue(np.isnan(metrics['correlation_p_value']))
+        
+        # No finite pairs
+        metrics = self.analyzer.calculate_validation_metrics(np.array([np.nan]), np.array([1.0]))
+        self.assertIn('error', metrics)
+    
+    def test_group_metrics(self):
+        """Test per-group metrics against per-subset metrics for each backend."""
+        rng = np.random.default_rng(1)
+        actual = rng.uniform(100, 1000, 60)
+        actual[::7] = 0.0
+        predicted = actual * 0.95 + rng.normal(0, 25, 60)
+        predicted[5] = np.inf
+        groups = np.array(['a', 'b', 'c', None, np.nan] * 12, dtype=object)
+        
+        backends = [_group_sums_numpy, _group_sums_loop]
+        if validation_analysis.njit is not None:
+            backends.append(validation_analysis._group_sums_kernel)
+        
+        for backend in backends:
+            with self.subTest(backend=getattr(backend, '__name__', str(backend))):
+                with patch.object(validation_analysis, '_group_sums_kernel', backend):
+                    result = self.analyzer.calculate_group_metrics(actual, predicted, groups)
+                
+                # Points without a label belong to no group
+                self.assertEqual(list(result.index), ['a', 'b', 'c'])
+                for label in result.index:
+                    subset = groups == label
+                    expected = self.analyzer.calculate_validation_metrics(
+                        actual[subset], predicted[subset], include_p_value=False)
+                    for column in result.columns:
+                        np.testing.assert_allclose(result.loc[label, column], expected[column],
+                                                   rtol=1e-9, err_msg=column)
+    
+    def test_annual_energy_from_frame(self):
+        """Test vectorized annual energy against the per-facility calculation."""
+        frame = facilities_to_frame(self.ampere_facilities)
+        expected = [self.analyzer.calculate_annual_energy_from_readings(facility)
+                    for facility in self.ampere_facilities.values()]
+        
+        np.testing.assert_allclose(_annual_energy_from_frame(frame), expected)
+        np.testing.assert_allclose(expected, [150000.0, 250000.0, 40.0 * 8760, 25.0 * 8760, 0.0, 0.0])
+    
+    def test_match_facilities(self):
+        """Test matching successful simulations with positive Ampere energy."""
+        sim_results = {'facilities': {
+            'f1': {'success': True, 'annual_energy_kwh': 140000.0},
+            'f2': {'success': False},
+            'f4': {'success': True, 'annual_energy_kwh': 200000.0},
+            'f5': {'success': True, 'annual_energy_kwh': 1000.0},
+            'f6': {'success': True, 'annual_energy_kwh': 1000.0},
+            'f7': {'success': True, 'annual_energy_kwh': 1000.0}
+        }}
+        ampere_data = {'facilities': self.ampere_facilities}
+        
+        # f2 failed to simulate, f5/f6 have no Ampere energy, f7 has no Ampere data
+        matched = self.analyzer.match_facilities(sim_results, ampere_data)
+        self.assertEqual(sorted(matched), ['f1', 'f4'])
+        
+        # The flat table gives the same result
+        table = facilities_to_frame(self.ampere_facilities)[list(AMPERE_COLUMNS)]
+        self.assertEqual(sorted(self.analyzer.match_facilities(sim_results, table)), ['f1', 'f4'])
+    
+    def test_load_simulation_results(self):
+        """Test loading results with NaN literals, with and without ijson."""
+        results = {
+            'summary': {'total_facilities': 2},
+            'facilities': {
+                'f1': {'success': True, 'annual_energy_kwh': 140000.0, 'weather_data': [1, 2]},
+                'f2': {'success': False, 'annual_energy_kwh': float('nan')}
+            }
+        }
+        # json.dump writes NaN literals, which strict parsers reject
+        (self.results_dir / "simulation_results_2022.json").write_text(json.dumps(results))
+        
+        for ijson_module in (validation_analysis.ijson, None):
+            with self.subTest(ijson=ijson_module is not None):
+                with patch.object(validation_analysis, 'ijson', ijson_module):
+                    loaded = self.analyzer.load_simulation_results()
+                
+                self.assertEqual(loaded['summary'], {'total_facilities': 2})
+                self.assertEqual(loaded['facilities']['f1'],
+                                 {'success': True, 'annual_energy_kwh': 140000.0})
+                self.assertTrue(np.isnan(loaded['facilities']['f2']['annual_energy_kwh']))
+    
+    def test_load_ampere_table(self):
+        """Test that the Parquet copy round-trips the JSON table."""
+        ampere_file = self.ampere_dir / "processed_facility_data_2022.json"
+        ampere_file.write_text(json.dumps({'facilities': self.ampere_facilities}))
+        
+        from_json = self.analyzer.load_ampere_table(2022)
+        expected = facilities_to_frame(self.ampere_facilities)[list(AMPERE_COLUMNS)]
+        pd.testing.assert_frame_equal(from_json, expected)
+        
+        parquet_file = ampere_file.with_suffix('.parquet')
+        self.assertTrue(parquet_file.exists())
+        from_parquet = self.analyzer.load_ampere_table(2022)
+        pd.testing.assert_frame_equal(from_parquet, expected)
+
+if __name__ == '__main__':
+    unittest.main()
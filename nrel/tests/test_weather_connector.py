@@ -2,59 +2,101 @@
 Unit tests for the WeatherDataConnector class.
 """
 
+import os
 import unittest
 import tempfile
-import shutil
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import pandas as pd
+import pickle
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-# Add parent directory to path for imports
+# Add parent directory to path for imports (once per process; the
+# sibling test modules and conftest.py share this setup)
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 # Also add pvlib-python if available
 pvlib_path = project_root / "pvlib-python"
-if pvlib_path.exists():
+if str(pvlib_path) not in sys.path and pvlib_path.exists():
     sys.path.insert(0, str(pvlib_path))
 
-from nrel.weather_connector import WeatherDataConnector
+from nrel.weather_connector import WeatherDataConnector, TokenBucket
 from nrel.config import Config
+from nrel.shared_store import SharedWeatherStore, attach, detach
+
+# Test weather data in the connector's default float32 precision, built once
+# and unpickled per test so each test gets its own copy without re-running
+# DataFrame construction
+_TEST_WEATHER_BYTES = pickle.dumps(pd.DataFrame({
+    'ghi': [100, 200, 300, 400, 500],
+    'dni': [150, 250, 350, 450, 550], 
+    'dhi': [50, 100, 150, 200, 250],
+    'temp_air': [15, 20, 25, 30, 25],
+    'wind_speed': [2, 3, 4, 5, 4]
+}, index=pd.date_range('2023-01-01', periods=5, freq='H', tz='UTC'), dtype='float32'), protocol=5)
+
+def _df_fingerprint(df):
+    """Return column names plus a vectorized hash of the values of ``df``."""
+    hashes = pd.util.hash_pandas_object(df.reset_index(drop=True), index=False)
+    return tuple(df.columns), hashes.to_numpy().tobytes()
+
+def _clear_cache_dir(path):
+    """Delete cache files, the cache index and the SQLite store in a single directory scan."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if (entry.name.endswith(('.feather', '.parquet', '.pkl'))
+                    or entry.name.startswith(('cache_index.sqlite', 'weather_cache.sqlite'))):
+                os.unlink(entry.path)
 
 class TestWeatherDataConnector(unittest.TestCase):
     """Test cases for WeatherDataConnector."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create temporary directory for cache
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all tests."""
+        # Create temporary directory for cache, in RAM (tmpfs) when available
+        # so cache writes don't hit the disk
+        base_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+        cls._temp_dir_ctx = tempfile.TemporaryDirectory(dir=base_dir)
+        cls.addClassCleanup(cls._temp_dir_ctx.cleanup)
+        cls.temp_dir = cls._temp_dir_ctx.name
         
         # Mock config to use temp directory
-        self.original_cache_dir = Config().cache_dir
-        Config().cache_dir = Path(self.temp_dir)
-        
-        # Clear any existing cache files in temp directory
-        for pattern in ["*.parquet", "*.pkl"]:
-            for cache_file in Path(self.temp_dir).glob(pattern):
-                cache_file.unlink()
-        
-        # Create test weather data
-        self.test_weather_data = pd.DataFrame({
-            'ghi': [100, 200, 300, 400, 500],
-            'dni': [150, 250, 350, 450, 550], 
-            'dhi': [50, 100, 150, 200, 250],
-            'temp_air': [15, 20, 25, 30, 25],
-            'wind_speed': [2, 3, 4, 5, 4]
-        }, index=pd.date_range('2023-01-01', periods=5, freq='H', tz='UTC'))
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-        # Restore original cache directory
-        Config().cache_dir = self.original_cache_dir
-        
-        # Remove temporary directory
-        shutil.rmtree(self.temp_dir)
+        cls.config = Config()
+        cls.original_cache_dir = cls.config.cache_dir
+        cls.config.cache_dir = Path(cls.temp_dir)
+        
+        # Mock the HTTP fetchers once for the whole class; by default they
+        # return the test weather data
+        weather_data = pickle.loads(_TEST_WEATHER_BYTES)
+        cls.mock_fetch_psm3 = MagicMock(return_value=(weather_data, {'Station Name': 'Test Station'}))
+        cls.mock_fetch_pvgis_tmy = MagicMock(return_value=(weather_data, {'location': 'Test Location'}))
+        patcher = patch.multiple('nrel.weather_connector.WeatherDataConnector',
+                                 _fetch_psm3=cls.mock_fetch_psm3,
+                                 _fetch_pvgis_tmy=cls.mock_fetch_pvgis_tmy)
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up shared fixtures."""
+        # Restore original cache directory (the temporary directory itself
+        # is removed by the class cleanup)
+        cls.config.cache_dir = cls.original_cache_dir
+    
+    def setUp(self):
+        """Start each test with an empty cache directory and fresh data."""
+        _clear_cache_dir(self.temp_dir)
+        
+        self.test_weather_data = pickle.loads(_TEST_WEATHER_BYTES)
+        
+        # Only call records are reset; tests that need other responses
+        # override return_value or side_effect themselves
+        self.mock_fetch_psm3.reset_mock()
+        self.mock_fetch_pvgis_tmy.reset_mock()
     
     def test_initialization(self):
         """Test WeatherDataConnector initialization."""
@@ -81,34 +123,27 @@ class TestWeatherDataConnector(unittest.TestCase):
         """Test input validation."""
         connector = WeatherDataConnector()
         
-        # Valid inputs should not raise
+        # Valid inputs should not raise (checked directly so no data is fetched)
         try:
-            connector.get_weather_data(40.0, -105.0)
+            connector._validate_coordinates(40.0, -105.0)
         except ValueError:
             self.fail("Valid coordinates raised ValueError")
-        except Exception:
-            # Other exceptions are OK (API might fail in tests)
-            pass
         
-        # Invalid latitude
-        with self.assertRaises(ValueError):
-            connector.get_weather_data(91.0, -105.0)
-        
-        with self.assertRaises(ValueError):
-            connector.get_weather_data(-91.0, -105.0)
-        
-        # Invalid longitude
-        with self.assertRaises(ValueError):
-            connector.get_weather_data(40.0, 181.0)
-        
-        with self.assertRaises(ValueError):
-            connector.get_weather_data(40.0, -181.0)
+        # Invalid latitudes, then invalid longitudes
+        invalid_coordinates = [
+            (91.0, -105.0),
+            (-91.0, -105.0),
+            (40.0, 181.0),
+            (40.0, -181.0)
+        ]
+        
+        for lat, lon in invalid_coordinates:
+            with self.subTest(lat=lat, lon=lon), self.assertRaises(ValueError):
+                connector.get_weather_data(lat, lon)
     
-    @patch('nrel.weather_connector.pvlib.iotools.get_psm3')
-    def test_nsrdb_data_fetch(self, mock_get_psm3):
+    def test_nsrdb_data_fetch(self):
         """Test NSRDB data fetching."""
-        # Mock successful NSRDB response
-        mock_get_psm3.return_value = (self.test_weather_data, {'Station Name': 'Test Station'})
+        mock_fetch_psm3 = self.mock_fetch_psm3
         
         connector = WeatherDataConnector(enable_cache=False)
         
@@ -117,31 +152,115 @@ class TestWeatherDataConnector(unittest.TestCase):
         
         self.assertIsInstance(result, pd.DataFrame)
         self.assertEqual(len(result), 5)
-        mock_get_psm3.assert_called_once()
+        mock_fetch_psm3.assert_called_once()
     
-    @patch('nrel.weather_connector.pvlib.iotools.get_pvgis_tmy')
-    def test_pvgis_data_fetch(self, mock_get_pvgis):
+    def test_pvgis_data_fetch(self):
         """Test PVGIS data fetching."""
-        # Mock successful PVGIS response (newer version returns only 2 values)
-        mock_get_pvgis.return_value = (
-            self.test_weather_data, 
-            {'location': 'Test Location'}
-        )
+        mock_fetch_pvgis = self.mock_fetch_pvgis_tmy
         
         connector = WeatherDataConnector()
         result = connector._get_pvgis_data(52.5, 13.4)
         
         self.assertIsInstance(result, pd.DataFrame)
         self.assertEqual(len(result), 5)
-        mock_get_pvgis.assert_called_once()
+        mock_fetch_pvgis.assert_called_once()
+    
+    def test_batch_fetch(self):
+        """Test batch fetching with repeated locations and a failing source."""
+        connector = WeatherDataConnector(primary_source='pvgis', fallback_sources=[],
+                                         enable_cache=False)
+        locations = [(52.5, 13.4, None), (48.1, 11.6, None), (52.5, 13.4, None)]
+        
+        self.mock_fetch_pvgis_tmy.side_effect = [
+            self.mock_fetch_pvgis_tmy.return_value, Exception("PVGIS unavailable")
+        ]
+        try:
+            with patch.object(connector, '_enforce_rate_limit'):
+                results = connector.get_weather_data_batch(locations)
+        finally:
+            self.mock_fetch_pvgis_tmy.side_effect = None
+        
+        # Each unique location is requested once; failures come back as None
+        self.assertEqual(self.mock_fetch_pvgis_tmy.call_count, 2)
+        self.assertEqual(len(results), 3)
+        self.assertIs(results[0] is None, results[2] is None)
+        self.assertEqual(sum(result is None for result in results[:2]), 1)
+        
+        # Sources are reported per location on request
+        with patch.object(connector, '_enforce_rate_limit'):
+            results = connector.get_weather_data_batch(locations, with_source=True)
+        self.assertEqual([source for _, source in results], ['pvgis'] * 3)
+    
+    def test_multi_point_fetch(self):
+        """Test that points in one grid cell share a single request."""
+        connector = WeatherDataConnector(primary_source='pvgis', fallback_sources=[],
+                                         enable_cache=False)
+        points = [(52.501, 13.401), (52.502, 13.402), (48.1, 11.6)]
+        
+        with patch.object(connector, '_enforce_rate_limit'):
+            results = connector.get_weather_data_multi(points)
+        
+        self.assertEqual(self.mock_fetch_pvgis_tmy.call_count, 2)
+        self.assertEqual(set(results), set(points))
+        self.assertIs(results[points[0]], results[points[1]])
+        
+        with self.assertRaises(ValueError):
+            connector.get_weather_data_bbox(40.0, -110.0, 50.0, -100.0)
+    
+    def test_token_bucket(self):
+        """Test that the rate limiter only waits once the burst is used up."""
+        bucket = TokenBucket(rate=1000.0, capacity=3)
+        
+        waits = [bucket.acquire() for _ in range(4)]
+        
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertGreater(waits[3], 0.0)
+        self.assertLessEqual(waits[3], 0.001)
+    
+    def test_http_retry(self):
+        """Test that transient HTTP errors are retried with Retry-After."""
+        connector = WeatherDataConnector(enable_cache=False)
+        connector._http = MagicMock()
+        connector._http.get.side_effect = [
+            MagicMock(status_code=429, headers={'Retry-After': '2'}),
+            MagicMock(status_code=503, headers={}),
+            MagicMock(status_code=200, headers={})
+        ]
+        
+        with patch('nrel.weather_connector.time.sleep') as mock_sleep:
+            response = connector._get_with_retry('https://example.com', {}, 30)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list],
+                         [2.0, 2 * self.config.retry_delay])
+        
+        # Permanent errors are returned without retrying
+        connector._http.get.side_effect = None
+        connector._http.get.return_value = MagicMock(status_code=403, headers={})
+        with patch('nrel.weather_connector.time.sleep') as mock_sleep:
+            self.assertEqual(connector._get_with_retry('https://example.com', {}, 30).status_code, 403)
+        mock_sleep.assert_not_called()
+    
+    def test_http_session_reused(self):
+        """Test that requests share one pooled session until closed."""
+        with WeatherDataConnector(enable_cache=False) as connector:
+            session = connector.http
+            self.assertIs(connector.http, session)
+        
+        self.assertIsNone(connector._http)
     
     def test_data_validation(self):
         """Test weather data validation."""
         connector = WeatherDataConnector()
         
-        # Valid data should pass
+        # Valid data should pass, with values in the connector's precision
         valid_data = connector._validate_weather_data(self.test_weather_data, 'test')
         self.assertIsInstance(valid_data, pd.DataFrame)
+        self.assertTrue((valid_data.dtypes == 'float32').all())
+        
+        full_precision = WeatherDataConnector(precision='float64')
+        valid_data = full_precision._validate_weather_data(self.test_weather_data, 'test')
+        self.assertTrue((valid_data.dtypes == 'float64').all())
         
         # Empty data should fail
         with self.assertRaises(ValueError):
@@ -157,7 +276,7 @@ class TestWeatherDataConnector(unittest.TestCase):
         connector = WeatherDataConnector(enable_cache=True)
         
         # Save to cache
-        connector._save_to_cache(self.test_weather_data, 40.0, -105.0, 'test', 2023)
+        connector._save_to_cache(self.test_weather_data, 40.0, -105.0, 'nsrdb', 2023)
         
         # Load from cache
         cached_data = connector._load_from_cache(40.0, -105.0, 2023)
@@ -165,13 +284,145 @@ class TestWeatherDataConnector(unittest.TestCase):
         self.assertIsNotNone(cached_data)
         self.assertEqual(len(cached_data), 5)
         
-        # Compare data content (may have different index/column dtypes after pickle/parquet)
-        pd.testing.assert_frame_equal(
-            cached_data.reset_index(drop=True), 
-            self.test_weather_data.reset_index(drop=True),
-            check_dtype=False,
-            check_index_type=False
-        )
+        # Compare data content (the index may change type after pickle/parquet/feather)
+        self.assertEqual(_df_fingerprint(cached_data), _df_fingerprint(self.test_weather_data))
+    
+    def test_memory_cache(self):
+        """Test that recently used data is served from memory."""
+        connector = WeatherDataConnector(enable_cache=True)
+        connector._save_to_cache(self.test_weather_data, 40.0, -105.0, 'nsrdb', 2023)
+        _clear_cache_dir(self.temp_dir)
+        
+        cached_data = connector._load_from_cache(40.0, -105.0, 2023)
+        self.assertIsNotNone(cached_data)
+        pd.testing.assert_frame_equal(cached_data, self.test_weather_data)
+        
+        # The memory cache is per connector and emptied by clear_cache
+        self.assertIsNone(WeatherDataConnector()._load_from_cache(40.0, -105.0, 2023))
+        connector.clear_cache()
+        self.assertIsNone(connector._load_from_cache(40.0, -105.0, 2023))
+    
+    def test_memory_cache_isolation(self):
+        """Test that writes to saved or returned frames do not reach the cache."""
+        connector = WeatherDataConnector(enable_cache=True)
+        saved = self.test_weather_data.copy()
+        connector._save_to_cache(saved, 40.0, -105.0, 'nsrdb', 2023)
+        saved.iloc[0, 0] = 999
+        self.assertEqual(connector._load_from_cache(40.0, -105.0, 2023).iloc[0, 0], 100)
+        
+        # Disk load (first) and memory hit (second)
+        connector._memory_cache.clear()
+        for _ in range(2):
+            loaded = connector._load_from_cache(40.0, -105.0, 2023)
+            self.assertEqual(loaded.iloc[0, 0], 100)
+            loaded.iloc[0, 0] = 999
+        
+        self.assertEqual(connector._load_from_cache(40.0, -105.0, 2023).iloc[0, 0], 100)
+    
+    def test_cache_version_invalidation(self):
+        """Test that a newer source data version invalidates cached entries."""
+        connector = WeatherDataConnector(enable_cache=True)
+        self.test_weather_data.attrs['source_version'] = '3.2.0'
+        connector._record_version('nsrdb', '3.2.0')
+        connector._save_to_cache(self.test_weather_data, 40.0, -105.0, 'nsrdb', 2023)
+        
+        # A fresh connector reads the version manifest from the cache index
+        self.assertIsNotNone(WeatherDataConnector()._load_from_cache(40.0, -105.0, 2023))
+        
+        connector._record_version('nsrdb', '3.2.1')
+        self.assertIsNone(WeatherDataConnector()._load_from_cache(40.0, -105.0, 2023))
+    
+    def test_cache_versioned_entry_expiry(self):
+        """Test that the age limit also applies to entries of the current version."""
+        connector = WeatherDataConnector(enable_cache=True)
+        self.test_weather_data.attrs['source_version'] = '3.2.0'
+        connector._record_version('nsrdb', '3.2.0')
+        connector._save_to_cache(self.test_weather_data, 40.0, -105.0, 'nsrdb', 2023)
+        connector._cache_index._connect().execute("UPDATE cache_index SET mtime = 0")
+        
+        self.assertIsNone(WeatherDataConnector()._load_from_cache(40.0, -105.0, 2023))
+    
+    def test_cache_nearby_locations(self):
+        """Test that cache entries serve nearby locations within tolerance."""
+        connector = WeatherDataConnector(enable_cache=True)
+        connector._save_to_cache(self.test_weather_data, 40.039, -105.0, 'nsrdb', 2023)
+        
+        # Same grid cell, and across a cell boundary (~0.2 km away)
+        self.assertIsNotNone(connector._load_from_cache(40.03, -105.0, 2023))
+        self.assertIsNotNone(connector._load_from_cache(40.041, -105.0, 2023))
+        
+        # Beyond the tolerance, or another year
+        self.assertIsNone(connector._load_from_cache(40.1, -105.0, 2023))
+        self.assertIsNone(connector._load_from_cache(40.039, -105.0, 2022))
+    
+    def test_cache_same_cell_locations(self):
+        """Test that distant locations in one grid cell keep separate entries."""
+        connector = WeatherDataConnector(enable_cache=True)
+        other_data = self.test_weather_data * 2
+        # Same 0.04 degree cell, ~5.5 km apart (beyond the tolerance)
+        connector._save_to_cache(self.test_weather_data, 40.0005, -104.9995, 'nsrdb', 2023)
+        connector._save_to_cache(other_data, 40.0395, -104.9605, 'nsrdb', 2023)
+        connector._memory_cache.clear()
+        
+        pd.testing.assert_frame_equal(connector._load_from_cache(40.0005, -104.9995, 2023),
+                                      self.test_weather_data, check_freq=False)
+        pd.testing.assert_frame_equal(connector._load_from_cache(40.0395, -104.9605, 2023),
+                                      other_data, check_freq=False)
+        self.assertEqual(connector.get_cache_info()['total_files'], 2)
+    
+    def test_sqlite_cache_operations(self):
+        """Test cache save, load and clear with the SQLite backend."""
+        cfg = self.config
+        original_backend = cfg.cache_backend
+        cfg.cache_backend = 'sqlite'
+        
+        try:
+            connector = WeatherDataConnector(enable_cache=True)
+            connector._save_to_cache(self.test_weather_data, 40.0, -105.0, 'nsrdb', 2023)
+            
+            cached_data = connector._load_from_cache(40.0, -105.0, 2023)
+            self.assertIsNotNone(cached_data)
+            pd.testing.assert_frame_equal(cached_data, self.test_weather_data, check_freq=False)
+            
+            # Other years and locations are not served from the entry
+            self.assertIsNone(connector._load_from_cache(40.0, -105.0, 2022))
+            self.assertIsNone(connector._load_from_cache(41.0, -105.0, 2023))
+            
+            cache_info = connector.get_cache_info()
+            self.assertEqual(cache_info['total_files'], 1)
+            self.assertEqual(cache_info['files_by_source'], {'nsrdb': 1})
+            
+            self.assertEqual(connector.clear_cache(), 1)
+            self.assertIsNone(connector._load_from_cache(40.0, -105.0, 2023))
+        finally:
+            cfg.cache_backend = original_backend
+    
+    def test_sqlite_cache_batch_threads(self):
+        """Test that batch fetch worker threads can use the SQLite backend."""
+        cfg = self.config
+        original_backend = cfg.cache_backend
+        cfg.cache_backend = 'sqlite'
+        
+        try:
+            connector = WeatherDataConnector(primary_source='pvgis', fallback_sources=[],
+                                             enable_cache=True)
+            # Open the connection on this thread before the workers use it
+            self.assertIsNone(connector._load_from_cache(52.5, 13.4, None))
+            
+            locations = [(52.5, 13.4, None), (48.1, 11.6, None)]
+            with patch.object(connector, '_enforce_rate_limit'):
+                results = connector.get_weather_data_batch(locations)
+            self.assertTrue(all(result is not None for result in results))
+            self.assertEqual(connector.get_cache_info()['files_by_source'], {'pvgis': 2})
+            
+            # Entries written by the workers are readable from other threads
+            connector._memory_cache.clear()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                cached = list(executor.map(lambda loc: connector._load_from_disk_cache(*loc),
+                                           locations))
+            self.assertTrue(all(data is not None for data in cached))
+        finally:
+            cfg.cache_backend = original_backend
     
     def test_cache_disabled(self):
         """Test behavior when cache is disabled."""
@@ -184,18 +435,29 @@ class TestWeatherDataConnector(unittest.TestCase):
         cached_data = connector._load_from_cache(40.0, -105.0, 2023)
         self.assertIsNone(cached_data)
     
+    def _populate_cache(self, connector):
+        """Write one NSRDB and one PVGIS cache entry concurrently."""
+        entries = [
+            (40.0, -105.0, 'nsrdb', 2023),
+            (52.5, 13.4, 'pvgis', None)
+        ]
+        
+        # Arrow encoding and file writes release the GIL
+        with ThreadPoolExecutor(max_workers=len(entries)) as executor:
+            list(executor.map(
+                lambda entry: connector._save_to_cache(self.test_weather_data, *entry),
+                entries
+            ))
+    
     def test_cache_info(self):
         """Test cache information retrieval."""
         # Clear any existing cache files first
-        for pattern in ["*.parquet", "*.pkl"]:
-            for cache_file in Path(self.temp_dir).glob(pattern):
-                cache_file.unlink()
+        _clear_cache_dir(self.temp_dir)
         
         connector = WeatherDataConnector(enable_cache=True)
         
         # Save some test data
-        connector._save_to_cache(self.test_weather_data, 40.0, -105.0, 'nsrdb', 2023)
-        connector._save_to_cache(self.test_weather_data, 52.5, 13.4, 'pvgis')
+        self._populate_cache(connector)
         
         cache_info = connector.get_cache_info()
         
@@ -205,18 +467,40 @@ class TestWeatherDataConnector(unittest.TestCase):
         self.assertIn('nsrdb', cache_info['files_by_source'])
         self.assertIn('pvgis', cache_info['files_by_source'])
     
+    def test_unindexed_cache_files(self):
+        """Test that cache files missing from the index are counted and aged."""
+        connector = WeatherDataConnector(enable_cache=True)
+        self._populate_cache(connector)
+        
+        old_stray = Path(self.temp_dir) / 'nsrdb_400000_-1050000_2022.feather'
+        new_stray = Path(self.temp_dir) / 'pvgis_400000_-1050000_tmy.parquet'
+        old_stray.write_bytes(b'old')
+        new_stray.write_bytes(b'new')
+        os.utime(old_stray, (0, 0))
+        
+        cache_info = connector.get_cache_info()
+        self.assertEqual(cache_info['total_files'], 4)
+        self.assertEqual(cache_info['files_by_source'], {'nsrdb': 2, 'pvgis': 2})
+        
+        self.assertEqual(connector.clear_cache(older_than_days=1), 1)
+        self.assertFalse(old_stray.exists())
+        self.assertTrue(new_stray.exists())
+        self.assertEqual(connector.clear_cache(), 3)
+        
+        # A file whose index update fails is not left behind
+        with patch.object(connector._cache_index, 'put', side_effect=OSError("disk I/O error")):
+            connector._save_to_cache(self.test_weather_data, 40.0, -105.0, 'nsrdb', 2023)
+        self.assertEqual(connector.get_cache_info()['total_files'], 0)
+    
     def test_clear_cache(self):
         """Test cache clearing functionality."""
         # Clear any existing cache files first
-        for pattern in ["*.parquet", "*.pkl"]:
-            for cache_file in Path(self.temp_dir).glob(pattern):
-                cache_file.unlink()
+        _clear_cache_dir(self.temp_dir)
         
         connector = WeatherDataConnector(enable_cache=True)
         
         # Save some test data
-        connector._save_to_cache(self.test_weather_data, 40.0, -105.0, 'test1', 2023)
-        connector._save_to_cache(self.test_weather_data, 52.5, 13.4, 'test2')
+        self._populate_cache(connector)
         
         # Verify files exist
         cache_info = connector.get_cache_info()
@@ -229,6 +513,20 @@ class TestWeatherDataConnector(unittest.TestCase):
         # Verify cache is empty
         cache_info = connector.get_cache_info()
         self.assertEqual(cache_info['total_files'], 0)
+    
+    def test_shared_store(self):
+        """Test publishing weather data to shared memory and attaching to it."""
+        with SharedWeatherStore() as store:
+            handle = store.publish((1, 2, 2023), self.test_weather_data)
+            self.assertIs(store.publish((1, 2, 2023), self.test_weather_data), handle)
+            
+            # Handles are sent to pool workers, so they must pickle
+            handle = pickle.loads(pickle.dumps(handle))
+            shared = attach(handle)
+            pd.testing.assert_frame_equal(shared, self.test_weather_data, check_freq=False)
+            with self.assertRaises(ValueError):
+                shared['ghi'].to_numpy()[0] = 0
+            detach(handle)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -5,22 +5,268 @@ This module provides comprehensive validation metrics and analysis tools for
 comparing simulated PV performance with actual facility data.
 """
 
+import functools
 import json
+import math
+import os
 import pandas as pd
 import numpy as np
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Any, Tuple, Union
 import sys
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import seaborn as sns
-from scipy import stats
-from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
+
+# orjson is an optional, much faster JSON parser; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# pyarrow is optional; without it processed Ampere data is always read from JSON
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+# ijson allows streaming simulation results without holding the whole file
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Add the project root to the path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from nrel.data_utils import load_ampere_facilities
+
+# Set up plotting style once rather than on every plot call
+plt.style.use('seaborn-v0_8')
+
+
+# Flat per-facility schema shared by simulation results and Ampere data
+FACILITY_COLUMNS = (
+    'facility_id', 'success', 'annual_energy_kwh', 'specific_yield', 'capacity_factor',
+    'energy_max', 'energy_sum', 'energy_mean', 'energy_count', 'energy_summary_count',
+    'pac_mean', 'pac_count'
+)
+
+# Columns of the flattened processed Ampere data (no simulation outputs)
+AMPERE_COLUMNS = (
+    'facility_id', 'success', 'energy_max', 'energy_sum', 'energy_mean', 'energy_count',
+    'energy_summary_count', 'pac_mean', 'pac_count'
+)
+
+
+class FacilityReadings(NamedTuple):
+    """Flat view of the Energy and Pac reading summaries of one facility"""
+    energy_max: float
+    energy_sum: float
+    energy_mean: float
+    energy_count: float
+    energy_summary_count: float
+    pac_mean: float
+    pac_count: float
+    
+    @classmethod
+    def from_facility(cls, facility: Dict[str, Any]) -> 'FacilityReadings':
+        """Build the view from a processed facility record (missing values are NaN)"""
+        nan = np.nan
+        readings = facility.get('readings', {})
+        energy = readings.get('Energy', {})
+        energy_summary = energy.get('summary', {})
+        pac = readings.get('Pac', {})
+        return cls(
+            energy_summary.get('max', nan),
+            energy_summary.get('sum', nan),
+            energy_summary.get('mean', 0),
+            energy.get('count', 0),
+            energy_summary.get('count', 1),
+            pac.get('summary', {}).get('mean', nan),
+            pac.get('count', 0)
+        )
+
+
+def _facility_row(facility_id: str, facility: Dict[str, Any]) -> Tuple:
+    """Flatten one facility record into a FACILITY_COLUMNS row"""
+    nan = np.nan
+    return (
+        facility_id,
+        bool(facility.get('success', False)),
+        facility.get('annual_energy_kwh', nan),
+        facility.get('specific_yield', nan),
+        facility.get('capacity_factor', nan)
+    ) + FacilityReadings.from_facility(facility)
+
+
+def facilities_to_frame(facilities: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Flatten a facilities dict into a table with the FACILITY_COLUMNS schema
+    
+    Args:
+        facilities: Facility records keyed by facility ID
+        
+    Returns:
+        DataFrame with one row per facility
+    """
+    n_facilities = len(facilities)
+    facility_ids = np.empty(n_facilities, dtype=object)
+    success = np.empty(n_facilities, dtype=bool)
+    values = np.empty((n_facilities, len(FACILITY_COLUMNS) - 2), dtype=np.float64)
+    
+    # Fill preallocated columns by index instead of building row lists
+    for i, (facility_id, facility) in enumerate(facilities.items()):
+        row = _facility_row(facility_id, facility)
+        facility_ids[i] = row[0]
+        success[i] = row[1]
+        values[i] = row[2:]
+    
+    frame = pd.DataFrame(values, columns=list(FACILITY_COLUMNS[2:]))
+    frame.insert(0, 'success', success)
+    frame.insert(0, 'facility_id', facility_ids)
+    return frame
+
+
+def _annual_energy_from_frame(frame: pd.DataFrame) -> np.ndarray:
+    """Annual energy in kWh for each row of a FACILITY_COLUMNS table"""
+    success = frame['success'].to_numpy(dtype=bool)
+    energy_max = frame['energy_max'].to_numpy(dtype=float)
+    energy_sum = frame['energy_sum'].to_numpy(dtype=float)
+    pac_mean = frame['pac_mean'].to_numpy(dtype=float)
+    has_energy = success & (frame['energy_count'].to_numpy(dtype=float) > 0)
+    
+    # For cumulative energy meters, use the max value as the annual total;
+    # only use sum if it's clearly not cumulative data
+    use_max = has_energy & ~np.isnan(energy_max)
+    not_cumulative = (frame['energy_mean'].to_numpy(dtype=float) *
+                      frame['energy_summary_count'].to_numpy(dtype=float) <
+                      energy_sum * 0.1)
+    use_sum = has_energy & np.isnan(energy_max) & not_cumulative
+    
+    # Fallback: rough estimate of annual energy from average power
+    use_pac = success & (frame['pac_count'].to_numpy(dtype=float) > 0) & ~np.isnan(pac_mean)
+    
+    return np.select(
+        [use_max, use_sum, use_pac],
+        [energy_max, energy_sum, pac_mean * 8760],
+        default=0.0
+    )
+
+
+# Per-facility simulation result fields used by the analyzer
+SIMULATION_FIELDS = (
+    'facility_name', 'success', 'annual_energy_kwh', 'specific_yield',
+    'reference_yield', 'capacity_factor'
+)
+
+
+def _error_distribution(percent_difference: np.ndarray) -> Dict[str, float]:
+    """Describe-style statistics of per-facility percent errors"""
+    finite = percent_difference[np.isfinite(percent_difference)]
+    if len(finite) == 0:
+        return {'median_percent_difference': np.nan, 'p95_abs_percent_difference': np.nan}
+    return {
+        'median_percent_difference': float(np.median(finite)),
+        'p95_abs_percent_difference': float(np.percentile(np.abs(finite), 95))
+    }
+
+
+# Per-group accumulators behind calculate_group_metrics
+_GROUP_SUM_FIELDS = (
+    'n', 'sum_actual', 'sum_predicted', 'sum_abs_error', 'sum_sq_error',
+    'sum_abs_pct_error', 'sum_actual_sq', 'sum_predicted_sq', 'sum_cross',
+    'n_nonzero_actual'
+)
+
+
+def _group_sums_numpy(codes: np.ndarray, actual: np.ndarray, predicted: np.ndarray,
+                      out: np.ndarray) -> None:
+    """Accumulate per-group sums into ``out`` using weighted bincounts"""
+    n_groups = out.shape[1]
+    error = predicted - actual
+    abs_error = np.abs(error)
+    nonzero = actual != 0
+    abs_pct_error = np.divide(abs_error, np.abs(actual), out=np.zeros_like(error), where=nonzero)
+    weights = (None, actual, predicted, abs_error, error * error, abs_pct_error,
+               actual * actual, predicted * predicted, actual * predicted, nonzero.astype(np.float64))
+    for row, w in enumerate(weights):
+        out[row] = np.bincount(codes, weights=w, minlength=n_groups)
+
+
+def _group_sums_loop(codes: np.ndarray, actual: np.ndarray, predicted: np.ndarray,
+                     out: np.ndarray) -> None:
+    """Accumulate per-group sums into ``out`` in a single pass (compiled with numba)"""
+    out[:] = 0.0
+    for i in range(len(codes)):
+        g = codes[i]
+        a = actual[i]
+        p = predicted[i]
+        e = p - a
+        out[0, g] += 1.0
+        out[1, g] += a
+        out[2, g] += p
+        out[3, g] += abs(e)
+        out[4, g] += e * e
+        if a != 0:
+            out[5, g] += abs(e / a)
+            out[9, g] += 1.0
+        out[6, g] += a * a
+        out[7, g] += p * p
+        out[8, g] += a * p
+
+
+if njit is not None:
+    _group_sums_kernel = njit(cache=True)(_group_sums_loop)
+else:
+    _group_sums_kernel = _group_sums_numpy
+
+
+def _load_json(path) -> Any:
+    """Parse a JSON file, with orjson when available"""
+    # Read raw bytes: orjson parses bytes directly, skipping the decode step
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals json.dump writes by default
+            pass
+    return json.loads(raw)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_facility_lookup(json_path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """
+    Load the facility lookup for a pvlib_ready.json file
+    
+    The modification time and size are part of the memoization key, so
+    analyzers in one process share the lookup until the file changes. The
+    facilities are parsed with load_ampere_facilities, whose pickled copy
+    next to the JSON file lets later runs skip JSON parsing.
+    
+    Args:
+        json_path: Path of pvlib_ready.json
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        
+    Returns:
+        Read-only mapping of facility metadata keyed by facility ID. It is
+        shared between analyzers, so the facility records must not be modified.
+    """
+    facilities = load_ampere_facilities(json_path)
+    return MappingProxyType({facility['id']: facility for facility in facilities})
+
 
 class ValidationAnalyzer:
     """Validates pvlib simulation results against Ampere facility data"""
@@ -39,23 +285,31 @@ class ValidationAnalyzer:
         
         # Load pvlib_ready.json for facility metadata
         self.facility_metadata = self._load_facility_metadata()
+        self._facility_power_kw = None
+        self._figures = {}
+        self._annual_energy_cache = None
         
-    def _load_facility_metadata(self) -> Dict[str, Any]:
+    def _load_facility_metadata(self) -> Mapping[str, Any]:
         """Load facility metadata from pvlib_ready.json"""
         pvlib_ready_path = self.ampere_temp_dir / "pvlib_ready.json"
         
         if not pvlib_ready_path.exists():
             raise FileNotFoundError(f"pvlib_ready.json not found at {pvlib_ready_path}")
         
-        with open(pvlib_ready_path, 'r') as f:
-            data = json.load(f)
-        
-        # Create facility lookup by ID
-        facility_lookup = {}
-        for facility in data.get('facilities', []):
-            facility_lookup[facility['id']] = facility
-        
-        return facility_lookup
+        stat = pvlib_ready_path.stat()
+        return _read_facility_lookup(str(pvlib_ready_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    
+    @property
+    def facility_power_kw(self) -> pd.Series:
+        """Facility power ratings in kW indexed by facility ID, built once"""
+        if self._facility_power_kw is None:
+            metadata = self.facility_metadata
+            power = np.fromiter(
+                (facility.get('facility_power_kw', 0) for facility in metadata.values()),
+                dtype=np.float64, count=len(metadata)
+            )
+            self._facility_power_kw = pd.Series(power, index=list(metadata), name='facility_power_kw')
+        return self._facility_power_kw
     
     def calculate_annual_energy_from_readings(self, facility_data: Dict[str, Any]) -> float:
         """
@@ -70,31 +324,24 @@ class ValidationAnalyzer:
         if not facility_data.get('success', False):
             return 0.0
         
-        readings = facility_data.get('readings', {})
+        readings = FacilityReadings.from_facility(facility_data)
         
         # Try to get energy from Energy readings first
-        energy_readings = readings.get('Energy', {})
-        if energy_readings.get('count', 0) > 0:
-            energy_summary = energy_readings.get('summary', {})
+        if readings.energy_count > 0:
             # For cumulative energy meters, use the max value as the annual total
-            if 'max' in energy_summary:
-                return energy_summary['max']
-            elif 'sum' in energy_summary:
-                # Only use sum if it's clearly not cumulative data
-                # (check if mean is much smaller than sum)
-                if energy_summary.get('mean', 0) * energy_summary.get('count', 1) < energy_summary['sum'] * 0.1:
-                    return energy_summary['sum']
+            if not math.isnan(readings.energy_max):
+                return readings.energy_max
+            # Only use sum if it's clearly not cumulative data
+            # (check if mean is much smaller than sum)
+            if readings.energy_mean * readings.energy_summary_count < readings.energy_sum * 0.1:
+                return readings.energy_sum
         
         # Fallback: try to estimate from power readings
-        pac_readings = readings.get('Pac', {})
-        if pac_readings.get('count', 0) > 0:
-            pac_summary = pac_readings.get('summary', {})
-            if 'mean' in pac_summary:
-                # Estimate annual energy from average power
-                # This is a rough approximation
-                avg_power_kw = pac_summary['mean']
-                hours_per_year = 8760
-                return avg_power_kw * hours_per_year
+        if readings.pac_count > 0 and not math.isnan(readings.pac_mean):
+            # Estimate annual energy from average power
+            # This is a rough approximation
+            hours_per_year = 8760
+            return readings.pac_mean * hours_per_year
         
         return 0.0
     
@@ -127,22 +374,49 @@ class ValidationAnalyzer:
             results_file: Specific results file to load (optional)
             
         Returns:
-            Dictionary with simulation results
+            Dictionary with simulation results. Facility records only keep
+            SIMULATION_FIELDS; the file is streamed when ijson is installed.
         """
         if results_file:
             results_path = self.nrel_results_dir / results_file
         else:
-            # Find the most recent results file
-            results_files = list(self.nrel_results_dir.glob("simulation_results_*.json"))
-            if not results_files:
-                raise FileNotFoundError("No simulation results files found")
-            
-            results_path = max(results_files, key=lambda f: f.stat().st_mtime)
+            # Find the most recent results file in a single directory scan
+            # (DirEntry caches its stat result)
+            with os.scandir(self.nrel_results_dir) as entries:
+                results_files = [
+                    entry for entry in entries
+                    if entry.name.startswith('simulation_results_') and entry.name.endswith('.json')
+                ]
+                if not results_files:
+                    raise FileNotFoundError("No simulation results files found")
+                
+                latest = max(results_files, key=lambda entry: entry.stat().st_mtime_ns)
+            results_path = Path(latest.path)
         
         print(f"Loading simulation results from: {results_path}")
         
-        with open(results_path, 'r') as f:
-            return json.load(f)
+        def project(items):
+            # Keep only the fields the analyzer uses
+            return {
+                facility_id: {key: facility[key] for key in SIMULATION_FIELDS if key in facility}
+                for facility_id, facility in items
+            }
+        
+        if ijson is not None:
+            try:
+                with open(results_path, 'rb') as f:
+                    summary = next(ijson.items(f, 'summary', use_float=True), {})
+                    f.seek(0)
+                    facilities = project(ijson.kvitems(f, 'facilities', use_float=True))
+                return {'summary': summary, 'facilities': facilities}
+            except ijson.JSONError:
+                # ijson rejects the NaN/Infinity literals json.dump writes for
+                # failed simulations; parse the whole file instead
+                pass
+        
+        results = _load_json(results_path)
+        return {'summary': results.get('summary', {}),
+                'facilities': project(results.get('facilities', {}).items())}
     
     def load_ampere_data(self, year: int = 2022) -> Dict[str, Any]:
         """
@@ -161,90 +435,201 @@ class ValidationAnalyzer:
         
         print(f"Loading Ampere data from: {ampere_file}")
         
-        with open(ampere_file, 'r') as f:
-            return json.load(f)
+        return _load_json(ampere_file)
+    
+    def load_ampere_table(self, year: int = 2022) -> pd.DataFrame:
+        """
+        Load processed Ampere facility data for a specific year as a flat table
+        
+        The first call flattens processed_facility_data_{year}.json into a
+        Parquet file with the AMPERE_COLUMNS schema next to it. Later calls
+        read only those columns from the Parquet file, until the JSON file
+        is modified again.
+        
+        Args:
+            year: Year to load data for
+            
+        Returns:
+            DataFrame with one row per facility and AMPERE_COLUMNS columns
+        """
+        ampere_file = self.ampere_temp_dir / f"processed_facility_data_{year}.json"
+        parquet_file = ampere_file.with_suffix('.parquet')
+        
+        if pq is not None and parquet_file.exists() and (
+                not ampere_file.exists() or
+                parquet_file.stat().st_mtime_ns >= ampere_file.stat().st_mtime_ns):
+            print(f"Loading Ampere data from: {parquet_file}")
+            return pq.read_table(parquet_file, columns=list(AMPERE_COLUMNS)).to_pandas()
+        
+        ampere_data = self.load_ampere_data(year)
+        table = facilities_to_frame(ampere_data.get('facilities', {}))[list(AMPERE_COLUMNS)]
+        
+        if pq is not None:
+            try:
+                table.to_parquet(parquet_file, index=False)
+            except OSError as e:
+                print(f"Warning: Could not write {parquet_file}: {e}")
+        
+        return table
+    
+    @staticmethod
+    def _ampere_table(ampere_data: Union[Dict[str, Any], pd.DataFrame]) -> pd.DataFrame:
+        """Return Ampere data as a flat table, flattening a loaded dict if needed"""
+        if isinstance(ampere_data, pd.DataFrame):
+            return ampere_data
+        return facilities_to_frame(ampere_data.get('facilities', {}))
+    
+    def _ampere_annual_energy(self, ampere_data: Union[Dict[str, Any], pd.DataFrame]) -> pd.Series:
+        """
+        Annual energy of every facility in the Ampere data, computed once
+        
+        The result is cached for the most recent ampere_data object, so
+        match_facilities and both validators share one calculation.
+        
+        Args:
+            ampere_data: Ampere facility data (loaded dict or load_ampere_table result)
+            
+        Returns:
+            Series of annual energy in kWh indexed by facility ID
+        """
+        cached = self._annual_energy_cache
+        if cached is not None and cached[0] is ampere_data:
+            return cached[1]
+        
+        table = self._ampere_table(ampere_data)
+        annual_energy = pd.Series(_annual_energy_from_frame(table),
+                                  index=table['facility_id'].to_numpy(), name='actual_kwh')
+        self._annual_energy_cache = (ampere_data, annual_energy)
+        return annual_energy
     
     def match_facilities(self, sim_results: Dict[str, Any], 
-                        ampere_data: Dict[str, Any]) -> List[str]:
+                        ampere_data: Union[Dict[str, Any], pd.DataFrame]) -> List[str]:
         """
         Find facilities that exist in both simulation and Ampere datasets
         
         Args:
             sim_results: Simulation results data
-            ampere_data: Ampere facility data
+            ampere_data: Ampere facility data (loaded dict or load_ampere_table result)
             
         Returns:
             List of facility IDs that exist in both datasets
         """
-        sim_facilities = set(sim_results.get('facilities', {}).keys())
-        ampere_facilities = set(ampere_data.get('facilities', {}).keys())
+        sim_table = facilities_to_frame(sim_results.get('facilities', {}))
+        ampere_energy = self._ampere_annual_energy(ampere_data)
         
-        # Find facilities with successful data in both datasets
-        matched_facilities = []
+        # Inner join on facility ID, keeping facilities with successful
+        # simulations
+        joined = sim_table.loc[sim_table['success'].to_numpy(), ['facility_id']].merge(
+            ampere_energy.rename_axis('facility_id').reset_index(), on='facility_id', how='inner'
+        )
         
-        for facility_id in sim_facilities.intersection(ampere_facilities):
-            sim_facility = sim_results['facilities'].get(facility_id, {})
-            ampere_facility = ampere_data['facilities'].get(facility_id, {})
-            
-            # Check if both have successful data
-            if (sim_facility.get('success', False) and 
-                ampere_facility.get('success', False)):
-                
-                # Calculate annual energy from Ampere data
-                annual_energy = self.calculate_annual_energy_from_readings(ampere_facility)
-                
-                if annual_energy > 0:
-                    matched_facilities.append(facility_id)
+        # Keep facilities with positive annual energy in the Ampere data
+        # (unsuccessful Ampere facilities have zero energy)
+        matched_facilities = joined['facility_id'].to_numpy()[joined['actual_kwh'].to_numpy() > 0].tolist()
         
         print(f"Found {len(matched_facilities)} facilities with data in both datasets")
         return matched_facilities
     
     def calculate_validation_metrics(self, actual_values: np.ndarray, 
-                                   predicted_values: np.ndarray) -> Dict[str, float]:
+                                   predicted_values: np.ndarray,
+                                   include_p_value: bool = True) -> Dict[str, float]:
         """
         Calculate comprehensive validation metrics
         
+        All metrics are derived from a handful of sums and dot products over
+        the cleaned arrays instead of separate library calls.
+        
         Args:
             actual_values: Actual values from Ampere data
             predicted_values: Predicted values from simulation
+            include_p_value: Compute the correlation p-value (requires scipy);
+                             if False it is reported as NaN
             
         Returns:
             Dictionary with validation metrics
         """
+        return self._validation_metrics(actual_values, predicted_values, include_p_value)[0]
+    
+    def _validation_metrics(self, actual_values: np.ndarray, predicted_values: np.ndarray,
+                            include_p_value: bool = True) -> Tuple[Dict[str, float], float, float]:
+        """
+        Calculate validation metrics, also returning the sums they are built on
+        
+        Args:
+            actual_values: Actual values from Ampere data
+            predicted_values: Predicted values from simulation
+            include_p_value: Compute the correlation p-value
+            
+        Returns:
+            Tuple of (metrics dict, sum of actual values, sum of predicted
+            values), with the sums taken over the finite points used
+        """
         # Remove any NaN or infinite values
         mask = np.isfinite(actual_values) & np.isfinite(predicted_values)
         actual_clean = actual_values[mask]
         predicted_clean = predicted_values[mask]
         
-        if len(actual_clean) == 0:
-            return {'error': 'No valid data points for comparison'}
+        n = len(actual_clean)
+        if n == 0:
+            return {'error': 'No valid data points for comparison'}, 0.0, 0.0
+        
+        # Shared sums
+        sum_actual = actual_clean.sum()
+        sum_predicted = predicted_clean.sum()
+        mean_actual = sum_actual / n
+        mean_predicted = sum_predicted / n
+        error = predicted_clean - actual_clean
+        actual_dev = actual_clean - mean_actual
+        predicted_dev = predicted_clean - mean_predicted
+        ss_error = error @ error
+        ss_actual = actual_dev @ actual_dev
+        ss_predicted = predicted_dev @ predicted_dev
+        cross = actual_dev @ predicted_dev
         
         # Basic error metrics
-        mae = mean_absolute_error(actual_clean, predicted_clean)
-        mse = mean_squared_error(actual_clean, predicted_clean)
+        mae = np.abs(error).sum() / n
+        mse = ss_error / n
         rmse = np.sqrt(mse)
         
         # Relative error metrics
-        mape = np.mean(np.abs((actual_clean - predicted_clean) / actual_clean)) * 100
+        # (zero actual values are excluded rather than producing inf)
+        nonzero = actual_clean != 0
+        abs_pct_error = np.divide(np.abs(error), np.abs(actual_clean),
+                                  out=np.zeros_like(error), where=nonzero)
+        n_nonzero = np.count_nonzero(nonzero)
+        mape = abs_pct_error.sum() / n_nonzero * 100 if n_nonzero else np.nan
         
         # Bias metrics
-        mean_bias = np.mean(predicted_clean - actual_clean)
-        percent_bias = (mean_bias / np.mean(actual_clean)) * 100
-        
-        # Correlation metrics
-        correlation, p_value = stats.pearsonr(actual_clean, predicted_clean)
-        r2 = r2_score(actual_clean, predicted_clean)
-        
-        # Agreement metrics
-        mean_actual = np.mean(actual_clean)
-        mean_predicted = np.mean(predicted_clean)
+        mean_bias = mean_predicted - mean_actual
+        percent_bias = (mean_bias / mean_actual) * 100
+        
+        # Correlation metrics (R² follows sklearn's r2_score for constant actuals)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            correlation = cross / np.sqrt(ss_actual * ss_predicted)
+        if ss_actual > 0:
+            r2 = 1 - ss_error / ss_actual
+        else:
+            r2 = 1.0 if ss_error == 0 else 0.0
+        
+        # Two-sided p-value of the correlation from its t statistic, as
+        # scipy.stats.pearsonr reports it
+        p_value = np.nan
+        if include_p_value and np.isfinite(correlation):
+            if n == 2:
+                p_value = 1.0
+            elif abs(correlation) >= 1:
+                p_value = 0.0
+            elif n > 2:
+                from scipy import stats
+                t = correlation * np.sqrt((n - 2) / (1 - correlation * correlation))
+                p_value = 2 * stats.t.sf(abs(t), n - 2)
         
         # Normalized metrics
         nrmse = rmse / mean_actual
         nmae = mae / mean_actual
         
-        return {
-            'n_points': len(actual_clean),
+        metrics = {
+            'n_points': n,
             'mae': mae,
             'mse': mse,
             'rmse': rmse,
@@ -260,136 +645,261 @@ class ValidationAnalyzer:
             'mean_predicted': mean_predicted,
             'ratio_predicted_actual': mean_predicted / mean_actual if mean_actual != 0 else np.nan
         }
+        return metrics, sum_actual, sum_predicted
+    
+    def calculate_group_metrics(self, actual_values: np.ndarray,
+                                predicted_values: np.ndarray,
+                                groups: np.ndarray) -> pd.DataFrame:
+        """
+        Calculate validation metrics separately for each group of points
+        
+        Useful for per-month or per-cluster breakdowns, where calling
+        calculate_validation_metrics per group would be dominated by call
+        overhead. All groups are accumulated in one pass (a Numba kernel when
+        numba is installed).
+        
+        Args:
+            actual_values: Actual values from Ampere data
+            predicted_values: Predicted values from simulation
+            groups: Group label for each point; points with a missing label
+                    are left out
+            
+        Returns:
+            DataFrame of validation metrics indexed by group label
+            (without the correlation p-value)
+        """
+        actual_values = np.asarray(actual_values, dtype=np.float64)
+        predicted_values = np.asarray(predicted_values, dtype=np.float64)
+        
+        # Remove any NaN or infinite values
+        mask = np.isfinite(actual_values) & np.isfinite(predicted_values)
+        codes, labels = pd.factorize(np.asarray(groups)[mask], sort=True)
+        
+        # Points with a missing (NaN/None) group label are coded -1 and
+        # belong to no group
+        grouped = codes >= 0
+        sums = np.empty((len(_GROUP_SUM_FIELDS), len(labels)), dtype=np.float64)
+        _group_sums_kernel(codes[grouped].astype(np.intp), actual_values[mask][grouped],
+                           predicted_values[mask][grouped], sums)
+        n, sa, sp, sabs, ssq, spct, saa, spp, sap, n_nonzero = sums
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_actual = sa / n
+            mean_predicted = sp / n
+            mae = sabs / n
+            mse = ssq / n
+            rmse = np.sqrt(mse)
+            mean_bias = mean_predicted - mean_actual
+            ss_actual = np.maximum(saa - sa * mean_actual, 0.0)
+            ss_predicted = np.maximum(spp - sp * mean_predicted, 0.0)
+            cross = sap - sa * mean_predicted
+            r2 = np.where(ss_actual > 0, 1 - ssq / ss_actual, np.where(ssq == 0, 1.0, 0.0))
+            
+            return pd.DataFrame({
+                'n_points': n.astype(np.int64),
+                'mae': mae,
+                'mse': mse,
+                'rmse': rmse,
+                'mape': spct / n_nonzero * 100,
+                'mean_bias': mean_bias,
+                'percent_bias': mean_bias / mean_actual * 100,
+                'correlation': cross / np.sqrt(ss_actual * ss_predicted),
+                'r2_score': r2,
+                'nrmse': rmse / mean_actual,
+                'nmae': mae / mean_actual,
+                'mean_actual': mean_actual,
+                'mean_predicted': mean_predicted,
+                'ratio_predicted_actual': np.where(mean_actual != 0, mean_predicted / mean_actual, np.nan)
+            }, index=pd.Index(labels, name='group'))
+    
+    def annual_energy_from_readings(self, ampere_facilities: Dict[str, Any],
+                                    facility_ids: List[str]) -> pd.Series:
+        """
+        Vectorized version of calculate_annual_energy_from_readings
+        
+        Args:
+            ampere_facilities: Processed facility data keyed by facility ID
+            facility_ids: Facility IDs to calculate annual energy for
+            
+        Returns:
+            Series of annual energy in kWh indexed by facility ID
+        """
+        frame = facilities_to_frame(
+            {facility_id: ampere_facilities[facility_id] for facility_id in facility_ids}
+        )
+        return pd.Series(_annual_energy_from_frame(frame), index=frame['facility_id'].to_numpy(),
+                         name='actual_kwh')
+    
+    def _build_comparison_frame(self, sim_results: Dict[str, Any],
+                                ampere_data: Union[Dict[str, Any], pd.DataFrame],
+                                matched_facilities: List[str]) -> pd.DataFrame:
+        """
+        Join simulated and actual values for the matched facilities
+        
+        Args:
+            sim_results: Simulation results
+            ampere_data: Ampere facility data (loaded dict or load_ampere_table result)
+            matched_facilities: List of facility IDs to compare
+            
+        Returns:
+            DataFrame indexed by facility ID
+        """
+        sim_facilities = sim_results['facilities']
+        sim_rows = [sim_facilities[facility_id] for facility_id in matched_facilities]
+        n_rows = len(sim_rows)
+        
+        frame = pd.DataFrame({
+            'facility_name': pd.Series([f.get('facility_name', 'Unknown') for f in sim_rows], dtype=object),
+            'predicted_kwh': np.fromiter((f['annual_energy_kwh'] for f in sim_rows),
+                                         dtype=np.float64, count=n_rows),
+            'predicted_yield': np.fromiter((f['specific_yield'] for f in sim_rows),
+                                           dtype=np.float64, count=n_rows),
+            'reference_yield': pd.Series([f.get('reference_yield') for f in sim_rows], dtype=object),
+            'capacity_factor_predicted': pd.Series([f.get('capacity_factor', 0) for f in sim_rows], dtype=object),
+            'facility_power_kw': self.facility_power_kw.reindex(
+                matched_facilities, fill_value=0.0
+            ).to_numpy()
+        })
+        frame.index = pd.Index(matched_facilities, name='facility_id')
+        
+        frame['actual_kwh'] = self._ampere_annual_energy(ampere_data).loc[matched_facilities].to_numpy()
+        return frame
     
     def validate_annual_energy(self, sim_results: Dict[str, Any], 
-                             ampere_data: Dict[str, Any],
-                             matched_facilities: List[str]) -> Dict[str, Any]:
+                             ampere_data: Union[Dict[str, Any], pd.DataFrame],
+                             matched_facilities: List[str],
+                             include_comparisons: bool = True) -> Dict[str, Any]:
         """
         Validate annual energy production between simulation and actual data
         
         Args:
             sim_results: Simulation results
-            ampere_data: Ampere facility data
+            ampere_data: Ampere facility data (loaded dict or load_ampere_table result)
             matched_facilities: List of facility IDs to validate
+            include_comparisons: Build the per-facility comparison dict; if False,
+                                 only aggregates are computed and
+                                 'facility_comparisons' is None
             
         Returns:
             Dictionary with validation results
         """
-        actual_energy = []
-        predicted_energy = []
-        facility_comparisons = {}
-        
-        for facility_id in matched_facilities:
-            sim_facility = sim_results['facilities'][facility_id]
-            ampere_facility = ampere_data['facilities'][facility_id]
-            
-            # Extract annual energy values
-            actual_kwh = self.calculate_annual_energy_from_readings(ampere_facility)
-            predicted_kwh = sim_facility['annual_energy_kwh']
-            
-            actual_energy.append(actual_kwh)
-            predicted_energy.append(predicted_kwh)
-            
-            # Store individual facility comparison
-            facility_comparisons[facility_id] = {
-                'facility_name': sim_facility.get('facility_name', 'Unknown'),
-                'actual_kwh': actual_kwh,
-                'predicted_kwh': predicted_kwh,
-                'difference_kwh': predicted_kwh - actual_kwh,
-                'percent_difference': ((predicted_kwh - actual_kwh) / actual_kwh) * 100,
-                'reference_yield': sim_facility.get('reference_yield'),
-                'capacity_factor_actual': self.calculate_capacity_factor(actual_kwh, facility_id),
-                'capacity_factor_predicted': sim_facility.get('capacity_factor', 0)
-            }
+        frame = self._build_comparison_frame(sim_results, ampere_data, matched_facilities)
+        actual_energy = frame['actual_kwh'].to_numpy(dtype=float)
+        predicted_energy = frame['predicted_kwh'].to_numpy(dtype=float)
+        facility_power = frame['facility_power_kw'].to_numpy(dtype=float)
+        
+        # Per-facility comparisons computed column-wise
+        difference = predicted_energy - actual_energy
+        frame['difference_kwh'] = difference
+        frame['percent_difference'] = np.divide(difference * 100, actual_energy,
+                                                out=np.zeros_like(difference),
+                                                where=actual_energy != 0)
+        frame['capacity_factor_actual'] = np.divide(actual_energy * 100, facility_power * 8760,
+                                                    out=np.zeros_like(actual_energy),
+                                                    where=facility_power > 0)
+        
+        # Calculate validation metrics and aggregates first
+        # (totals reuse the metric sums unless non-finite values were dropped)
+        metrics, sum_actual, sum_predicted = self._validation_metrics(actual_energy, predicted_energy)
+        n = len(actual_energy)
+        if metrics.get('n_points') != n:
+            sum_actual, sum_predicted = actual_energy.sum(), predicted_energy.sum()
+        summary = {
+            'total_facilities': len(matched_facilities),
+            'total_actual_energy': float(sum_actual),
+            'total_predicted_energy': float(sum_predicted),
+            'average_actual_energy': sum_actual / n,
+            'average_predicted_energy': sum_predicted / n
+        }
+        summary.update(_error_distribution(frame['percent_difference'].to_numpy()))
         
-        # Calculate validation metrics
-        metrics = self.calculate_validation_metrics(
-            np.array(actual_energy), 
-            np.array(predicted_energy)
-        )
+        # The per-facility dict is only materialized when requested
+        facility_comparisons = None
+        if include_comparisons:
+            facility_comparisons = frame[[
+                'facility_name', 'actual_kwh', 'predicted_kwh', 'difference_kwh',
+                'percent_difference', 'reference_yield', 'capacity_factor_actual',
+                'capacity_factor_predicted'
+            ]].to_dict(orient='index')
         
         return {
             'metric_type': 'annual_energy_kwh',
             'validation_metrics': metrics,
             'facility_comparisons': facility_comparisons,
-            'summary': {
-                'total_facilities': len(matched_facilities),
-                'total_actual_energy': sum(actual_energy),
-                'total_predicted_energy': sum(predicted_energy),
-                'average_actual_energy': np.mean(actual_energy),
-                'average_predicted_energy': np.mean(predicted_energy)
-            }
+            'summary': summary
         }
     
     def validate_specific_yield(self, sim_results: Dict[str, Any], 
-                              ampere_data: Dict[str, Any],
-                              matched_facilities: List[str]) -> Dict[str, Any]:
+                              ampere_data: Union[Dict[str, Any], pd.DataFrame],
+                              matched_facilities: List[str],
+                              include_comparisons: bool = True) -> Dict[str, Any]:
         """
         Validate specific yield (kWh/kWp) between simulation and actual data
         
         Args:
             sim_results: Simulation results
-            ampere_data: Ampere facility data
+            ampere_data: Ampere facility data (loaded dict or load_ampere_table result)
             matched_facilities: List of facility IDs to validate
+            include_comparisons: Build the per-facility comparison dict; if False,
+                                 only aggregates are computed and
+                                 'facility_comparisons' is None
             
         Returns:
             Dictionary with validation results
         """
-        actual_yield = []
-        predicted_yield = []
-        facility_comparisons = {}
-        
-        for facility_id in matched_facilities:
-            sim_facility = sim_results['facilities'][facility_id]
-            ampere_facility = ampere_data['facilities'][facility_id]
-            
-            # Calculate specific yield from Ampere data
-            actual_energy = self.calculate_annual_energy_from_readings(ampere_facility)
-            facility_power = self.facility_metadata[facility_id]['facility_power_kw']
-            actual_specific_yield = actual_energy / facility_power if facility_power > 0 else 0
-            
-            # Get predicted specific yield
-            predicted_specific_yield = sim_facility['specific_yield']
-            
-            actual_yield.append(actual_specific_yield)
-            predicted_yield.append(predicted_specific_yield)
-            
-            # Store individual facility comparison
-            facility_comparisons[facility_id] = {
-                'facility_name': sim_facility.get('facility_name', 'Unknown'),
-                'actual_yield': actual_specific_yield,
-                'predicted_yield': predicted_specific_yield,
-                'difference_yield': predicted_specific_yield - actual_specific_yield,
-                'percent_difference': ((predicted_specific_yield - actual_specific_yield) / actual_specific_yield) * 100 if actual_specific_yield > 0 else 0,
-                'facility_power_kw': facility_power,
-                'reference_yield': sim_facility.get('reference_yield')
-            }
+        frame = self._build_comparison_frame(sim_results, ampere_data, matched_facilities)
+        actual_energy = frame['actual_kwh'].to_numpy(dtype=float)
+        predicted_yield = frame['predicted_yield'].to_numpy(dtype=float)
+        facility_power = frame['facility_power_kw'].to_numpy(dtype=float)
+        
+        # Calculate specific yield from Ampere data
+        actual_yield = np.divide(actual_energy, facility_power,
+                                 out=np.zeros_like(actual_energy), where=facility_power > 0)
+        difference = predicted_yield - actual_yield
+        frame['actual_yield'] = actual_yield
+        frame['difference_yield'] = difference
+        frame['percent_difference'] = np.divide(difference * 100, actual_yield,
+                                                out=np.zeros_like(difference),
+                                                where=actual_yield > 0)
+        
+        # Calculate validation metrics and aggregates first
+        # (averages reuse the metric sums unless non-finite values were dropped)
+        metrics, sum_actual, sum_predicted = self._validation_metrics(actual_yield, predicted_yield)
+        n = len(actual_yield)
+        if metrics.get('n_points') != n:
+            sum_actual, sum_predicted = actual_yield.sum(), predicted_yield.sum()
+        summary = {
+            'total_facilities': len(matched_facilities),
+            'average_actual_yield': sum_actual / n,
+            'average_predicted_yield': sum_predicted / n
+        }
+        summary.update(_error_distribution(frame['percent_difference'].to_numpy()))
         
-        # Calculate validation metrics
-        metrics = self.calculate_validation_metrics(
-            np.array(actual_yield), 
-            np.array(predicted_yield)
-        )
+        # The per-facility dict is only materialized when requested
+        facility_comparisons = None
+        if include_comparisons:
+            facility_comparisons = frame[[
+                'facility_name', 'actual_yield', 'predicted_yield', 'difference_yield',
+                'percent_difference', 'facility_power_kw', 'reference_yield'
+            ]].to_dict(orient='index')
         
         return {
             'metric_type': 'specific_yield_kwh_kwp',
             'validation_metrics': metrics,
             'facility_comparisons': facility_comparisons,
-            'summary': {
-                'total_facilities': len(matched_facilities),
-                'average_actual_yield': np.mean(actual_yield),
-                'average_predicted_yield': np.mean(predicted_yield)
-            }
+            'summary': summary
         }
     
     def generate_validation_report(self, year: int = 2022, 
-                                 sim_results_file: Optional[str] = None) -> Dict[str, Any]:
+                                 sim_results_file: Optional[str] = None,
+                                 include_comparisons: bool = True) -> Dict[str, Any]:
         """
         Generate comprehensive validation report
         
         Args:
             year: Year to validate against
             sim_results_file: Specific simulation results file to use
+            include_comparisons: Include per-facility comparisons (needed for plots)
             
         Returns:
             Complete validation report
@@ -398,7 +908,7 @@ class ValidationAnalyzer:
         
         # Load data
         sim_results = self.load_simulation_results(sim_results_file)
-        ampere_data = self.load_ampere_data(year)
+        ampere_data = self.load_ampere_table(year)
         
         # Match facilities
         matched_facilities = self.match_facilities(sim_results, ampere_data)
@@ -407,12 +917,14 @@ class ValidationAnalyzer:
             return {
                 'error': 'No matching facilities found between simulation and Ampere data',
                 'simulation_facilities': len(sim_results.get('facilities', {})),
-                'ampere_facilities': len(ampere_data.get('facilities', {}))
+                'ampere_facilities': len(ampere_data)
             }
         
         # Perform validations
-        energy_validation = self.validate_annual_energy(sim_results, ampere_data, matched_facilities)
-        yield_validation = self.validate_specific_yield(sim_results, ampere_data, matched_facilities)
+        energy_validation = self.validate_annual_energy(sim_results, ampere_data, matched_facilities,
+                                                        include_comparisons)
+        yield_validation = self.validate_specific_yield(sim_results, ampere_data, matched_facilities,
+                                                        include_comparisons)
         
         # Generate report
         report = {
@@ -420,7 +932,7 @@ class ValidationAnalyzer:
                 'year': year,
                 'simulation_file': sim_results_file,
                 'total_simulation_facilities': len(sim_results.get('facilities', {})),
-                'total_ampere_facilities': len(ampere_data.get('facilities', {})),
+                'total_ampere_facilities': len(ampere_data),
                 'matched_facilities': len(matched_facilities),
                 'validation_timestamp': datetime.now().isoformat()
             },
@@ -433,13 +945,45 @@ class ValidationAnalyzer:
         report_filename = f"validation_report_{year}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         report_path = self.nrel_results_dir / report_filename
         
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            with open(report_path, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(report_path, 'w') as f:
+                json.dump(report, f, indent=2)
         
         print(f"Validation report saved to: {report_path}")
         
         return report
     
+    def _get_figure(self, name: str, nrows: int, ncols: int, figsize: Tuple[float, float]):
+        """
+        Return a cached figure and its axes, cleared for redrawing
+        
+        Figures are created on first use and reused by later plot calls, so
+        repeated calls don't allocate new figures and axes. They are bound
+        directly to an Agg canvas rather than registered with pyplot, so they
+        are never shown and don't need plt.close.
+        
+        Args:
+            name: Cache key of the figure
+            nrows, ncols: Subplot grid shape
+            figsize: Figure size in inches
+            
+        Returns:
+            Tuple of (figure, axes) shaped like the result of plt.subplots
+        """
+        if name not in self._figures:
+            fig = Figure(figsize=figsize)
+            FigureCanvasAgg(fig)
+            self._figures[name] = (fig, fig.subplots(nrows, ncols))
+            return self._figures[name]
+        
+        fig, axes = self._figures[name]
+        for ax in np.ravel(axes):
+            ax.clear()
+        return fig, axes
+    
     def create_validation_plots(self, report: Dict[str, Any], 
                               output_dir: Optional[Path] = None) -> None:
         """
@@ -452,49 +996,44 @@ class ValidationAnalyzer:
         if output_dir is None:
             output_dir = self.nrel_results_dir
         
-        # Set up plotting style
-        plt.style.use('seaborn-v0_8')
-        
         # Annual Energy Validation Plot
         energy_data = report['annual_energy_validation']
         facility_comparisons = energy_data['facility_comparisons']
         
-        # Separate facilities by prediction accuracy
-        normal_facilities = []
-        moderate_outliers = []
-        extreme_outliers = []
+        comparisons = pd.DataFrame.from_dict(facility_comparisons, orient='index')
+        all_actual = comparisons['actual_kwh'].to_numpy(dtype=float)
+        all_predicted = comparisons['predicted_kwh'].to_numpy(dtype=float)
+        percent_diff = comparisons['percent_difference'].to_numpy(dtype=float)
         
-        for comp in facility_comparisons.values():
-            percent_diff = abs(comp['percent_difference'])
-            
-            if percent_diff < 50:
-                normal_facilities.append(comp)
-            elif percent_diff < 1000:
-                moderate_outliers.append(comp)
-            else:
-                extreme_outliers.append(comp)
+        # Separate facilities by prediction accuracy (NaN errors count as extreme)
+        abs_percent_diff = np.abs(percent_diff)
+        normal_mask = abs_percent_diff < 50
+        moderate_mask = ~normal_mask & (abs_percent_diff < 1000)
+        extreme_mask = ~(normal_mask | moderate_mask)
+        n_normal = int(normal_mask.sum())
+        n_moderate = int(moderate_mask.sum())
+        n_extreme = int(extreme_mask.sum())
         
         # Create comprehensive validation plots
-        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+        fig, axes = self._get_figure('annual_energy', 2, 3, figsize=(18, 12))
         
         # 1. Normal facilities - detailed view
-        if normal_facilities:
-            normal_actual = [comp['actual_kwh'] for comp in normal_facilities]
-            normal_predicted = [comp['predicted_kwh'] for comp in normal_facilities]
+        if n_normal:
+            normal_actual = all_actual[normal_mask]
+            normal_predicted = all_predicted[normal_mask]
             
             axes[0, 0].scatter(normal_actual, normal_predicted, alpha=0.7, color='green')
-            min_val = min(min(normal_actual), min(normal_predicted))
-            max_val = max(max(normal_actual), max(normal_predicted))
+            min_val = min(normal_actual.min(), normal_predicted.min())
+            max_val = max(normal_actual.max(), normal_predicted.max())
             axes[0, 0].plot([min_val, max_val], [min_val, max_val], 'r--', label='1:1 line')
             axes[0, 0].set_xlabel('Actual Energy (kWh)')
             axes[0, 0].set_ylabel('Predicted Energy (kWh)')
-            axes[0, 0].set_title(f'Normal Facilities (n={len(normal_facilities)}, <50% error)')
+            axes[0, 0].set_title(f'Normal Facilities (n={n_normal}, <50% error)')
             axes[0, 0].legend()
             axes[0, 0].grid(True, alpha=0.3)
             
             # Error distribution for normal facilities
-            normal_errors = [comp['percent_difference'] for comp in normal_facilities]
-            axes[0, 1].hist(normal_errors, bins=15, alpha=0.7, edgecolor='black', color='green')
+            axes[0, 1].hist(percent_diff[normal_mask], bins=15, alpha=0.7, edgecolor='black', color='green')
             axes[0, 1].set_xlabel('Prediction Error (%)')
             axes[0, 1].set_ylabel('Frequency')
             axes[0, 1].set_title('Error Distribution - Normal Facilities')
@@ -502,39 +1041,35 @@ class ValidationAnalyzer:
             axes[0, 1].grid(True, alpha=0.3)
         
         # 2. Moderate outliers
-        if moderate_outliers:
-            mod_actual = [comp['actual_kwh'] for comp in moderate_outliers]
-            mod_predicted = [comp['predicted_kwh'] for comp in moderate_outliers]
-            
-            axes[0, 2].scatter(mod_actual, mod_predicted, alpha=0.7, color='orange')
+        if n_moderate:
+            axes[0, 2].scatter(all_actual[moderate_mask], all_predicted[moderate_mask],
+                               alpha=0.7, color='orange')
             axes[0, 2].set_xlabel('Actual Energy (kWh)')
             axes[0, 2].set_ylabel('Predicted Energy (kWh)')
-            axes[0, 2].set_title(f'Moderate Outliers (n={len(moderate_outliers)}, 50-1000% error)')
+            axes[0, 2].set_title(f'Moderate Outliers (n={n_moderate}, 50-1000% error)')
             axes[0, 2].grid(True, alpha=0.3)
             axes[0, 2].set_xscale('log')
             axes[0, 2].set_yscale('log')
         
         # 3. Extreme outliers
-        if extreme_outliers:
-            ext_actual = [comp['actual_kwh'] for comp in extreme_outliers]
-            ext_predicted = [comp['predicted_kwh'] for comp in extreme_outliers]
-            
-            axes[1, 0].scatter(ext_actual, ext_predicted, alpha=0.7, color='red')
+        if n_extreme:
+            axes[1, 0].scatter(all_actual[extreme_mask], all_predicted[extreme_mask],
+                               alpha=0.7, color='red')
             axes[1, 0].set_xlabel('Actual Energy (kWh)')
             axes[1, 0].set_ylabel('Predicted Energy (kWh)')
-            axes[1, 0].set_title(f'Extreme Outliers (n={len(extreme_outliers)}, >1000% error)')
+            axes[1, 0].set_title(f'Extreme Outliers (n={n_extreme}, >1000% error)')
             axes[1, 0].grid(True, alpha=0.3)
             axes[1, 0].set_xscale('log')
             axes[1, 0].set_yscale('log')
         
         # 4. Capacity factor comparison for normal facilities
-        if normal_facilities:
-            cf_actual = [comp['capacity_factor_actual'] for comp in normal_facilities]
-            cf_predicted = [comp['capacity_factor_predicted'] for comp in normal_facilities]
+        if n_normal:
+            cf_actual = comparisons['capacity_factor_actual'].to_numpy(dtype=float)[normal_mask]
+            cf_predicted = comparisons['capacity_factor_predicted'].to_numpy(dtype=float)[normal_mask]
             
             axes[1, 1].scatter(cf_actual, cf_predicted, alpha=0.7, color='blue')
-            min_cf = min(min(cf_actual), min(cf_predicted))
-            max_cf = max(max(cf_actual), max(cf_predicted))
+            min_cf = min(cf_actual.min(), cf_predicted.min())
+            max_cf = max(cf_actual.max(), cf_predicted.max())
             axes[1, 1].plot([min_cf, max_cf], [min_cf, max_cf], 'r--', label='1:1 line')
             axes[1, 1].set_xlabel('Actual Capacity Factor (%)')
             axes[1, 1].set_ylabel('Predicted Capacity Factor (%)')
@@ -543,9 +1078,6 @@ class ValidationAnalyzer:
             axes[1, 1].grid(True, alpha=0.3)
         
         # 5. Overall summary
-        all_actual = [comp['actual_kwh'] for comp in facility_comparisons.values()]
-        all_predicted = [comp['predicted_kwh'] for comp in facility_comparisons.values()]
-        
         axes[1, 2].scatter(all_actual, all_predicted, alpha=0.5, color='gray')
         axes[1, 2].set_xlabel('Actual Energy (kWh)')
         axes[1, 2].set_ylabel('Predicted Energy (kWh)')
@@ -554,23 +1086,23 @@ class ValidationAnalyzer:
         axes[1, 2].set_xscale('log')
         axes[1, 2].set_yscale('log')
         
-        plt.tight_layout()
-        plt.savefig(output_dir / 'annual_energy_validation_detailed.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(output_dir / 'annual_energy_validation_detailed.png', dpi=300, bbox_inches='tight')
         
         # Specific Yield Validation Plot
         yield_data = report['specific_yield_validation']
         yield_comparisons = yield_data['facility_comparisons']
         
-        actual_yield = [comp['actual_yield'] for comp in yield_comparisons.values()]
-        predicted_yield = [comp['predicted_yield'] for comp in yield_comparisons.values()]
+        yield_frame = pd.DataFrame.from_dict(yield_comparisons, orient='index')
+        actual_yield = yield_frame['actual_yield'].to_numpy(dtype=float)
+        predicted_yield = yield_frame['predicted_yield'].to_numpy(dtype=float)
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+        fig, (ax1, ax2) = self._get_figure('specific_yield', 1, 2, figsize=(15, 6))
         
         # Scatter plot
         ax1.scatter(actual_yield, predicted_yield, alpha=0.6)
-        ax1.plot([min(actual_yield), max(actual_yield)], 
-                [min(actual_yield), max(actual_yield)], 'r--', label='1:1 line')
+        ax1.plot([actual_yield.min(), actual_yield.max()], 
+                [actual_yield.min(), actual_yield.max()], 'r--', label='1:1 line')
         ax1.set_xlabel('Actual Specific Yield (kWh/kWp)')
         ax1.set_ylabel('Predicted Specific Yield (kWh/kWp)')
         ax1.set_title('Specific Yield: Predicted vs Actual')
@@ -578,17 +1110,15 @@ class ValidationAnalyzer:
         ax1.grid(True, alpha=0.3)
         
         # Error distribution
-        yield_errors = [comp['percent_difference'] for comp in yield_comparisons.values()]
-        ax2.hist(yield_errors, bins=20, alpha=0.7, edgecolor='black')
+        ax2.hist(yield_frame['percent_difference'].to_numpy(dtype=float), bins=20, alpha=0.7, edgecolor='black')
         ax2.set_xlabel('Prediction Error (%)')
         ax2.set_ylabel('Frequency')
         ax2.set_title('Distribution of Specific Yield Errors')
         ax2.axvline(0, color='red', linestyle='--', alpha=0.7)
         ax2.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.savefig(output_dir / 'specific_yield_validation.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(output_dir / 'specific_yield_validation.png', dpi=300, bbox_inches='tight')
         
         print(f"Validation plots saved to: {output_dir}")
     
@@ -639,29 +1169,77 @@ class ValidationAnalyzer:
         print("\n" + "="*60)
 
 
+def run_validation_year(year: int, sim_results_file: Optional[str] = None,
+                        include_comparisons: bool = True) -> Dict[str, Any]:
+    """
+    Generate the validation report for one year with a fresh analyzer
+    
+    Top-level so it can run in a worker process.
+    
+    Args:
+        year: Year to validate against
+        sim_results_file: Specific simulation results file to use
+        include_comparisons: Include per-facility comparisons (needed for plots)
+        
+    Returns:
+        Complete validation report
+    """
+    analyzer = ValidationAnalyzer()
+    return analyzer.generate_validation_report(year=year, sim_results_file=sim_results_file,
+                                               include_comparisons=include_comparisons)
+
+
 def main():
     """Main function to run validation analysis"""
     import argparse
+    from concurrent.futures import ProcessPoolExecutor
     
     parser = argparse.ArgumentParser(description='Run validation analysis')
     parser.add_argument('--year', type=int, default=2022, help='Year for validation analysis')
+    parser.add_argument('--years', type=int, nargs='+',
+                        help='Several years to validate in parallel (overrides --year)')
     parser.add_argument('--simulation-results', type=str, help='Path to simulation results file')
+    parser.add_argument('--summary-only', action='store_true',
+                        help='Skip per-facility comparisons and plots')
     args = parser.parse_args()
     
+    years = args.years or [args.year]
+    include_comparisons = not args.summary_only
+    
     try:
         analyzer = ValidationAnalyzer()
         
-        # Generate validation report
-        report = analyzer.generate_validation_report(year=args.year, sim_results_file=args.simulation_results)
-        
-        # Print summary
-        analyzer.print_validation_summary(report)
-        
-        # Create plots
-        try:
-            analyzer.create_validation_plots(report)
-        except Exception as e:
-            print(f"Warning: Could not create plots: {e}")
+        # Generate validation reports; years are independent, so several
+        # years are processed in parallel worker processes
+        if len(years) == 1:
+            reports = {years[0]: analyzer.generate_validation_report(
+                year=years[0], sim_results_file=args.simulation_results,
+                include_comparisons=include_comparisons
+            )}
+        else:
+            max_workers = min(len(years), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    year: executor.submit(run_validation_year, year, args.simulation_results,
+                                          include_comparisons)
+                    for year in years
+                }
+                reports = {year: future.result() for year, future in futures.items()}
+        
+        for year, report in reports.items():
+            # Print summary
+            analyzer.print_validation_summary(report)
+            
+            # Create plots (in a per-year directory when validating several years)
+            if not args.summary_only and 'error' not in report:
+                output_dir = None
+                if len(years) > 1:
+                    output_dir = analyzer.nrel_results_dir / f"plots_{year}"
+                    output_dir.mkdir(parents=True, exist_ok=True)
+                try:
+                    analyzer.create_validation_plots(report, output_dir)
+                except Exception as e:
+                    print(f"Warning: Could not create plots: {e}")
         
         print(f"\nValidation analysis completed successfully!")
         
@@ -671,4 +1249,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
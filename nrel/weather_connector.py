@@ -8,29 +8,207 @@ Provides unified interface for fetching weather data from multiple sources:
 Includes caching, error handling, and automatic fallback logic.
 """
 
+import email.utils
+import functools
+import io
+import json
+import math
+import os
+import threading
 import time
+from collections import OrderedDict
+import numpy as np
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 
-# Add pvlib-python to path if not already available
-try:
-    import pvlib
-except ImportError:
-    project_root = Path(__file__).parent.parent
-    pvlib_path = project_root / "pvlib-python"
-    if pvlib_path.exists():
-        sys.path.insert(0, str(pvlib_path))
-        import pvlib
-    else:
-        raise ImportError("pvlib not found. Install with: pip install pvlib-python")
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 
-from .config import config, get_logger
+from .cache_store import CacheFileIndex, SQLiteWeatherCache
+from .config import config, get_logger, _coord_key
 
 logger = get_logger(__name__)
 
+# Cache file extensions; pickle files left by older versions are still
+# removed by clear_cache
+CACHE_EXTENSIONS = ('.feather', '.parquet', '.pkl')
+
+# Arrow schema metadata keys holding the location a cache entry was fetched
+# for and the upstream data version
+CACHE_LOCATION_KEY = b'weather_location'
+CACHE_VERSION_KEY = b'source_version'
+
+EARTH_RADIUS_KM = 6371.0
+
+# Plausible (min, max) ranges for weather columns
+VALIDATION_RANGES = {
+    'ghi': (0, 1500),
+    'dni': (0, 1200),
+    'dhi': (0, 500),
+    'temp_air': (-50, 60),
+    'wind_speed': (0, 50)
+}
+
+# The same ranges as one structured array, built once at import
+_VALIDATION = np.array([(name, low, high) for name, (low, high) in VALIDATION_RANGES.items()],
+                       dtype=[('name', 'U16'), ('min', 'f8'), ('max', 'f8')])
+
+@functools.lru_cache(maxsize=None)
+def _pvlib_iotools():
+    """
+    Import ``pvlib.iotools`` on first use.
+    
+    pvlib is slow to import and only needed to build and parse API
+    requests, so cache-only callers never pay for it. Falls back to a
+    pvlib-python checkout next to the project if pvlib isn't installed.
+    """
+    try:
+        import pvlib.iotools
+    except ImportError:
+        project_root = Path(__file__).parent.parent
+        pvlib_path = project_root / "pvlib-python"
+        if not pvlib_path.exists():
+            raise ImportError("pvlib not found. Install with: pip install pvlib-python")
+        sys.path.insert(0, str(pvlib_path))
+        import pvlib.iotools
+    return pvlib.iotools
+
+# PSM3 date vector and flag columns; all other columns are floats
+_PSM3_INT_COLUMNS = ('Year', 'Month', 'Day', 'Hour', 'Minute', 'Cloud Type', 'Fill Flag')
+
+def _parse_psm3_csv(content: bytes) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Parse a PSM3 CSV response into weather data and metadata.
+    
+    Produces the same result as ``pvlib.iotools.parse_psm3`` with
+    ``map_variables=True``, but reads the data rows with the multi-threaded
+    Arrow CSV reader into pre-typed columns.
+    
+    Parameters
+    ----------
+    content : bytes
+        Raw PSM3 CSV response body
+        
+    Returns
+    -------
+    tuple of (pd.DataFrame, dict)
+        Weather data indexed by local standard time, and PSM3 metadata
+    """
+    # The first 2 lines are metadata fields and values, the third the
+    # column header
+    metadata_line, values_line, header_line, body = content.split(b'\n', 3)
+    metadata = dict(zip(metadata_line.decode().strip().split(','),
+                        values_line.decode().strip().split(',')))
+    metadata['Local Time Zone'] = int(metadata['Local Time Zone'])
+    metadata['Time Zone'] = int(metadata['Time Zone'])
+    metadata['latitude'] = float(metadata.pop('Latitude'))
+    metadata['longitude'] = float(metadata.pop('Longitude'))
+    metadata['altitude'] = int(metadata.pop('Elevation'))
+    
+    # Spreadsheet-style exports leave blank header cells; name them so the
+    # reader accepts them, then drop them
+    header = header_line.decode().strip().split(',')
+    names = [name or f"_blank_{i}" for i, name in enumerate(header)]
+    columns = [name for name in header if name]
+    column_types = {name: pa.int64() if name in _PSM3_INT_COLUMNS else pa.float64()
+                    for name in columns}
+    
+    table = pacsv.read_csv(
+        pa.BufferReader(body),
+        read_options=pacsv.ReadOptions(column_names=names, block_size=1 << 20),
+        convert_options=pacsv.ConvertOptions(column_types=column_types, include_columns=columns)
+    )
+    data = table.to_pandas(self_destruct=True)
+    del table
+    
+    # The first 5 columns are a date vector; US time zones are whole hours
+    dtidx = pd.to_datetime(data[['Year', 'Month', 'Day', 'Hour', 'Minute']])
+    data.index = pd.DatetimeIndex(dtidx).tz_localize('Etc/GMT%+d' % -metadata['Time Zone'])
+    
+    data = data.rename(columns=_pvlib_iotools().psm3.VARIABLE_MAP)
+    return data, metadata
+
+# HTTP statuses worth retrying on the same source
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+def _retry_after(response: requests.Response, default: float) -> float:
+    """Seconds to wait from a ``Retry-After`` header, or ``default``."""
+    value = response.headers.get('Retry-After')
+    if value is None:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        # HTTP-date form
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+            return max(retry_at.timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            return default
+
+def _pvgis_version() -> str:
+    """PVGIS data release in use, taken from the API path (e.g. 'v5_2')."""
+    return config.pvgis_base_url.rstrip('/').rsplit('/', 1)[-1]
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    
+    Requests within the burst capacity pass immediately; once the bucket is
+    empty each request waits only until its token has been refilled.
+    """
+    
+    def __init__(self, rate: float, capacity: int):
+        """
+        Parameters
+        ----------
+        rate : float
+            Tokens refilled per second
+        capacity : int
+            Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available.
+        
+        Returns
+        -------
+        float
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now so concurrent callers queue behind it
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
 class WeatherDataConnector:
     """
     Unified weather data connector with multiple source support.
@@ -42,7 +220,8 @@ class WeatherDataConnector:
     def __init__(self, 
                  primary_source: str = 'nsrdb',
                  fallback_sources: list = None,
-                 enable_cache: bool = True):
+                 enable_cache: bool = True,
+                 precision: str = 'float32'):
         """
         Initialize the weather data connector.
         
@@ -54,6 +233,9 @@ class WeatherDataConnector:
             List of fallback sources. Default is ['pvgis'] if primary is 'nsrdb'
         enable_cache : bool, default True
             Whether to enable local caching of weather data
+        precision : str, default 'float32'
+            Floating-point dtype of returned weather columns; 'float64'
+            keeps full precision at twice the memory
         """
         self.primary_source = primary_source
         
@@ -66,8 +248,26 @@ class WeatherDataConnector:
             self.fallback_sources = fallback_sources
         
         self.enable_cache = enable_cache
+        self.precision = precision
         self.last_used_source = None
-        self.last_request_time = 0
+        
+        # Recently used DataFrames by exact location, in LRU order
+        self._memory_cache = OrderedDict()
+        self._memory_lock = threading.Lock()
+        
+        # Index of cache files, plus the optional SQLite store shared by
+        # concurrent worker processes
+        self._cache_index = CacheFileIndex(config.cache_index_path)
+        self._versions = None
+        self._versions_loaded = 0.0
+        self._cache_store = None
+        if enable_cache and config.cache_backend == 'sqlite':
+            self._cache_store = SQLiteWeatherCache(config.cache_db_path)
+        self._buckets = {source: TokenBucket(rate, capacity)
+                         for source, (rate, capacity) in config.rate_limits.items()}
+        
+        # Keep-alive HTTP session, created on first request
+        self._http = None
         
         # Validate configuration
         self._validate_sources()
@@ -75,6 +275,30 @@ class WeatherDataConnector:
         logger.info(f"WeatherDataConnector initialized: primary={primary_source}, "
                    f"fallbacks={self.fallback_sources}, cache={enable_cache}")
     
+    def __enter__(self) -> 'WeatherDataConnector':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close pooled HTTP connections held by this connector."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+    
+    @property
+    def http(self) -> requests.Session:
+        """Pooled HTTP session reused across NSRDB and PVGIS requests."""
+        if self._http is None:
+            adapter = HTTPAdapter(pool_connections=config.http_pool_connections,
+                                  pool_maxsize=config.http_pool_maxsize)
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self._http = session
+        return self._http
+    
     def _validate_sources(self) -> None:
         """Validate that the configured sources are available."""
         if self.primary_source == 'nsrdb' and not config.is_nrel_available():
@@ -110,24 +334,194 @@ class WeatherDataConnector:
             If all weather data sources fail
         """
         # Validate inputs
-        if not -90 <= latitude <= 90:
-            raise ValueError(f"Invalid latitude: {latitude}. Must be between -90 and 90.")
-        if not -180 <= longitude <= 180:
-            raise ValueError(f"Invalid longitude: {longitude}. Must be between -180 and 180.")
+        self._validate_coordinates(latitude, longitude)
+        
+        # Check cache first (returns None when caching is disabled)
+        cached_data = self._load_from_cache(latitude, longitude, year)
+        if cached_data is not None:
+            logger.info(f"Loaded weather data from cache for {latitude:.4f}, {longitude:.4f}")
+            self.last_used_source = 'cache'
+            return cached_data
         
         # Determine if using TMY
         if use_tmy is None:
             use_tmy = year is None
         
-        # Check cache first
-        if self.enable_cache:
+        weather_data, self.last_used_source = self._fetch_with_fallback(
+            latitude, longitude, year, use_tmy)
+        return weather_data
+    
+    def get_weather_data_batch(self,
+                               locations: List[Tuple[float, float, Optional[int]]],
+                               use_tmy: bool = None,
+                               with_source: bool = False) -> List[Any]:
+        """
+        Get weather data for many locations, fetching cache misses concurrently.
+        
+        Parameters
+        ----------
+        locations : list of (latitude, longitude, year) tuples
+            Locations to fetch; ``year`` may be None for TMY data
+        use_tmy : bool, optional
+            Force TMY data usage. If None, determined by each year
+        with_source : bool, default False
+            Return ``(weather_data, source)`` pairs instead of the data alone,
+            with the source reported as in ``last_used_source``
+            
+        Returns
+        -------
+        list of pd.DataFrame or None
+            Weather data in the order of ``locations``; None where every
+            source failed for that location (``(None, None)`` pairs with
+            ``with_source``)
+        """
+        for latitude, longitude, _ in locations:
+            self._validate_coordinates(latitude, longitude)
+        
+        results = [(None, None)] * len(locations)
+        
+        # Serve cache hits first and group misses so a location repeated in
+        # the batch is only requested once
+        misses = {}
+        for i, (latitude, longitude, year) in enumerate(locations):
             cached_data = self._load_from_cache(latitude, longitude, year)
             if cached_data is not None:
-                logger.info(f"Loaded weather data from cache for {latitude:.4f}, {longitude:.4f}")
-                self.last_used_source = 'cache'
-                return cached_data
+                results[i] = (cached_data, 'cache')
+                continue
+            key = (_coord_key(latitude), _coord_key(longitude), year)
+            misses.setdefault(key, []).append(i)
+        
+        def fetch(indices):
+            latitude, longitude, year = locations[indices[0]]
+            tmy = year is None if use_tmy is None else use_tmy
+            try:
+                return self._fetch_with_fallback(latitude, longitude, year, tmy)
+            except Exception as e:
+                logger.error(str(e))
+                return None, None
+        
+        if misses:
+            # Requests share the pooled session and per-source rate limits
+            max_workers = min(config.max_concurrent_requests, len(misses))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for indices, result in zip(misses.values(), executor.map(fetch, misses.values())):
+                    for i in indices:
+                        results[i] = result
+            
+            logger.info(f"Fetched weather data for {len(misses)} of {len(locations)} locations "
+                        f"({len(locations) - sum(map(len, misses.values()))} from cache)")
+        
+        if with_source:
+            return results
+        return [weather_data for weather_data, _ in results]
+    
+    def get_weather_data_multi(self,
+                               points: List[Tuple[float, float]],
+                               year: Optional[int] = None,
+                               use_tmy: bool = None) -> Dict[Tuple[float, float], Optional[pd.DataFrame]]:
+        """
+        Get weather data for many points, with one request per grid cell.
+        
+        Points in the same cache grid cell (the ~4 km NSRDB grid) share the
+        data fetched for the first of them, so a fleet of nearby sites costs
+        one API request per cell.
+        
+        Parameters
+        ----------
+        points : list of (latitude, longitude) tuples
+            Locations to fetch
+        year : int, optional
+            Specific year for weather data. If None, TMY data is used
+        use_tmy : bool, optional
+            Force TMY data usage. If None, determined by year parameter
+            
+        Returns
+        -------
+        dict
+            ``{(latitude, longitude): pd.DataFrame or None}`` for each point;
+            None where every source failed for that point's cell
+        """
+        cells = {}
+        for latitude, longitude in points:
+            cell = (config.grid_cell(latitude), config.grid_cell(longitude))
+            cells.setdefault(cell, []).append((latitude, longitude))
+        
+        locations = [(*cell_points[0], year) for cell_points in cells.values()]
+        results = self.get_weather_data_batch(locations, use_tmy=use_tmy)
+        
+        return {point: weather_data
+                for cell_points, weather_data in zip(cells.values(), results)
+                for point in cell_points}
+    
+    def get_weather_data_bbox(self,
+                              lat1: float,
+                              lon1: float,
+                              lat2: float,
+                              lon2: float,
+                              year: Optional[int] = None,
+                              use_tmy: bool = None) -> Dict[Tuple[float, float], Optional[pd.DataFrame]]:
+        """
+        Get weather data for every grid cell in a bounding box.
         
-        # Try each source in order
+        Parameters
+        ----------
+        lat1, lon1 : float
+            One corner of the box in decimal degrees
+        lat2, lon2 : float
+            The opposite corner of the box in decimal degrees
+        year : int, optional
+            Specific year for weather data. If None, TMY data is used
+        use_tmy : bool, optional
+            Force TMY data usage. If None, determined by year parameter
+            
+        Returns
+        -------
+        dict
+            ``{(latitude, longitude): pd.DataFrame or None}`` keyed by the
+            centre of each grid cell
+            
+        Raises
+        ------
+        ValueError
+            If a corner is invalid or the box spans more than
+            ``config.max_bbox_cells`` grid cells
+        """
+        self._validate_coordinates(lat1, lon1)
+        self._validate_coordinates(lat2, lon2)
+        
+        grid = config.cache_grid_deg
+        lat_cells = range(config.grid_cell(min(lat1, lat2)), config.grid_cell(max(lat1, lat2)) + 1)
+        lon_cells = range(config.grid_cell(min(lon1, lon2)), config.grid_cell(max(lon1, lon2)) + 1)
+        
+        n_cells = len(lat_cells) * len(lon_cells)
+        if n_cells > config.max_bbox_cells:
+            raise ValueError(f"Bounding box spans {n_cells} grid cells; "
+                             f"the limit is {config.max_bbox_cells}")
+        
+        # Cell centres, clamped so edge cells stay valid coordinates
+        points = [(min(max((lat_cell + 0.5) * grid, -90.0), 90.0),
+                   min(max((lon_cell + 0.5) * grid, -180.0), 180.0))
+                  for lat_cell in lat_cells for lon_cell in lon_cells]
+        return self.get_weather_data_multi(points, year=year, use_tmy=use_tmy)
+    
+    def _fetch_with_fallback(self,
+                             latitude: float,
+                             longitude: float,
+                             year: Optional[int],
+                             use_tmy: bool) -> Tuple[pd.DataFrame, str]:
+        """
+        Fetch, validate and cache weather data, trying each source in order.
+        
+        Returns
+        -------
+        tuple of (pd.DataFrame, str)
+            Validated weather data and the source it came from
+            
+        Raises
+        ------
+        Exception
+            If all weather data sources fail
+        """
         sources_to_try = [self.primary_source] + self.fallback_sources
         
         for source in sources_to_try:
@@ -136,7 +530,7 @@ class WeatherDataConnector:
                            f"{latitude:.4f}, {longitude:.4f}")
                 
                 # Rate limiting
-                self._enforce_rate_limit()
+                self._enforce_rate_limit(source)
                 
                 if source == 'nsrdb':
                     weather_data = self._get_nsrdb_data(latitude, longitude, year, use_tmy)
@@ -151,11 +545,13 @@ class WeatherDataConnector:
                 
                 # Cache the data
                 if self.enable_cache:
+                    version = validated_data.attrs.get('source_version')
+                    if version:
+                        self._record_version(source, version)
                     self._save_to_cache(validated_data, latitude, longitude, source, year)
                 
-                self.last_used_source = source
                 logger.info(f"Successfully retrieved weather data from {source}")
-                return validated_data
+                return validated_data, source
                 
             except Exception as e:
                 logger.warning(f"Failed to get weather data from {source}: {str(e)}")
@@ -164,6 +560,22 @@ class WeatherDataConnector:
         # If all sources failed
         raise Exception(f"All weather data sources failed for location {latitude:.4f}, {longitude:.4f}")
     
+    def _validate_coordinates(self, latitude: float, longitude: float) -> None:
+        """
+        Check that coordinates are within valid ranges.
+        
+        Raises
+        ------
+        ValueError
+            If latitude or longitude is out of range
+        """
+        # One combined check on the happy path
+        if -90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0:
+            return
+        if not -90.0 <= latitude <= 90.0:
+            raise ValueError(f"Invalid latitude: {latitude}. Must be between -90 and 90.")
+        raise ValueError(f"Invalid longitude: {longitude}. Must be between -180 and 180.")
+    
     def _get_nsrdb_data(self, 
                        latitude: float, 
                        longitude: float, 
@@ -196,29 +608,21 @@ class WeatherDataConnector:
         try:
             if use_tmy or year is None:
                 # Get TMY data
-                nrel_config_tmy = nrel_config.copy()
-                nrel_config_tmy['names'] = 'tmy'
-                weather, metadata = pvlib.iotools.get_psm3(
-                    latitude=latitude,
-                    longitude=longitude,
-                    **nrel_config_tmy
-                )
+                nrel_config['names'] = 'tmy'
+                weather, metadata = self._fetch_psm3(latitude, longitude, nrel_config)
                 logger.debug(f"Retrieved TMY data from NSRDB: {len(weather)} records")
             else:
                 # Get specific year data
-                nrel_config_year = nrel_config.copy()
-                nrel_config_year['names'] = str(year)
-                weather, metadata = pvlib.iotools.get_psm3(
-                    latitude=latitude,
-                    longitude=longitude,
-                    **nrel_config_year
-                )
+                nrel_config['names'] = str(year)
+                weather, metadata = self._fetch_psm3(latitude, longitude, nrel_config)
                 logger.debug(f"Retrieved {year} data from NSRDB: {len(weather)} records")
             
             # Log metadata
             if metadata:
                 logger.debug(f"NSRDB metadata: {metadata.get('Station Name', 'Unknown')} "
                            f"({metadata.get('Distance (km)', 'Unknown')} km)")
+                if metadata.get('Version'):
+                    weather.attrs['source_version'] = str(metadata['Version'])
             
             return weather
             
@@ -244,23 +648,158 @@ class WeatherDataConnector:
         try:
             pvgis_config = config.get_pvgis_config()
             
-            weather, metadata = pvlib.iotools.get_pvgis_tmy(
-                latitude=latitude,
-                longitude=longitude,
-                **pvgis_config
-            )
+            weather, metadata = self._fetch_pvgis_tmy(latitude, longitude, pvgis_config)
             
             logger.debug(f"Retrieved TMY data from PVGIS: {len(weather)} records")
             
-            # Log metadata
-            if metadata:
+            # Log metadata (the CSV format returns it as a list of lines)
+            if isinstance(metadata, dict):
                 logger.debug(f"PVGIS metadata: {metadata.get('location', 'Unknown')}")
             
+            # PVGIS data releases are versioned by the API path
+            weather.attrs['source_version'] = _pvgis_version()
             return weather
             
         except Exception as e:
             raise Exception(f"PVGIS API error: {str(e)}")
     
+    def _get_with_retry(self, url: str, params: Dict[str, Any],
+                        timeout: float) -> requests.Response:
+        """
+        GET a URL, retrying transient failures before giving up.
+        
+        Rate limiting (429), unavailable (502/503/504) responses, connection
+        errors and timeouts are retried up to ``config.max_retries`` times,
+        waiting for the server's ``Retry-After`` when it sends one and
+        otherwise backing off exponentially from ``config.retry_delay``.
+        Retrying the same source is cheaper than falling back to another.
+        
+        Returns
+        -------
+        requests.Response
+            The final response, which may still be an error
+        """
+        for attempt in range(config.max_retries + 1):
+            retries_left = attempt < config.max_retries
+            try:
+                response = self.http.get(url, params=params, timeout=timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not retries_left:
+                    raise
+                delay = config.retry_delay * 2 ** attempt
+                reason = str(e)
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or not retries_left:
+                    return response
+                delay = _retry_after(response, config.retry_delay * 2 ** attempt)
+                reason = f"HTTP {response.status_code}"
+            
+            delay = min(delay, config.max_retry_delay)
+            logger.info(f"Retrying {url} in {delay:.1f} seconds ({reason})")
+            time.sleep(delay)
+    
+    def _fetch_psm3(self, latitude: float, longitude: float,
+                    nrel_config: Dict[str, Any]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Download an NSRDB PSM3 CSV over the pooled session.
+        
+        Builds the same request as ``pvlib.iotools.get_psm3`` and parses the
+        response with :func:`_parse_psm3_csv`.
+        
+        Parameters
+        ----------
+        latitude : float
+            Latitude in decimal degrees
+        longitude : float
+            Longitude in decimal degrees
+        nrel_config : dict
+            NREL API parameters from ``config.get_nrel_config()``
+            
+        Returns
+        -------
+        tuple of (pd.DataFrame, dict)
+            Weather data and PSM3 metadata
+        """
+        psm3 = _pvlib_iotools().psm3
+        names = str(nrel_config['names'])
+        interval = nrel_config['interval']
+        attributes = [psm3.REQUEST_VARIABLE_MAP.get(a, a) for a in psm3.ATTRIBUTES]
+        params = {
+            'api_key': nrel_config['api_key'],
+            'full_name': 'pvlib python',
+            'email': nrel_config['email'],
+            'affiliation': 'pvlib python',
+            'reason': psm3.PVLIB_PYTHON,
+            'mailing_list': 'false',
+            # WKT POINT is longitude first, four decimals each
+            'wkt': f"POINT({longitude:.4f} {latitude:.4f})",
+            'names': names,
+            'attributes': ','.join(attributes),
+            'leap_day': str(nrel_config['leap_day']).lower(),
+            'utc': 'false',
+            'interval': interval
+        }
+        
+        if any(prefix in names for prefix in ('tmy', 'tgy', 'tdy')):
+            url = psm3.TMY_URL
+        elif interval in (5, 15):
+            url = psm3.PSM5MIN_URL
+        else:
+            url = psm3.PSM_URL
+        
+        response = self._get_with_retry(url, params, nrel_config['timeout'])
+        if not response.ok:
+            try:
+                errors = response.json()['errors']
+            except ValueError:
+                errors = response.text
+            raise requests.HTTPError(errors, response=response)
+        
+        return _parse_psm3_csv(response.content)
+    
+    def _fetch_pvgis_tmy(self, latitude: float, longitude: float,
+                         pvgis_config: Dict[str, Any]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Download a PVGIS TMY over the pooled session.
+        
+        Builds the same request as ``pvlib.iotools.get_pvgis_tmy`` and parses
+        the response with ``pvlib.iotools.read_pvgis_tmy``.
+        
+        Parameters
+        ----------
+        latitude : float
+            Latitude in decimal degrees
+        longitude : float
+            Longitude in decimal degrees
+        pvgis_config : dict
+            PVGIS API parameters from ``config.get_pvgis_config()``
+            
+        Returns
+        -------
+        tuple of (pd.DataFrame, dict)
+            Weather data and PVGIS metadata
+        """
+        outputformat = pvgis_config['outputformat']
+        params = {'lat': latitude, 'lon': longitude, 'outputformat': outputformat}
+        if not pvgis_config['usehorizon']:
+            params['usehorizon'] = 0
+        for key in ('startyear', 'endyear'):
+            if pvgis_config.get(key) is not None:
+                params[key] = pvgis_config[key]
+        
+        response = self._get_with_retry(f"{config.pvgis_base_url}/tmy", params,
+                                        pvgis_config['timeout'])
+        if not response.ok:
+            try:
+                message = response.json()['message']
+            except ValueError:
+                message = response.text
+            raise requests.HTTPError(message, response=response)
+        
+        weather, _, _, metadata = _pvlib_iotools().read_pvgis_tmy(
+            io.BytesIO(response.content), pvgis_format=outputformat)
+        return weather, metadata
+    
     def _validate_weather_data(self, data: pd.DataFrame, source: str) -> pd.DataFrame:
         """
         Validate weather data and ensure required columns are present.
@@ -281,47 +820,73 @@ class WeatherDataConnector:
             raise ValueError(f"Empty weather data received from {source}")
         
         required_columns = config.required_columns
-        missing_columns = [col for col in required_columns if col not in data.columns]
+        missing = config.required_columns_set.difference(data.columns)
         
-        if missing_columns:
+        if missing:
+            missing_columns = [col for col in required_columns if col in missing]
             raise ValueError(f"Missing required columns from {source}: {missing_columns}")
         
-        # Check for reasonable data ranges
-        validation_ranges = {
-            'ghi': (0, 1500),
-            'dni': (0, 1200), 
-            'dhi': (0, 500),
-            'temp_air': (-50, 60),
-            'wind_speed': (0, 50)
-        }
+        # Check ranges and missing values in one pass over a 2-D array of
+        # the required columns plus any other range-checked columns
+        ranges = _VALIDATION
+        present = np.fromiter((name in data.columns for name in ranges['name']),
+                              dtype=bool, count=len(ranges))
+        if not present.all():
+            ranges = ranges[present]
+        range_columns = ranges['name'].tolist()
+        columns = required_columns + [col for col in range_columns if col not in required_columns]
+        values = data[columns].to_numpy(dtype=np.float64)
         
-        for column, (min_val, max_val) in validation_ranges.items():
-            if column in data.columns:
-                out_of_range = ((data[column] < min_val) | (data[column] > max_val)).sum()
-                if out_of_range > 0:
-                    logger.warning(f"{source}: {out_of_range} out-of-range values in {column}")
+        range_index = [columns.index(col) for col in range_columns]
+        checked = values[:, range_index]
+        out_of_range = ((checked < ranges['min']) | (checked > ranges['max'])).sum(axis=0)
+        for column, count in zip(range_columns, out_of_range.tolist()):
+            if count > 0:
+                logger.warning(f"{source}: {count} out-of-range values in {column}")
         
         # Check for missing data
-        missing_data = data[required_columns].isnull().sum()
+        missing_data = np.isnan(values[:, :len(required_columns)]).sum(axis=0)
         if missing_data.any():
-            logger.warning(f"{source}: Missing data counts: {missing_data.to_dict()}")
+            logger.warning(f"{source}: Missing data counts: "
+                          f"{dict(zip(required_columns, missing_data.tolist()))}")
         
         logger.debug(f"Weather data validation passed for {source}: "
                     f"{len(data)} records, {len(data.columns)} columns")
         
-        return data
+        # Cached and returned data share the connector's precision
+        return self._apply_precision(data)
     
-    def _enforce_rate_limit(self) -> None:
-        """Enforce rate limiting between API requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+    def _apply_precision(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cast the weather value columns to the connector's precision.
         
-        if time_since_last < config.retry_delay:
-            sleep_time = config.retry_delay - time_since_last
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
+        Floating-point columns and the range-checked irradiance, temperature
+        and wind columns (which some sources return as integers) are cast;
+        other columns are left alone.
         
-        self.last_request_time = time.time()
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Weather data
+            
+        Returns
+        -------
+        pd.DataFrame
+            The same frame if no column needs casting, otherwise a cast copy
+        """
+        dtype = np.dtype(self.precision)
+        casts = {col: dtype for col, col_dtype in data.dtypes.items()
+                 if col_dtype != dtype and (col_dtype.kind == 'f'
+                                            or (col in VALIDATION_RANGES and col_dtype.kind in 'iu'))}
+        return data.astype(casts) if casts else data
+    
+    def _enforce_rate_limit(self, source: str) -> None:
+        """Wait for a request token from the source's rate limit bucket."""
+        bucket = self._buckets.get(source)
+        if bucket is not None:
+            wait = bucket.acquire()
+            if wait > 0:
+                logger.debug(f"Rate limiting {source}: waited {wait:.2f} seconds")
     
     def _load_from_cache(self, 
                         latitude: float, 
@@ -330,6 +895,9 @@ class WeatherDataConnector:
         """
         Load weather data from cache if available and not expired.
         
+        Recently used locations are served from an in-memory LRU before the
+        SQLite store and cache files are consulted.
+        
         Parameters
         ----------
         latitude : float
@@ -347,36 +915,177 @@ class WeatherDataConnector:
         if not self.enable_cache:
             return None
         
-        # Try to find cached data from any source
+        memory_key = (_coord_key(latitude), _coord_key(longitude), year)
+        with self._memory_lock:
+            cached_data = self._memory_cache.get(memory_key)
+            if cached_data is not None:
+                self._memory_cache.move_to_end(memory_key)
+        if cached_data is not None:
+            logger.debug("Loaded weather data from memory cache")
+            # Callers get their own copy, so writes never reach the cache
+            return cached_data.copy()
+        
+        cached_data = self._load_from_disk_cache(latitude, longitude, year)
+        if cached_data is not None:
+            self._remember(memory_key, cached_data)
+        return cached_data
+    
+    def _remember(self, memory_key: Tuple[int, int, Optional[int]], data: pd.DataFrame) -> None:
+        """Keep a private copy of ``data`` in the in-memory LRU cache."""
+        data = data.copy()
+        with self._memory_lock:
+            self._memory_cache[memory_key] = data
+            self._memory_cache.move_to_end(memory_key)
+            while len(self._memory_cache) > config.memory_cache_entries:
+                self._memory_cache.popitem(last=False)
+    
+    def _load_from_disk_cache(self,
+                              latitude: float,
+                              longitude: float,
+                              year: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """Load weather data from the SQLite store or the cache files."""
+        if self._cache_store is not None:
+            lat_key, lon_key = config.grid_cell(latitude), config.grid_cell(longitude)
+            for source in ['nsrdb', 'pvgis']:
+                try:
+                    cached_data = self._cache_store.get(source, lat_key, lon_key, year,
+                                                        max_age_days=config.cache_expiry_days)
+                except Exception as e:
+                    logger.warning(f"Failed to load cache from {self._cache_store.db_path}: {e}")
+                    continue
+                if cached_data is not None:
+                    logger.debug(f"Loaded cached {source} data from SQLite cache")
+                    return self._apply_precision(cached_data)
+        
+        # Find the closest indexed entry within tolerance for each source
+        # among the surrounding grid cells
+        lat_cells, lon_cells = self._nearby_cells(latitude, longitude)
+        try:
+            entries = self._cache_index.find(year, lat_cells, lon_cells)
+        except Exception as e:
+            logger.warning(f"Failed to query cache index {self._cache_index.db_path}: {e}")
+            return None
+        
+        expires_before = time.time() - config.cache_expiry_days * 86400
+        versions = self._source_versions()
+        expired = []
+        closest = {}
+        for source, path, mtime, cached_lat, cached_lon, version in entries:
+            # Entries from an older data release are stale, and the age limit
+            # bounds every entry: a warm cache never fetches, so it may not
+            # learn of a new release
+            current = versions.get(source)
+            is_stale = mtime < expires_before or (
+                version is not None and current is not None and version != current)
+            if is_stale:
+                expired.append(path)
+                continue
+            distance = _haversine_km(latitude, longitude, cached_lat, cached_lon)
+            if distance <= config.cache_tolerance_km and (
+                    source not in closest or distance < closest[source][1]):
+                closest[source] = (path, distance)
+        
+        if expired:
+            logger.debug(f"Removing {len(expired)} stale cache files")
+            self._remove_cache_files(expired)
+        
         for source in ['nsrdb', 'pvgis']:
-            # Try both parquet and pickle extensions
-            for ext in ['.parquet', '.pkl']:
-                cache_path = config.get_cache_path(latitude, longitude, source, year)
-                cache_path = cache_path.with_suffix(ext)
+            if source not in closest:
+                continue
+            cache_path, distance = closest[source]
+            
+            try:
+                # Load cached data
+                if cache_path.endswith('.feather'):
+                    # Memory-mapped: Arrow IPC needs no decode step
+                    cached_data = feather.read_feather(cache_path, memory_map=True)
+                else:
+                    # Memory-mapped read; Arrow buffers are released
+                    # as columns are converted
+                    table = pq.read_table(cache_path, memory_map=True)
+                    cached_data = table.to_pandas(split_blocks=True, self_destruct=True)
+                    del table
+                logger.debug(f"Loaded cached data from {os.path.basename(cache_path)} "
+                            f"({distance:.2f} km away)")
+                return self._apply_precision(cached_data)
                 
-                if cache_path.exists():
-                    try:
-                        # Check if cache is expired
-                        cache_age = datetime.now() - datetime.fromtimestamp(cache_path.stat().st_mtime)
-                        if cache_age.days > config.cache_expiry_days:
-                            logger.debug(f"Cache expired for {cache_path.name}")
-                            cache_path.unlink()  # Delete expired cache
-                            continue
-                        
-                        # Load cached data
-                        if ext == '.parquet':
-                            cached_data = pd.read_parquet(cache_path)
-                        else:
-                            cached_data = pd.read_pickle(cache_path)
-                        logger.debug(f"Loaded cached data from {cache_path.name}")
-                        return cached_data
-                        
-                    except Exception as e:
-                        logger.warning(f"Failed to load cache from {cache_path}: {e}")
-                        continue
+            except FileNotFoundError:
+                # Deleted behind the index's back
+                self._cache_index.remove([cache_path])
+            except Exception as e:
+                logger.warning(f"Failed to load cache from {cache_path}: {e}")
+                continue
         
         return None
     
+    def _source_versions(self) -> Dict[str, str]:
+        """
+        Latest upstream data version per source.
+        
+        Versions recorded by other processes are picked up when the
+        manifest is reloaded, every ``config.cache_version_refresh_hours``.
+        """
+        now = time.time()
+        if (self._versions is None
+                or now - self._versions_loaded > config.cache_version_refresh_hours * 3600):
+            try:
+                versions = self._cache_index.versions()
+            except Exception as e:
+                logger.warning(f"Failed to read source versions from cache index: {e}")
+                versions = {}
+            versions['pvgis'] = _pvgis_version()
+            self._versions, self._versions_loaded = versions, now
+        return self._versions
+    
+    def _record_version(self, source: str, version: str) -> None:
+        """Record the data version returned by a source if it is new."""
+        if self._source_versions().get(source) == version:
+            return
+        try:
+            self._cache_index.set_version(source, version)
+        except Exception as e:
+            logger.warning(f"Failed to record {source} data version: {e}")
+        self._versions[source] = version
+        logger.info(f"{source} data version is now {version}")
+    
+    def _nearby_cells(self, latitude: float, longitude: float) -> Tuple[range, range]:
+        """
+        Find the cache grid cells that may hold an entry within tolerance.
+        
+        Parameters
+        ----------
+        latitude : float
+            Latitude in decimal degrees
+        longitude : float
+            Longitude in decimal degrees
+            
+        Returns
+        -------
+        tuple of (range, range)
+            Latitude and longitude cell indices, usually one or two each
+        """
+        dlat = math.degrees(config.cache_tolerance_km / EARTH_RADIUS_KM)
+        # Longitude degrees shrink towards the poles
+        dlon = min(dlat / max(math.cos(math.radians(latitude)), 1e-6), 180.0)
+        
+        lat_cells = range(config.grid_cell(latitude - dlat), config.grid_cell(latitude + dlat) + 1)
+        lon_cells = range(config.grid_cell(longitude - dlon), config.grid_cell(longitude + dlon) + 1)
+        return lat_cells, lon_cells
+    
+    def _remove_cache_files(self, paths: List[str]) -> int:
+        """Delete cache files and their index entries, returning the number deleted."""
+        removed_count = 0
+        for path in paths:
+            try:
+                os.unlink(path)
+                removed_count += 1
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Failed to remove cache file {path}: {e}")
+        self._cache_index.remove(paths)
+        return removed_count
+    
     def _save_to_cache(self, 
                       data: pd.DataFrame, 
                       latitude: float, 
@@ -402,18 +1111,53 @@ class WeatherDataConnector:
         if not self.enable_cache:
             return
         
+        self._remember((_coord_key(latitude), _coord_key(longitude), year), data)
+        
+        if self._cache_store is not None:
+            try:
+                self._cache_store.put(data, source, config.grid_cell(latitude),
+                                      config.grid_cell(longitude), year)
+                logger.debug(f"Saved weather data to SQLite cache: {source}")
+            except Exception as e:
+                logger.warning(f"Failed to save weather data to cache: {e}")
+            return
+        
         try:
             cache_path = config.get_cache_path(latitude, longitude, source, year)
             cache_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Try parquet first, fall back to pickle if pyarrow not available
+            # Record the exact location so nearby requests can reuse it, and
+            # the data version so newer releases invalidate it
+            version = data.attrs.get('source_version')
+            table = pa.Table.from_pandas(data)
+            metadata = {**(table.schema.metadata or {}),
+                        CACHE_LOCATION_KEY: json.dumps({'latitude': latitude, 'longitude': longitude})}
+            if version:
+                metadata[CACHE_VERSION_KEY] = version
+            table = table.replace_schema_metadata(metadata)
+            
+            # Write to a temporary file and rename it into place, so readers
+            # never see a partially written cache file
+            tmp_path = f"{cache_path}.tmp-{os.getpid()}-{threading.get_ident()}"
             try:
-                data.to_parquet(cache_path, compression='snappy')
-            except ImportError:
-                # Fall back to pickle if pyarrow not available
-                cache_path = cache_path.with_suffix('.pkl')
-                data.to_pickle(cache_path)
+                if config.cache_format == 'feather':
+                    feather.write_feather(table, tmp_path, compression=config.feather_compression)
+                else:
+                    pq.write_table(table, tmp_path, **config.parquet_write_kwargs())
+                os.replace(tmp_path, cache_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
             
+            try:
+                self._cache_index.put(os.fspath(cache_path), source, config.grid_cell(latitude),
+                                      config.grid_cell(longitude), year, latitude, longitude,
+                                      version)
+            except Exception:
+                # Lookups go through the index, so an unindexed file would
+                # never be served
+                os.unlink(cache_path)
+                raise
             logger.debug(f"Saved weather data to cache: {cache_path.name}")
             
         except Exception as e:
@@ -434,36 +1178,38 @@ class WeatherDataConnector:
         int
             Number of cache files removed
         """
+        with self._memory_lock:
+            self._memory_cache.clear()
+        
         if not config.cache_dir.exists():
             return 0
         
-        removed_count = 0
-        cutoff_time = None
+        removed_count = self._remove_cache_files(self._cache_index.paths(older_than_days))
         
+        stray_files = self._stray_cache_files()
         if older_than_days is not None:
-            cutoff_time = datetime.now() - timedelta(days=older_than_days)
+            cutoff = time.time() - older_than_days * 86400
+            stray_files = [entry for entry in stray_files if entry.stat().st_mtime < cutoff]
+        removed_count += self._remove_cache_files([entry.path for entry in stray_files])
         
-        # Clear both parquet and pickle cache files
-        for pattern in ["*.parquet", "*.pkl"]:
-            for cache_file in config.cache_dir.glob(pattern):
-                try:
-                    if cutoff_time is None:
-                        # Remove all files
-                        cache_file.unlink()
-                        removed_count += 1
-                    else:
-                        # Check file age
-                        file_time = datetime.fromtimestamp(cache_file.stat().st_mtime)
-                        if file_time < cutoff_time:
-                            cache_file.unlink()
-                            removed_count += 1
-                            
-                except Exception as e:
-                    logger.warning(f"Failed to remove cache file {cache_file}: {e}")
+        if self._cache_store is not None:
+            try:
+                removed_count += self._cache_store.clear(older_than_days)
+            except Exception as e:
+                logger.warning(f"Failed to clear SQLite cache: {e}")
         
         logger.info(f"Cleared {removed_count} cache files")
         return removed_count
     
+    def _stray_cache_files(self) -> List[os.DirEntry]:
+        """List cache files the index doesn't know about (e.g. written by older versions)."""
+        indexed = set(self._cache_index.paths())
+        with os.scandir(config.cache_dir) as entries:
+            return [entry for entry in entries
+                    if entry.name.endswith(CACHE_EXTENSIONS)
+                    and entry.is_file(follow_symlinks=False)
+                    and entry.path not in indexed]
+    
     def get_cache_info(self) -> Dict[str, Any]:
         """
         Get information about the weather data cache.
@@ -476,21 +1222,33 @@ class WeatherDataConnector:
         if not config.cache_dir.exists():
             return {'cache_enabled': False, 'cache_dir': str(config.cache_dir)}
         
-        cache_files = list(config.cache_dir.glob("*.parquet")) + list(config.cache_dir.glob("*.pkl"))
-        total_size = sum(f.stat().st_size for f in cache_files)
-        
-        # Analyze cache files by source
+        # Indexed files by source, plus any files the index doesn't know about
         sources = {}
-        for cache_file in cache_files:
-            source = cache_file.name.split('_')[0]
-            if source not in sources:
-                sources[source] = 0
-            sources[source] += 1
+        total_files = 0
+        total_size = 0
+        for source, (count, size) in self._cache_index.stats_by_source().items():
+            sources[source] = count
+            total_files += count
+            total_size += size
+        
+        for entry in self._stray_cache_files():
+            source = entry.name.split('_', 1)[0]
+            sources[source] = sources.get(source, 0) + 1
+            total_files += 1
+            total_size += entry.stat().st_size
+        
+        # SQLite entries count as one cached file each
+        if self._cache_store is not None:
+            for source, count in self._cache_store.count_by_source().items():
+                sources[source] = sources.get(source, 0) + count
+                total_files += count
+            if os.path.exists(self._cache_store.db_path):
+                total_size += os.path.getsize(self._cache_store.db_path)
         
         info = {
             'cache_enabled': self.enable_cache,
             'cache_dir': str(config.cache_dir),
-            'total_files': len(cache_files),
+            'total_files': total_files,
             'total_size_mb': total_size / (1024 * 1024),
             'files_by_source': sources,
             'cache_expiry_days': config.cache_expiry_days
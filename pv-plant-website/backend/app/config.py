@@ -6,8 +6,9 @@ for type validation and environment variable loading.
 """
 
 import os
-from typing import List, Optional
-from pydantic import Field, validator
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from pydantic import Field, PrivateAttr, model_validator, validator
 from pydantic_settings import BaseSettings
 from pathlib import Path
 
@@ -29,6 +30,8 @@ class Settings(BaseSettings):
     # Database settings
     DATABASE_URL: str = Field(default="sqlite:///./pv_plant_db.sqlite", env="DATABASE_URL")
     DATABASE_ECHO: bool = Field(default=False, env="DATABASE_ECHO")
+    # PgBouncer in transaction mode cannot keep asyncpg prepared statements
+    DB_BEHIND_PGBOUNCER: bool = Field(default=False, env="DB_BEHIND_PGBOUNCER")
     
     # CORS settings
     CORS_ORIGINS: str = Field(
@@ -73,6 +76,9 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
     ALGORITHM: str = Field(default="HS256", env="ALGORITHM")
     
+    # CORS origins split once after validation
+    _cors_origins: Tuple[str, ...] = PrivateAttr(default=())
+    
     @validator("CORS_ORIGINS", pre=True)
     def parse_cors_origins(cls, v):
         """Parse CORS origins from string."""
@@ -82,10 +88,16 @@ class Settings(BaseSettings):
             return ",".join(v)
         return v
     
+    @model_validator(mode="after")
+    def split_cors_origins(self):
+        """Split CORS origins once so property access doesn't re-parse."""
+        self._cors_origins = tuple(origin.strip() for origin in self.CORS_ORIGINS.split(","))
+        return self
+    
     @property
     def cors_origins_list(self) -> List[str]:
         """Get CORS origins as a list."""
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+        return list(self._cors_origins)
     
     @validator("LOG_LEVEL")
     def validate_log_level(cls, v):
@@ -110,8 +122,14 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the settings instance, parsing the environment on first call."""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
 
 def get_database_url() -> str:
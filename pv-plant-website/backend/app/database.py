@@ -30,12 +30,25 @@ elif settings.DATABASE_URL.startswith("postgresql"):
 else:
     ASYNC_DATABASE_URL = settings.DATABASE_URL
 
+# asyncpg connection arguments: prepared statement caches are disabled
+# behind PgBouncer, where statements do not survive across pooled
+# server connections, and JIT is off to keep planning cost predictable
+ASYNC_CONNECT_ARGS = {}
+if ASYNC_DATABASE_URL.startswith("postgresql+asyncpg"):
+    statement_cache_size = 0 if settings.DB_BEHIND_PGBOUNCER else 500
+    ASYNC_CONNECT_ARGS = {
+        "statement_cache_size": statement_cache_size,
+        "prepared_statement_cache_size": statement_cache_size,
+        "server_settings": {"jit": "off", "application_name": "pvlib-api"},
+    }
+
 # Create async engine
 async_engine = create_async_engine(
     ASYNC_DATABASE_URL,
     echo=settings.DATABASE_ECHO,
     pool_pre_ping=True,
     pool_recycle=3600,
+    connect_args=ASYNC_CONNECT_ARGS,
 )
 
 # Create async session factory